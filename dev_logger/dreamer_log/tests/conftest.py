@@ -0,0 +1,11 @@
+"""
+Shared setup for the dreamer_log tests: makes treeview_app importable.
+
+The app is a single script next to this folder, so its directory is put on
+sys.path; only its pure-logic classes are tested (no display is needed).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,83 @@
+"""
+Tests for the review schedule, link index and task rollup of the dreamer tree.
+"""
+
+import datetime
+
+from treeview_app import LinkIndex, ReviewSchedule, TaskRollup, checkpoint
+
+def _tree():
+    """Two dreams, two metas linked to dream 1 and objetivos linked to the metas."""
+    return {"spots": [
+        {"name": "sonhos", "children": [
+            {"name": "Dream 1", "start_date": "2025-01-01", "end_date": "2025-04-01",
+             "supervision_frequency": "Monthly"},
+            {"name": "Dream 2", "start_date": "2025-01-01", "end_date": "",
+             "supervision_frequency": "Quarterly"},
+        ]},
+        {"name": "metas", "children": [
+            {"name": "Meta 1", "dream_id": 1},
+            {"name": "Meta 2", "dream_id": 1},
+        ]},
+        {"name": "objetivos", "children": [
+            {"name": "Week 1", "metas_id": 1, "start_date": "2025-06-10", "end_date": "2025-06-17",
+             "children": [{"name": "task a"}, {"name": "task b"}]},
+            {"name": "Week 2", "metas_id": 2, "children": [{"name": "task c"}]},
+        ]},
+    ]}
+
+def test_checkpoint_clamps_month_ends():
+    """Monthly checkpoints are counted from the start, so a 31st doesn't drift."""
+    start = datetime.date(2025, 1, 31)
+    assert checkpoint(start, "monthly", 1) == datetime.date(2025, 2, 28)
+    assert checkpoint(start, "monthly", 2) == datetime.date(2025, 3, 31)
+    assert checkpoint(start, "weekly", 2) == datetime.date(2025, 2, 14)
+    assert checkpoint(start, "", 1) is None
+
+def test_review_schedule_stops_at_the_end_date():
+    """Finished nodes are never due again; nodes without an end date keep their cadence."""
+    schedule = ReviewSchedule(_tree(), as_of=datetime.date(2025, 1, 1))
+
+    assert schedule.checkpoints(("sonhos", 1), datetime.date(2030, 1, 1)) == [
+        datetime.date(2025, 2, 1), datetime.date(2025, 3, 1), datetime.date(2025, 4, 1)]
+    assert schedule.due_this_week(datetime.date(2025, 6, 18)) == [(datetime.date(2025, 6, 17), ("objetivos", 1))]
+    assert schedule.due_this_week(datetime.date(2026, 10, 19)) == []
+    assert schedule.due_between(datetime.date(2030, 1, 1), datetime.date(2030, 1, 31)) == [
+        (datetime.date(2030, 1, 1), ("sonhos", 2))]
+
+def test_review_schedule_set_node_reindexes():
+    """Editing a node's dates moves it in the due-date index."""
+    schedule = ReviewSchedule(_tree(), as_of=datetime.date(2025, 1, 1))
+    schedule.set_node(("objetivos", 2), {"start_date": "2025-06-10", "end_date": "2025-06-17"})
+
+    due = schedule.due_between(datetime.date(2025, 6, 16), datetime.date(2025, 6, 22))
+    assert [key for _, key in due] == [("objetivos", 1), ("objetivos", 2)]
+    # Going back in time rebuilds the index
+    assert schedule.due_between(datetime.date(2025, 2, 1), datetime.date(2025, 2, 1)) == [
+        (datetime.date(2025, 2, 1), ("sonhos", 1))]
+
+def test_link_index_walks_links_both_ways():
+    """Links resolve upwards, and descendants are found through the reverse links."""
+    links = LinkIndex(_tree())
+
+    assert links.parent_of(("objetivos", 1)) == ("metas", 1)
+    assert list(links.ancestors(("objetivos", 2))) == [("metas", 2), ("sonhos", 1)]
+    assert links.descendants(("sonhos", 1), spot="objetivos") == [("objetivos", 1), ("objetivos", 2)]
+    assert links.children_of(("sonhos", 2)) == []
+
+    links.set_node(("metas", 2), {"dream_id": 2})
+    assert links.children_of(("sonhos", 2)) == [("metas", 2)]
+    assert links.descendants(("sonhos", 1)) == [("metas", 1), ("objetivos", 1)]
+
+def test_task_rollup_updates_along_the_chain():
+    """Task counts roll up to metas, dreams and spot rows and follow relinks."""
+    tree = _tree()
+    rollup = TaskRollup(tree, LinkIndex(tree))
+    assert [rollup.total(key) for key in (("metas", 1), ("sonhos", 1), ("spot", "objetivos"))] == [2, 3, 3]
+
+    changed = rollup.set_node(("metas", 2), {"dream_id": 2})
+    assert (rollup.total(("sonhos", 1)), rollup.total(("sonhos", 2))) == (2, 1)
+    assert {("sonhos", 1), ("sonhos", 2)} <= changed
+
+    rollup.set_node(("objetivos", 1), {"metas_id": 1, "children": [{"name": "task a"}]})
+    assert (rollup.total(("metas", 1)), rollup.total(("sonhos", 1)), rollup.total(("spot", "objetivos"))) == (1, 1, 2)
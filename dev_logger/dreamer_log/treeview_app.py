@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import bisect
+import calendar
 import json
 import os
 
@@ -9,6 +11,156 @@ try:
 except ImportError:
     DateEntry = None
 
+# Supervision frequency -> (days, months) between review checkpoints
+FREQUENCY_STEPS = {
+    "weekly": (7, 0),
+    "biweekly": (14, 0),
+    "monthly": (0, 1),
+    "bi-monthly": (0, 2),
+    "quarterly": (0, 3),
+    "semi-annual": (0, 6),
+    "yearly": (0, 12),
+}
+# Objetivos are weekly goals and don't store a frequency
+DEFAULT_FREQUENCY = {"objetivos": "weekly"}
+
+def add_months(date, months):
+    """Add calendar months, clamping to the last day of a shorter month"""
+    month_index = date.month - 1 + months
+    year, month = date.year + month_index // 12, month_index % 12 + 1
+    return date.replace(year=year, month=month, day=min(date.day, calendar.monthrange(year, month)[1]))
+
+def checkpoint(start_date, frequency, n):
+    """Return the n-th review checkpoint after start_date (n=1 is the first), or None"""
+    step = FREQUENCY_STEPS.get((frequency or "").lower())
+    if step is None:
+        return None
+    days, months = step
+    # Always counted from the start so month-end clamping doesn't drift
+    if months:
+        return add_months(start_date, months * n)
+    return start_date + datetime.timedelta(days=days * n)
+
+def iter_checkpoints(start_date, frequency, end_date=None):
+    """Lazily yield every review checkpoint after start_date, up to end_date (inclusive) if given"""
+    n = 1
+    while True:
+        date = checkpoint(start_date, frequency, n)
+        if date is None or (end_date is not None and date > end_date):
+            return
+        yield date
+        n += 1
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD string, returning None when it is empty or invalid"""
+    try:
+        return datetime.datetime.strptime(value or "", "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+class ReviewSchedule:
+    """
+    Review checkpoints of every sonhos/metas/objetivos node.
+
+    Checkpoints are generated lazily per node and cached, and stop at the
+    node's end date, so a finished node is never due again; a node without
+    an end date is reviewed indefinitely. A due-date index,
+    sorted by each node's next checkpoint on or after ``as_of``, answers
+    "what is due between two dates" with a bisect; moving the window forward
+    only advances the nodes whose checkpoint has passed.
+    """
+
+    def __init__(self, tree_data=None, as_of=None):
+        self.as_of = as_of or datetime.date.today()
+        self.nodes = {}       # key -> (start date, frequency, end date or None)
+        self._cache = {}      # key -> (generator, checkpoints generated so far)
+        self._next = {}       # key -> ordinal of the next checkpoint >= as_of
+        self._index = []      # sorted (ordinal, key)
+        for spot in (tree_data or {}).get("spots", []):
+            for index, child in enumerate(spot.get("children", []), start=1):
+                self._track((spot["name"], index), child)
+        self._reindex()
+
+    def _track(self, key, node):
+        """Record a node's start date and frequency (nodes without both are not scheduled)"""
+        self.nodes.pop(key, None)
+        self._cache.pop(key, None)
+        frequency = node.get("supervision_frequency") or DEFAULT_FREQUENCY.get(key[0], "")
+        if (frequency or "").lower() not in FREQUENCY_STEPS:
+            return
+        start_date = parse_date(node.get("start_date"))
+        if start_date is None:
+            return
+        self.nodes[key] = (start_date, frequency, parse_date(node.get("end_date")))
+
+    def _index_entry(self, key):
+        due = self.next_checkpoint(key, self.as_of)
+        if due is None:
+            self._next.pop(key, None)
+            return None
+        self._next[key] = due.toordinal()
+        return (self._next[key], key)
+
+    def _reindex(self):
+        self._next = {}
+        self._index = sorted(entry for entry in map(self._index_entry, self.nodes) if entry)
+
+    def set_node(self, key, node):
+        """Add or update a node after an add/edit"""
+        if key in self._next:
+            self._index.remove((self._next.pop(key), key))
+        self._track(key, node)
+        entry = self._index_entry(key) if key in self.nodes else None
+        if entry:
+            bisect.insort(self._index, entry)
+
+    def checkpoints(self, key, until):
+        """Return the node's checkpoints up to ``until`` (inclusive), generating more if needed"""
+        if key not in self.nodes:
+            return []
+        if key not in self._cache:
+            self._cache[key] = (iter_checkpoints(*self.nodes[key]), [])
+        generator, dates = self._cache[key]
+        while not dates or dates[-1] <= until:
+            date = next(generator, None)
+            if date is None:
+                break
+            dates.append(date)
+        return dates[:bisect.bisect_right(dates, until)]
+
+    def next_checkpoint(self, key, on_or_after):
+        """Return the first checkpoint of a node on or after a date"""
+        if key not in self.nodes:
+            return None
+        self.checkpoints(key, on_or_after)
+        dates = self._cache[key][1]
+        position = bisect.bisect_left(dates, on_or_after)
+        return dates[position] if position < len(dates) else None
+
+    def _advance(self, as_of):
+        """Move the index to ``as_of``; going forward only touches nodes whose checkpoint passed"""
+        if as_of < self.as_of:
+            self.as_of = as_of
+            self._reindex()
+            return
+        self.as_of = as_of
+        stale = bisect.bisect_left(self._index, (as_of.toordinal(),))
+        refreshed = [entry for entry in (self._index_entry(key) for _, key in self._index[:stale]) if entry]
+        del self._index[:stale]
+        self._index = sorted(refreshed + self._index)
+
+    def due_between(self, start, end):
+        """Return (date, key) for every node with a checkpoint between two dates, soonest first"""
+        self._advance(start)
+        stop = bisect.bisect_left(self._index, (end.toordinal() + 1,))
+        return [(datetime.date.fromordinal(ordinal), key) for ordinal, key in self._index[:stop]]
+
+    def due_this_week(self, today=None):
+        """Nodes due for review in the current Monday-Sunday week"""
+        today = today or datetime.date.today()
+        monday = today - datetime.timedelta(days=today.weekday())
+        return self.due_between(monday, monday + datetime.timedelta(days=6))
+
 class MetasChildDialog(tk.Toplevel):
     def __init__(self, parent, sonhos_children, initial=None):
         super().__init__(parent)
@@ -106,36 +258,8 @@ class MetasChildDialog(tk.Toplevel):
         start_date_str = self.start_date_var.get().strip()
         freq = self.freq_var.get()
         try:
-            start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d")
-            if freq == "biweekly":
-                days = 14
-                end_date = start_date + datetime.timedelta(days=days)
-            elif freq == "monthly":
-                # Add 1 month
-                month = start_date.month + 1
-                year = start_date.year + (month - 1) // 12
-                month = (month - 1) % 12 + 1
-                day = start_date.day
-                try:
-                    end_date = datetime.date(year, month, day)
-                except ValueError:
-                    import calendar
-                    last_day = calendar.monthrange(year, month)[1]
-                    end_date = datetime.date(year, month, last_day)
-            elif freq == "bi-monthly":
-                # Add 2 months
-                month = start_date.month + 2
-                year = start_date.year + (month - 1) // 12
-                month = (month - 1) % 12 + 1
-                day = start_date.day
-                try:
-                    end_date = datetime.date(year, month, day)
-                except ValueError:
-                    import calendar
-                    last_day = calendar.monthrange(year, month)[1]
-                    end_date = datetime.date(year, month, last_day)
-            else:
-                end_date = None
+            start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d").date()
+            end_date = checkpoint(start_date, freq, 1)
             if end_date:
                 self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
             else:
@@ -274,7 +398,7 @@ class ObjetivosChildDialog(tk.Toplevel):
             start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d")
             week_number = start_date.isocalendar()[1]
             self.week_label_var.set(str(week_number))
-            end_date = start_date + datetime.timedelta(days=7)
+            end_date = checkpoint(start_date.date(), "weekly", 1)
             self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
         except Exception:
             self.week_label_var.set("")
@@ -381,27 +505,8 @@ class SonhosChildDialog(tk.Toplevel):
         start_date_str = self.start_date_var.get().strip()
         freq = self.freq_var.get()
         try:
-            start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d")
-            if freq == "Yearly":
-                months = 12
-            elif freq == "Semi-annual":
-                months = 6
-            elif freq == "Quarterly":
-                months = 3
-            else:
-                months = 0
-            # Calculate end date
-            year = start_date.year + (start_date.month + months - 1) // 12
-            month = (start_date.month + months - 1) % 12 + 1
-            day = start_date.day
-            # Handle month-end overflow
-            try:
-                end_date = datetime.date(year, month, day)
-            except ValueError:
-                # If day is out of range for month, use last day of month
-                import calendar
-                last_day = calendar.monthrange(year, month)[1]
-                end_date = datetime.date(year, month, last_day)
+            start_date = datetime.datetime.strptime(start_date_str, "%Y-%m-%d").date()
+            end_date = checkpoint(start_date, freq, 1)
             self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
         except Exception:
             self.end_date_var.set("")
@@ -436,17 +541,344 @@ class SonhosChildDialog(tk.Toplevel):
         self.destroy()
 
 class TreeItem:
-    def __init__(self, name):
+    def __init__(self, name, iid=None):
         self.name = name
+        self.iid = iid          # id in TreeviewApp.data_model (and in the classic Treeview)
+        self.parent = None
         self.children = []
+        self.values = ("", "")  # (periodo, n_tarefas) shown by the views
+        self.open = False       # expanded in the virtual view
         
     def add_child(self, child):
         self.children.append(child)
+        child.parent = self
         return child
     
     def remove_child(self, child):
         if child in self.children:
             self.children.remove(child)
+            child.parent = None
+
+    def index(self):
+        """Position among the parent's children (0 for a root)"""
+        return self.parent.children.index(self) if self.parent else 0
+
+class LinkIndex:
+    """
+    Forward and reverse adjacency of the dream_id/metas_id links.
+
+    Nodes are keyed by (spot name, 1-based position), the same ids stored in
+    dream_id/metas_id. ``parent_of`` follows a link up, ``children_of`` and
+    ``descendants`` walk the reverse links down, so "all objetivos under this
+    dream" costs O(result) instead of a scan of every spot.
+    """
+    LINK_FIELDS = {"metas": "dream_id", "objetivos": "metas_id"}
+    PARENT_SPOT = {"metas": "sonhos", "objetivos": "metas"}
+
+    def __init__(self, tree_data=None):
+        self.parent = {}
+        self.children = {}  # parent key -> {child key: None}, kept in insertion order
+        for spot in (tree_data or {}).get("spots", []):
+            for index, child in enumerate(spot.get("children", []), start=1):
+                self.set_node((spot["name"], index), child)
+
+    @classmethod
+    def link_of(cls, key, node):
+        """Return the parent key a node links to, or None"""
+        link_field = cls.LINK_FIELDS.get(key[0])
+        link = node.get(link_field) if link_field else None
+        return (cls.PARENT_SPOT[key[0]], link) if link else None
+
+    def set_node(self, key, node):
+        """Record an added or edited node; returns its (old parent, new parent)"""
+        old_parent = self.parent.get(key)
+        new_parent = self.link_of(key, node)
+        if old_parent != new_parent:
+            if old_parent is not None:
+                self.children.get(old_parent, {}).pop(key, None)
+            if new_parent is not None:
+                self.children.setdefault(new_parent, {})[key] = None
+        self.parent[key] = new_parent
+        return old_parent, new_parent
+
+    def parent_of(self, key):
+        return self.parent.get(key)
+
+    def children_of(self, key):
+        return list(self.children.get(key, ()))
+
+    def ancestors(self, key):
+        """Yield the linked ancestors of a node, nearest first"""
+        key = self.parent.get(key)
+        while key is not None:
+            yield key
+            key = self.parent.get(key)
+
+    def descendants(self, key, spot=None):
+        """Return every node linked below ``key`` (only those of ``spot`` if given)"""
+        found = []
+        stack = list(reversed(self.children_of(key)))
+        while stack:
+            child = stack.pop()
+            if spot is None or child[0] == spot:
+                found.append(child)
+            stack.extend(reversed(self.children_of(child)))
+        return found
+
+class TaskRollup:
+    """
+    Bottom-up task counts for the sonhos -> metas -> objetivos hierarchy.
+
+    An objetivo counts its own tasks (its children), a meta adds up the
+    objetivos linked to it and a dream the metas linked to it; a spot row,
+    keyed by ("spot", name), sums its children. Totals are computed once at
+    load and then adjusted along the ancestor chain of the node that changed.
+    """
+
+    def __init__(self, tree_data, links):
+        self.links = links
+        self.own = {}
+        self.totals = {}
+        nodes = {}
+        for spot in tree_data.get("spots", []):
+            self.totals[("spot", spot["name"])] = 0
+            for index, child in enumerate(spot.get("children", []), start=1):
+                key = (spot["name"], index)
+                nodes[key] = child
+                self.own[key] = self._own_count(key, child)
+                self.totals[key] = self.own[key]
+        # Children before parents, so each total is final before it is propagated
+        for level in ("objetivos", "metas", "sonhos"):
+            for key in [k for k in nodes if k[0] == level]:
+                self._bump(("spot", level), self.totals[key])
+                parent = self.links.parent_of(key)
+                if parent is not None:
+                    self._bump(parent, self.totals[key])
+
+    def _own_count(self, key, node):
+        return len(node.get("children", [])) if key[0] == "objetivos" else 0
+
+    def _bump(self, key, delta):
+        self.totals[key] = self.totals.get(key, 0) + delta
+
+    def _add_along_chain(self, key, delta, changed):
+        """Add ``delta`` to ``key``, its ancestors and the spot rows they belong to."""
+        for node in [key, *self.links.ancestors(key)]:
+            self._bump(node, delta)
+            self._bump(("spot", node[0]), delta)
+            changed.update((node, ("spot", node[0])))
+
+    def set_node(self, key, node):
+        """
+        Record an added or edited node (in the link index too) and return the
+        keys whose totals changed.
+
+        A new link moves the node's whole subtotal from the old ancestor chain
+        to the new one; a different task count is added along the chain.
+        """
+        changed = set()
+        is_new = key not in self.own
+        old_parent, new_parent = self.links.set_node(key, node)
+        if is_new:
+            self.own[key] = 0
+            self.totals.setdefault(key, 0)
+            changed.add(key)
+        elif old_parent != new_parent:
+            subtotal = self.totals.get(key, 0)
+            if old_parent is not None:
+                self._add_along_chain(old_parent, -subtotal, changed)
+            if new_parent is not None:
+                self._add_along_chain(new_parent, subtotal, changed)
+        delta = self._own_count(key, node) - self.own[key]
+        if delta:
+            self.own[key] += delta
+            self._add_along_chain(key, delta, changed)
+        return changed
+
+    def total(self, key):
+        return self.totals.get(key, 0)
+
+class VirtualTreeView(ttk.Frame):
+    """
+    Windowed view over the TreeItem model for trees with thousands of nodes.
+
+    ``rows`` is the flattened list of (depth, TreeItem) pairs that are
+    currently visible. Only the rows on screen plus ``MARGIN`` on each side
+    are inserted into the Treeview; they are re-rendered from ``rows`` when
+    scrolling gets close to the edge of that window. Open/closed state lives
+    on the model, so expand/collapse all is a flag walk and one render.
+    Typing in the filter box keeps the nodes whose name matches, with their
+    ancestors.
+    """
+    MARGIN = 30
+    FILTER_DELAY_MS = 150
+
+    def __init__(self, parent, columns, roots=None, on_context_menu=None):
+        super().__init__(parent)
+        self.roots = roots if roots is not None else []
+        self.on_context_menu = on_context_menu
+        self.rows = []
+        self.top = 0          # index in rows of the first row on screen
+        self.window = (0, 0)  # rows[start:end] currently inserted in the Treeview
+        self.matches = None   # TreeItems kept by the filter, None when not filtering
+        self._filter_job = None
+        self._render_job = None
+
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(fill='x', pady=(0, 5))
+        ttk.Label(filter_frame, text="Filter:").pack(side='left')
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", self._schedule_filter)
+        ttk.Entry(filter_frame, textvariable=self.filter_var).pack(side='left', fill='x', expand=True, padx=5)
+
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree = ttk.Treeview(self, columns=columns, selectmode='browse', yscrollcommand=self._on_tree_scroll)
+        self.tree.pack(expand=True, fill='both')
+
+        self.tree.bind("<Configure>", lambda event: self.render())
+        self.tree.bind("<Double-1>", self.toggle_selected)
+        self.tree.bind("<Return>", self.toggle_selected)
+        self.tree.bind("<Button-3>", self._on_right_click)
+
+    def visible_count(self):
+        """Number of rows that fit on screen"""
+        rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, self.tree.winfo_height() // rowheight)
+
+    def selected_item(self):
+        selection = self.tree.selection()
+        return self.rows[int(selection[0])][1] if selection else None
+
+    def _kept(self, item):
+        return self.matches is None or item in self.matches
+
+    def refresh(self, selected=None):
+        """Re-flatten the model after edits, expand/collapse or a new filter, then render"""
+        selected = selected or self.selected_item()
+        rows = []
+        stack = [(0, item) for item in reversed(self.roots) if self._kept(item)]
+        while stack:
+            depth, item = stack.pop()
+            rows.append((depth, item))
+            if item.open or self.matches is not None:
+                stack.extend((depth + 1, child) for child in reversed(item.children) if self._kept(child))
+        self.rows = rows
+        self.render(selected)
+
+    def render(self, selected=None):
+        """Insert the rows around ``top`` into the Treeview and scroll it to ``top``"""
+        if self._render_job:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+        selected = selected or self.selected_item()
+        count = self.visible_count()
+        self.top = max(0, min(self.top, len(self.rows) - count))
+        start = max(0, self.top - self.MARGIN)
+        end = min(len(self.rows), self.top + count + self.MARGIN)
+        self.tree.delete(*self.tree.get_children())
+        for index in range(start, end):
+            depth, item = self.rows[index]
+            if item.children:
+                marker = "▾ " if item.open or self.matches is not None else "▸ "
+            else:
+                marker = "  "
+            self.tree.insert("", "end", iid=str(index), text="    " * depth + marker + item.name, values=item.values)
+            if item is selected:
+                self.tree.selection_set(str(index))
+                self.tree.focus(str(index))
+        self.window = (start, end)
+        self.tree.yview_moveto((self.top - start) / max(1, end - start))
+        self._update_scrollbar()
+
+    def _needs_render(self, top):
+        """True when ``top`` is too close to an edge of the inserted window"""
+        start, end = self.window
+        slack = self.MARGIN // 2
+        return ((start > 0 and top - start < slack)
+                or (end < len(self.rows) and end - (top + self.visible_count()) < slack))
+
+    def _update_scrollbar(self):
+        total = max(1, len(self.rows))
+        self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible_count()) / total))
+
+    def scroll_to(self, top):
+        """Show ``rows[top]`` first, re-rendering only when it leaves the inserted window"""
+        self.top = max(0, min(top, len(self.rows) - self.visible_count()))
+        if self._needs_render(self.top):
+            self.render()
+        else:
+            start, end = self.window
+            self.tree.yview_moveto((self.top - start) / max(1, end - start))
+            self._update_scrollbar()
+
+    def yview(self, *args):
+        """Scrollbar command, in rows of the whole flattened tree"""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible_count() if args[2] == "pages" else 1)
+            self.scroll_to(self.top + step)
+
+    def _on_tree_scroll(self, first, last):
+        """Follow the Treeview's own scrolling (mouse wheel, arrow keys) inside the window"""
+        start, end = self.window
+        self.top = start + round(float(first) * (end - start))
+        self._update_scrollbar()
+        if self._needs_render(self.top) and not self._render_job:
+            self._render_job = self.after_idle(self.render)
+
+    def toggle_selected(self, event=None):
+        """Expand or collapse the selected row"""
+        item = self.selected_item()
+        if item is None or not item.children or self.matches is not None:
+            return "break"
+        item.open = not item.open
+        self.refresh(item)
+        return "break"
+
+    def set_open_all(self, is_open):
+        """Expand or collapse every node of the model"""
+        stack = list(self.roots)
+        while stack:
+            item = stack.pop()
+            item.open = is_open and bool(item.children)
+            stack.extend(item.children)
+        if not is_open:
+            self.top = 0
+        self.refresh()
+
+    def _schedule_filter(self, *args):
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(self.FILTER_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        """Keep the nodes whose name contains the filter text, plus their ancestors"""
+        self._filter_job = None
+        text = self.filter_var.get().strip().lower()
+        if not text:
+            self.matches = None
+        else:
+            self.matches = set()
+
+            def keep(item):
+                kept = [child for child in item.children if keep(child)]
+                if kept or text in item.name.lower():
+                    self.matches.add(item)
+                    return True
+                return False
+
+            for root in self.roots:
+                keep(root)
+        self.top = 0
+        self.refresh()
+
+    def _on_right_click(self, event):
+        row = self.tree.identify_row(event.y)
+        if row and self.on_context_menu:
+            self.tree.selection_set(row)
+            self.on_context_menu(self.rows[int(row)][1], event)
 
 class TreeviewApp:
     def edit_objetivos_child(self, item_id, parent_id):
@@ -454,7 +886,7 @@ class TreeviewApp:
         data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
         with open(data_path, "r", encoding="utf-8") as f:
             tree_data = json.load(f)
-        child_name = self.tree.item(item_id, 'text')
+        child_name = self.data_model[item_id].name
         # Find the child in the JSON
         values = None
         for spot in tree_data["spots"]:
@@ -477,6 +909,7 @@ class TreeviewApp:
         new_values = dialog.result
         if new_values:
             # Update JSON
+            updated_child = values
             for spot in tree_data["spots"]:
                 if spot["name"] == "objetivos":
                     for child in spot["children"]:
@@ -490,18 +923,19 @@ class TreeviewApp:
                                 "end_date": new_values.get("end_date", ""),
                                 "supervision_frequency": new_values.get("supervision_frequency", ""),
                             })
+                            updated_child = child
                             break
             with open(data_path, "w", encoding="utf-8") as f:
                 json.dump(tree_data, f, indent=2, ensure_ascii=False)
-            # Update treeview display
-            self.tree.item(item_id, text=new_values.get("name", ""))
+            # Update the model and the views
+            self.update_indexes(item_id, updated_child)
 
     def edit_metas_child(self, item_id, parent_id):
         # Load current values from JSON
         data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
         with open(data_path, "r", encoding="utf-8") as f:
             tree_data = json.load(f)
-        child_name = self.tree.item(item_id, 'text')
+        child_name = self.data_model[item_id].name
         # Find the child in the JSON
         values = None
         for spot in tree_data["spots"]:
@@ -524,6 +958,7 @@ class TreeviewApp:
         new_values = dialog.result
         if new_values:
             # Update JSON
+            updated_child = values
             for spot in tree_data["spots"]:
                 if spot["name"] == "metas":
                     for child in spot["children"]:
@@ -532,18 +967,19 @@ class TreeviewApp:
                                 "name": new_values.get("name", ""),
                                 "dream_id": new_values.get("dream_id", None),
                             })
+                            updated_child = child
                             break
             with open(data_path, "w", encoding="utf-8") as f:
                 json.dump(tree_data, f, indent=2, ensure_ascii=False)
-            # Update treeview display
-            self.tree.item(item_id, text=new_values.get("name", ""))
+            # Update the model and the views
+            self.update_indexes(item_id, updated_child)
 
     def edit_sonhos_child(self, item_id, parent_id):
         # Load current values from JSON
         data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
         with open(data_path, "r", encoding="utf-8") as f:
             tree_data = json.load(f)
-        child_name = self.tree.item(item_id, 'text')
+        child_name = self.data_model[item_id].name
         # Find the child in the JSON
         values = None
         for spot in tree_data["spots"]:
@@ -575,6 +1011,7 @@ class TreeviewApp:
         new_values = dialog.result
         if new_values:
             # Update JSON
+            updated_child = values
             for spot in tree_data["spots"]:
                 if spot["name"] == "sonhos":
                     for child in spot["children"]:
@@ -587,17 +1024,23 @@ class TreeviewApp:
                                 "end_date": new_values.get("end_date", ""),
                                 "supervision_frequency": new_values.get("supervision_frequency", ""),
                             })
+                            updated_child = child
                             break
             with open(data_path, "w", encoding="utf-8") as f:
                 json.dump(tree_data, f, indent=2, ensure_ascii=False)
-            # Update treeview display
-            self.tree.item(item_id, text=new_values.get("name", ""))
+            # Update the model and the views
+            self.update_indexes(item_id, updated_child)
+    # Trees with more nodes than this open in the virtual view
+    VIRTUAL_VIEW_THRESHOLD = 2000
+
     def __init__(self, root):
         self.root = root
         self.root.title("Treeview Menu")
 
         # Initialize data model
-        self.data_model = {}  # Store TreeItem objects by their tree IDs
+        self.data_model = {}  # TreeItem objects by id; the classic Treeview reuses these ids
+        self._last_id = 0
+        self.classic_built = False
 
         # Create button frame
         button_frame = ttk.Frame(root)
@@ -606,75 +1049,138 @@ class TreeviewApp:
         # Add expand/collapse buttons
         ttk.Button(button_frame, text="Expand All", command=self.expand_all).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Collapse All", command=self.collapse_all).pack(side='left')
+        ttk.Button(button_frame, text="Due This Week", command=self.show_due_this_week).pack(side='left', padx=5)
+        self.virtual_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Virtual View", variable=self.virtual_mode,
+                        command=self.toggle_virtual_view).pack(side='right', padx=5)
 
-        # Create the treeview
+        # Create the treeview, and the windowed view used for large trees
         self.tree = ttk.Treeview(root, columns=("periodo", "n_tarefas"))
+        self.virtual = VirtualTreeView(root, ("periodo", "n_tarefas"),
+                                       on_context_menu=self.show_virtual_context_menu)
 
         # Configure columns
-        self.tree.heading("#0", text="Nível")  # Add label for the tree column
-        self.tree.heading("periodo", text="Período")
-        self.tree.heading("n_tarefas", text="N. Tarefas")
+        for tree in (self.tree, self.virtual.tree):
+            tree.heading("#0", text="Nível")  # Add label for the tree column
+            tree.heading("periodo", text="Período")
+            tree.heading("n_tarefas", text="N. Tarefas")
 
-        # Set column widths
-        self.tree.column("#0", width=200)  # Width for the tree column
-        self.tree.column("periodo", width=150)
-        self.tree.column("n_tarefas", width=150)
-
-        # Pack the treeview
-        self.tree.pack(expand=True, fill='both')
+            # Set column widths
+            tree.column("#0", width=200)  # Width for the tree column
+            tree.column("periodo", width=150)
+            tree.column("n_tarefas", width=150)
 
         # Bind right-click event
         self.tree.bind("<Button-3>", self.show_context_menu)
 
-        # Populate the treeview
+        # Load the model; the classic Treeview is only filled when it is shown
         self.populate_tree()
+        self.virtual.roots = self.roots
+        self.virtual_mode.set(len(self.data_model) > self.VIRTUAL_VIEW_THRESHOLD)
+        self.toggle_virtual_view()
+
+    def toggle_virtual_view(self):
+        """Swap between the full Treeview and the windowed view over the model"""
+        if self.virtual_mode.get():
+            self.tree.pack_forget()
+            self.virtual.pack(expand=True, fill='both')
+            self.virtual.refresh()
+        else:
+            self.virtual.pack_forget()
+            self.build_classic_tree()
+            self.tree.pack(expand=True, fill='both')
+
+    def build_classic_tree(self):
+        """Insert every model node into the classic Treeview, once; later edits keep it in sync"""
+        if self.classic_built:
+            return
+        stack = [("", root) for root in reversed(self.roots)]
+        while stack:
+            parent_id, item = stack.pop()
+            self.tree.insert(parent_id, "end", iid=item.iid, text=item.name, values=item.values)
+            stack.extend((item.iid, child) for child in reversed(item.children))
+        self.classic_built = True
+
+    def new_item(self, parent_id, name, values=("", "")):
+        """Add a node to the model under ``parent_id`` ("" for a root) and to the classic Treeview if built"""
+        self._last_id += 1
+        item = TreeItem(name, f"I{self._last_id}")
+        item.values = values
+        self.data_model[item.iid] = item
+        parent = self.data_model.get(parent_id)
+        if parent:
+            parent.add_child(item)
+        if self.classic_built:
+            self.tree.insert(parent_id, "end", iid=item.iid, text=name, values=values)
+        return item.iid
+
+    def sync_row(self, item_id):
+        """Show a model node's current name and values in the classic Treeview"""
+        if self.classic_built:
+            item = self.data_model[item_id]
+            self.tree.item(item_id, text=item.name, values=item.values)
+
+    def parent_id(self, item_id):
+        """Return the id of a node's parent, or "" for a spot"""
+        parent = self.data_model[item_id].parent
+        return parent.iid if parent else ""
+
+    def item_name(self, item_id):
+        return self.data_model[item_id].name if item_id else None
+
+    def refresh_view(self):
+        """Show model changes in the virtual view (the Treeview is updated in place)"""
+        if self.virtual_mode.get():
+            self.virtual.refresh()
 
     def show_context_menu(self, event):
         """Show context menu on right click"""
         item_id = self.tree.identify_row(event.y)
         if item_id:
             self.tree.selection_set(item_id)
-            menu = tk.Menu(self.root, tearoff=0)
-            node = self.data_model.get(item_id)
-            allowed_for_children = ["sonhos", "metas", "objetivos"]
-            parent_id = self.tree.parent(item_id)
-            parent_name = self.tree.item(parent_id, 'text') if parent_id else None
-            # If this is a top-level spot
-            if node and node.name in allowed_for_children:
-                menu.add_command(label="Add Child", command=lambda: self.add_child_node(item_id))
-            # If this is a child of "sonhos", offer Edit Child
-            elif parent_name == "sonhos":
-                menu.add_command(label="Edit Child", command=lambda: self.edit_sonhos_child(item_id, parent_id))
-            # If this is a child of "metas", offer Edit Child for metas
-            elif parent_name == "metas":
-                menu.add_command(label="Edit Child", command=lambda: self.edit_metas_child(item_id, parent_id))
-            # If this is a child of "objetivos", offer Edit Child for objetivos
-            elif parent_name == "objetivos":
-                menu.add_command(label="Edit Child", command=lambda: self.edit_objetivos_child(item_id, parent_id))
-            else:
-                menu.add_command(label="Edit Name", command=lambda: self.edit_node_name(item_id))
-            menu.post(event.x_root, event.y_root)
+            self.post_context_menu(item_id, event.x_root, event.y_root)
+
+    def show_virtual_context_menu(self, item, event):
+        """Show the same context menu for a row of the virtual view"""
+        self.post_context_menu(item.iid, event.x_root, event.y_root)
+
+    def post_context_menu(self, item_id, x_root, y_root):
+        """Build the context menu of a tree item and post it at the given screen position"""
+        menu = tk.Menu(self.root, tearoff=0)
+        node = self.data_model.get(item_id)
+        allowed_for_children = ["sonhos", "metas", "objetivos"]
+        parent_id = self.parent_id(item_id)
+        parent_name = self.item_name(parent_id)
+        # If this is a top-level spot
+        if node and node.name in allowed_for_children:
+            menu.add_command(label="Add Child", command=lambda: self.add_child_node(item_id))
+        # If this is a child of "sonhos", offer Edit Child
+        elif parent_name == "sonhos":
+            menu.add_command(label="Edit Child", command=lambda: self.edit_sonhos_child(item_id, parent_id))
+            menu.add_command(label="Show Linked", command=lambda: self.show_linked(item_id))
+        # If this is a child of "metas", offer Edit Child for metas
+        elif parent_name == "metas":
+            menu.add_command(label="Edit Child", command=lambda: self.edit_metas_child(item_id, parent_id))
+            menu.add_command(label="Show Linked", command=lambda: self.show_linked(item_id))
+        # If this is a child of "objetivos", offer Edit Child for objetivos
+        elif parent_name == "objetivos":
+            menu.add_command(label="Edit Child", command=lambda: self.edit_objetivos_child(item_id, parent_id))
+            menu.add_command(label="Add Task", command=lambda: self.add_task(item_id))
+        else:
+            menu.add_command(label="Edit Name", command=lambda: self.edit_node_name(item_id))
+        menu.post(x_root, y_root)
 
     def add_child_node(self, parent_id):
         """Add a new child node (label) to the selected spot, updating tree and JSON"""
-        spot_name = self.tree.item(parent_id, 'text')
+        spot_name = self.item_name(parent_id)
         if spot_name == "sonhos":
             dialog = SonhosChildDialog(self.root)
             self.root.wait_window(dialog)
             values = dialog.result
             if values:
-                new_item = TreeItem(values["name"])
-                parent_item = self.data_model.get(parent_id)
-                if parent_item:
-                    parent_item.add_child(new_item)
-                children = self.tree.get_children(parent_id)
-                if children:
-                    last_child = children[-1]
-                    item_id = self.tree.insert(parent_id, self.tree.index(last_child) + 1, text=values["name"], values=("", ""))
-                else:
-                    item_id = self.tree.insert(parent_id, 0, text=values["name"], values=("", ""))
-                self.data_model[item_id] = new_item
+                item_id = self.new_item(parent_id, values["name"])
                 self.update_json_add_child_by_spot(parent_id, values)
+                self.update_indexes(item_id, values)
         elif spot_name == "metas":
             # Get sonhos children from JSON
             data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
@@ -689,18 +1195,9 @@ class TreeviewApp:
             self.root.wait_window(dialog)
             values = dialog.result
             if values:
-                new_item = TreeItem(values["name"])
-                parent_item = self.data_model.get(parent_id)
-                if parent_item:
-                    parent_item.add_child(new_item)
-                children = self.tree.get_children(parent_id)
-                if children:
-                    last_child = children[-1]
-                    item_id = self.tree.insert(parent_id, self.tree.index(last_child) + 1, text=values["name"], values=("", ""))
-                else:
-                    item_id = self.tree.insert(parent_id, 0, text=values["name"], values=("", ""))
-                self.data_model[item_id] = new_item
+                item_id = self.new_item(parent_id, values["name"])
                 self.update_json_add_child_by_spot(parent_id, values)
+                self.update_indexes(item_id, values)
         elif spot_name == "objetivos":
             # Get metas children from JSON
             data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
@@ -715,48 +1212,71 @@ class TreeviewApp:
             self.root.wait_window(dialog)
             values = dialog.result
             if values:
-                new_item = TreeItem(values["name"])
-                parent_item = self.data_model.get(parent_id)
-                if parent_item:
-                    parent_item.add_child(new_item)
-                children = self.tree.get_children(parent_id)
-                if children:
-                    last_child = children[-1]
-                    item_id = self.tree.insert(parent_id, self.tree.index(last_child) + 1, text=values["name"], values=("", ""))
-                else:
-                    item_id = self.tree.insert(parent_id, 0, text=values["name"], values=("", ""))
-                self.data_model[item_id] = new_item
+                item_id = self.new_item(parent_id, values["name"])
                 self.update_json_add_child_by_spot(parent_id, values)
+                self.update_indexes(item_id, values)
         else:
             name = simpledialog.askstring("New Label", "Enter label for new item:")
             if name:
-                new_item = TreeItem(name)
-                parent_item = self.data_model.get(parent_id)
-                if parent_item:
-                    parent_item.add_child(new_item)
-                children = self.tree.get_children(parent_id)
-                if children:
-                    last_child = children[-1]
-                    item_id = self.tree.insert(parent_id, self.tree.index(last_child) + 1, text=name, values=("", ""))
-                else:
-                    item_id = self.tree.insert(parent_id, 0, text=name, values=("", ""))
-                self.data_model[item_id] = new_item
+                self.new_item(parent_id, name)
                 self.update_json_add_child_by_spot(parent_id, name)
+                self.refresh_view()
+
+    def add_task(self, item_id):
+        """Add a task under an objetivo, updating tree, JSON and the task counts"""
+        name = simpledialog.askstring("New Task", "Enter task name:")
+        if not name:
+            return
+        data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
+        with open(data_path, "r", encoding="utf-8") as f:
+            tree_data = json.load(f)
+        objetivo = None
+        for spot in tree_data["spots"]:
+            if spot["name"] == "objetivos":
+                objetivo = spot["children"][self.data_model[item_id].index()]
+                objetivo.setdefault("children", []).append({"name": name, "children": []})
+                break
+        if objetivo is None:
+            return
+        with open(data_path, "w", encoding="utf-8") as f:
+            json.dump(tree_data, f, indent=2, ensure_ascii=False)
+        self.new_item(item_id, name)
+        self.data_model[item_id].open = True
+        if self.classic_built:
+            self.tree.item(item_id, open=True)
+        self.update_indexes(item_id, objetivo)
+
+    def show_linked(self, item_id):
+        """List the metas/objetivos linked below a dream or meta"""
+        key = self.rollup_key(item_id)
+        lines = []
+        for spot in ("metas", "objetivos"):
+            names = [self.item_name(self.rollup_items[linked])
+                     for linked in self.links.descendants(key, spot) if linked in self.rollup_items]
+            if names:
+                lines.append(f"{spot}: " + ", ".join(names))
+        messagebox.showinfo(f"Linked to {self.item_name(item_id)}",
+                            "\n".join(lines) or "Nothing is linked to this item.", parent=self.root)
+
+    def show_due_this_week(self):
+        """List the sonhos/metas/objetivos with a review checkpoint this week"""
+        lines = [f"{due:%a %d/%m} - {key[0]}: {self.item_name(self.rollup_items[key])}"
+                 for due, key in self.schedule.due_this_week() if key in self.rollup_items]
+        messagebox.showinfo("Due This Week", "\n".join(lines) or "Nothing is due for review this week.",
+                            parent=self.root)
 
     def get_spot_name_from_id(self, item_id):
         # Returns the spot name ("sonhos", "metas", "objetivos") for a given item_id
-        while item_id:
-            parent = self.tree.parent(item_id)
-            if not parent:
-                return self.tree.item(item_id, 'text')
-            item_id = parent
-        return None
+        item = self.data_model.get(item_id)
+        while item is not None and item.parent is not None:
+            item = item.parent
+        return item.name if item is not None else None
 
     def update_json_add_child_by_spot(self, parent_id, child_data):
         data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
         with open(data_path, "r", encoding="utf-8") as f:
             tree_data = json.load(f)
-        spot_name = self.tree.item(parent_id, 'text')
+        spot_name = self.item_name(parent_id)
         for spot in tree_data["spots"]:
             if spot["name"] == spot_name:
                 if spot_name == "sonhos" and isinstance(child_data, dict):
@@ -805,9 +1325,10 @@ class TreeviewApp:
         new_name = simpledialog.askstring("Edit Name", f"Enter new name for '{node.name}':")
         if new_name and new_name != node.name:
             old_name = node.name
-            node.name = new_name
-            self.tree.item(item_id, text=new_name)
             self.update_json_edit_name_by_path(item_id, new_name)
+            node.name = new_name
+            self.sync_row(item_id)
+            self.refresh_view()
 
     def update_json_edit_name_by_path(self, item_id, new_name):
         data_path = os.path.join(os.path.dirname(__file__), "tree_data.json")
@@ -815,10 +1336,10 @@ class TreeviewApp:
             tree_data = json.load(f)
         # Find the node in the spots structure and update its name
         path = []
-        current_id = item_id
-        while current_id:
-            path.append(self.tree.item(current_id, 'text'))
-            current_id = self.tree.parent(current_id)
+        item = self.data_model[item_id]
+        while item is not None:
+            path.append(item.name)
+            item = item.parent
         path = list(reversed(path))
         if len(path) == 1:
             # Editing a spot name
@@ -840,27 +1361,35 @@ class TreeviewApp:
 
     def expand_all(self):
         """Expand all items in the tree"""
+        if self.virtual_mode.get():
+            self.virtual.set_open_all(True)
+            return
         for item in self.tree.get_children():
             self.tree.item(item, open=True)
             self._expand_children(item)
 
     def _expand_children(self, item):
-        """Helper function to recursively expand all children"""
+        """Helper function to recursively expand all children (leaves have nothing to open)"""
         for child in self.tree.get_children(item):
-            self.tree.item(child, open=True)
-            self._expand_children(child)
+            if self.tree.get_children(child):
+                self.tree.item(child, open=True)
+                self._expand_children(child)
 
     def collapse_all(self):
         """Collapse all items in the tree"""
+        if self.virtual_mode.get():
+            self.virtual.set_open_all(False)
+            return
         for item in self.tree.get_children():
             self.tree.item(item, open=False)
             self._collapse_children(item)
 
     def _collapse_children(self, item):
-        """Helper function to recursively collapse all children"""
+        """Helper function to recursively collapse all children (leaves have nothing to close)"""
         for child in self.tree.get_children(item):
-            self.tree.item(child, open=False)
-            self._collapse_children(child)
+            if self.tree.get_children(child):
+                self.tree.item(child, open=False)
+                self._collapse_children(child)
 
     def populate_tree(self):
         # Load data from JSON file
@@ -868,17 +1397,61 @@ class TreeviewApp:
         with open(data_path, "r", encoding="utf-8") as f:
             tree_data = json.load(f)
 
-        def add_items(parent_id, node):
-            item = TreeItem(node["name"])
-            item_id = self.tree.insert(parent_id, "end", text=node["name"], values=("", ""))
-            self.data_model[item_id] = item
-            for child in node.get("children", []):
-                item.add_child(add_items(item_id, child))
-            return item
+        # Links and task counts are indexed once here and kept up to date incrementally
+        self.links = LinkIndex(tree_data)
+        self.rollup = TaskRollup(tree_data, self.links)
+        self.schedule = ReviewSchedule(tree_data)
+        self.rollup_items = {}
+        self.roots = []
+
+        def add_items(parent_id, node, key=None):
+            item_id = self.new_item(parent_id, node["name"], self.row_values(key, node))
+            if key is not None:
+                self.rollup_items[key] = item_id
+            for index, child in enumerate(node.get("children", []), start=1):
+                child_key = (node["name"], index) if parent_id == "" else None
+                add_items(item_id, child, child_key)
+            return self.data_model[item_id]
 
         # Add each spot as a top-level node
         for spot in tree_data.get("spots", []):
-            add_items("", spot)
+            self.roots.append(add_items("", spot, ("spot", spot["name"])))
+
+    def row_values(self, key, node):
+        """Return the (periodo, n_tarefas) column values of a node"""
+        if key is None:
+            return ("", "")
+        start, end = node.get("start_date", ""), node.get("end_date", "")
+        periodo = f"{start} → {end}" if start and end else start or end
+        return (periodo, self.rollup.total(key))
+
+    def rollup_key(self, item_id):
+        """Return the TaskRollup key of a spot or spot child row (None for deeper rows)"""
+        item = self.data_model[item_id]
+        if item.parent is None:
+            return ("spot", item.name)
+        if item.parent.parent is None:
+            return (item.parent.name, item.index() + 1)
+        return None
+
+    def update_indexes(self, item_id, node):
+        """Record an added/edited spot child and refresh only the rows whose totals changed"""
+        key = self.rollup_key(item_id)
+        if key is None:
+            return
+        self.schedule.set_node(key, node)
+        self.rollup_items[key] = item_id
+        for changed in self.rollup.set_node(key, node):
+            changed_id = self.rollup_items.get(changed)
+            if changed_id:
+                item = self.data_model[changed_id]
+                item.values = (item.values[0], self.rollup.total(changed))
+                self.sync_row(changed_id)
+        item = self.data_model[item_id]
+        item.name = node.get("name", item.name)
+        item.values = self.row_values(key, node)
+        self.sync_row(item_id)
+        self.refresh_view()
 
 def main():
     root = tk.Tk()
@@ -2,18 +2,27 @@ import tkinter as tk
 from tkinter import ttk
 import tkcalendar
 import datetime
-import json
+import os
+
+from relatorio_store import CAMPOS_RELATORIO, RelatorioStore
 
 class JanelaMeta:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Metas")
 
+        # Relatórios ficam num banco SQLite ao lado deste arquivo
+        self.relatorios = RelatorioStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "relatorios.db"))
+        self.relatorios.importar_json_uma_vez(os.getcwd())
+
         # Calendário
         self.calendar = tk.Frame(self.root)
         self.calendar.pack(pady=20)
         self.cal = tkcalendar.Calendar(self.calendar, selectmode='day', year=datetime.datetime.now().year, month=datetime.datetime.now().month, day=datetime.datetime.now().day)
         self.cal.pack()
+        self.cal.tag_config("relatorio", background="#8fbc8f", foreground="black")
+        self.cal.bind("<<CalendarMonthChanged>>", lambda event: self.marcar_dias_com_relatorio())
+        self.marcar_dias_com_relatorio()
 
         # Botões de seleção de data e relatório
         self.botao_selecionar_data = tk.Button(self.root, text="Selecionar Data", command=self.selecionar_data)
@@ -21,6 +30,13 @@ class JanelaMeta:
 
         self.toplevel_relatorio = None
 
+    def marcar_dias_com_relatorio(self):
+        # Marca no calendário os dias do mês exibido que já têm relatório
+        mes, ano = self.cal.get_displayed_month()
+        self.cal.calevent_remove(tag="relatorio")
+        for data in self.relatorios.datas_do_mes(ano, mes):
+            self.cal.calevent_create(data, "Relatório", "relatorio")
+
     def selecionar_data(self):
         # Salva a data escolhida em memório
         self.data_escolhida = self.cal.selection_get()
@@ -67,9 +83,16 @@ class JanelaMeta:
         self.botao_salvar_dados = tk.Button(self.toplevel_relatorio, text="Salvar Dados", command=self.salvar_dados)
         self.botao_salvar_dados.grid(row=4, column=0, columnspan=2, pady=10)
 
+        # Preenche com o relatório já salvo para a data, se houver
+        relatorio = self.relatorios.obter(self.data_escolhida)
+        if relatorio:
+            respostas = (self.resposta_repetir, self.resposta_nao_fazer, self.resposta_habito, self.resposta_grande_vitoria)
+            for campo, resposta in zip(CAMPOS_RELATORIO, respostas):
+                resposta.insert("1.0", (relatorio[campo] or "").rstrip("\n"))
+
 
     def salvar_dados(self):
-        # Salva os dados em um arquivo JSON
+        # Monta o relatório com as respostas do formulário
         data = {
             "data": str(self.data_escolhida),
             "repetir": self.resposta_repetir.get("1.0", tk.END),
@@ -77,16 +100,14 @@ class JanelaMeta:
             "habito": self.resposta_habito.get("1.0", tk.END),
             "grande_vitoria": self.resposta_grande_vitoria.get("1.0", tk.END)
         }
-        
-        # Salva os dados em um arquivo
 
-        
-        # Salva os dados em um arquivo JSON
-        with open(f"relatorio_{self.data_escolhida}.json", "w") as f:
-            json.dump(data, f)
+        # Salva os dados no banco de relatórios e marca o dia no calendário
+        self.relatorios.salvar(data)
+        self.marcar_dias_com_relatorio()
 
     def run(self):
         self.root.mainloop()
+        self.relatorios.fechar()
 
 if __name__ == "__main__":
     app = JanelaMeta()
@@ -0,0 +1,106 @@
+"""
+Armazenamento dos relatórios diários do manha.py.
+
+Fica separado da janela (que depende de tkinter e tkcalendar) para poder ser
+usado e testado sem interface gráfica.
+"""
+
+import datetime
+import glob
+import json
+import os
+import sqlite3
+
+CAMPOS_RELATORIO = ("repetir", "parar_fazer", "habito", "grande_vitoria")
+
+class RelatorioStore:
+    """
+    Relatórios diários numa tabela SQLite com a data (YYYY-MM-DD) como chave.
+
+    A chave primária permite ler intervalos de datas sem abrir um arquivo por
+    dia, e as datas com relatório de cada mês consultado ficam em cache para o
+    calendário marcar os dias ao trocar de mês.
+    """
+
+    def __init__(self, caminho):
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.row_factory = sqlite3.Row
+        with self.conexao:
+            self.conexao.execute(
+                "CREATE TABLE IF NOT EXISTS relatorios ("
+                "data TEXT PRIMARY KEY, repetir TEXT, parar_fazer TEXT, habito TEXT,"
+                " grande_vitoria TEXT, salvo_em TEXT)"
+            )
+            self.conexao.execute("CREATE TABLE IF NOT EXISTS meta (chave TEXT PRIMARY KEY, valor TEXT)")
+        self._meses = {}  # (ano, mes) -> set de datas com relatório
+
+    def salvar(self, relatorio):
+        """Insere ou substitui o relatório da data em relatorio["data"]"""
+        data = str(relatorio["data"])
+        with self.conexao:
+            self.conexao.execute(
+                "INSERT OR REPLACE INTO relatorios VALUES (?, ?, ?, ?, ?, ?)",
+                (data, *(relatorio.get(campo, "") for campo in CAMPOS_RELATORIO),
+                 datetime.datetime.now().isoformat(timespec="seconds")),
+            )
+        dias = self._meses.get((int(data[:4]), int(data[5:7])))
+        if dias is not None:
+            dias.add(datetime.date.fromisoformat(data))
+
+    def obter(self, data):
+        """Retorna o relatório de uma data, ou None"""
+        linha = self.conexao.execute("SELECT * FROM relatorios WHERE data = ?", (str(data),)).fetchone()
+        return dict(linha) if linha else None
+
+    def intervalo(self, inicio, fim):
+        """Retorna os relatórios entre duas datas (inclusive), em ordem de data"""
+        linhas = self.conexao.execute(
+            "SELECT * FROM relatorios WHERE data BETWEEN ? AND ? ORDER BY data", (str(inicio), str(fim))
+        )
+        return [dict(linha) for linha in linhas]
+
+    def datas_do_mes(self, ano, mes):
+        """Retorna as datas com relatório de um mês (consultado uma vez e mantido em cache)"""
+        if (ano, mes) not in self._meses:
+            linhas = self.conexao.execute(
+                "SELECT data FROM relatorios WHERE data BETWEEN ? AND ?",
+                (f"{ano:04d}-{mes:02d}-01", f"{ano:04d}-{mes:02d}-31"),
+            )
+            self._meses[(ano, mes)] = {datetime.date.fromisoformat(linha["data"]) for linha in linhas}
+        return self._meses[(ano, mes)]
+
+    def importar_json(self, pasta):
+        """Importa os relatorio_<data>.json antigos de uma pasta sem sobrescrever a tabela"""
+        importados = 0
+        for caminho in sorted(glob.glob(os.path.join(pasta, "relatorio_*.json"))):
+            try:
+                with open(caminho, "r", encoding="utf-8") as f:
+                    relatorio = json.load(f)
+                data = datetime.date.fromisoformat(str(relatorio["data"]))
+            except (OSError, ValueError, KeyError):
+                continue
+            if self.obter(data) is None:
+                self.salvar({**relatorio, "data": data})
+                importados += 1
+        return importados
+
+    def importar_json_uma_vez(self, pasta):
+        """
+        Importa os JSON antigos de uma pasta só na primeira vez em que ela é vista.
+
+        A importação fica registrada na tabela meta, então as aberturas
+        seguintes não varrem a pasta de novo. Retorna quantos foram importados.
+        """
+        chave = "importacao_json:" + os.path.abspath(pasta)
+        if self.conexao.execute("SELECT 1 FROM meta WHERE chave = ?", (chave,)).fetchone():
+            return 0
+        importados = self.importar_json(pasta)
+        with self.conexao:
+            self.conexao.execute(
+                "INSERT INTO meta VALUES (?, ?)",
+                (chave, datetime.datetime.now().isoformat(timespec="seconds")),
+            )
+        return importados
+
+    def fechar(self):
+        self.conexao.close()
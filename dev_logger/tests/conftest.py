@@ -0,0 +1,11 @@
+"""
+Shared setup for the dev_logger tests: makes the scripts' modules importable.
+
+The scripts live one folder up and import each other by name, so that folder
+is put on sys.path; only modules without a GUI are tested.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,64 @@
+"""
+Tests for RelatorioStore, the SQLite store of manha.py's daily reports.
+"""
+
+import datetime
+import json
+
+import pytest
+
+from relatorio_store import RelatorioStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = RelatorioStore(str(tmp_path / "relatorios.db"))
+    yield store
+    store.fechar()
+
+def _relatorio(data, texto):
+    return {"data": data, "repetir": texto, "parar_fazer": "", "habito": "", "grande_vitoria": ""}
+
+def test_salvar_replaces_the_report_of_a_date(store):
+    """A date holds one report; saving it again replaces the answers."""
+    store.salvar(_relatorio("2025-02-14", "a"))
+    store.salvar(_relatorio(datetime.date(2025, 2, 14), "b"))
+
+    assert store.obter("2025-02-14")["repetir"] == "b"
+    assert store.obter(datetime.date(2025, 2, 14))["repetir"] == "b"
+    assert store.obter("2025-02-15") is None
+
+def test_intervalo_is_inclusive_and_ordered(store):
+    """Range reads include both ends and come back in date order."""
+    for data in ("2025-03-01", "2025-02-14", "2025-02-28", "2025-01-31"):
+        store.salvar(_relatorio(data, data))
+
+    datas = [relatorio["data"] for relatorio in store.intervalo("2025-02-01", "2025-03-01")]
+    assert datas == ["2025-02-14", "2025-02-28", "2025-03-01"]
+
+def test_datas_do_mes_cache_follows_salvar(store):
+    """The cached dates of a month pick up reports saved after the first lookup."""
+    store.salvar(_relatorio("2025-02-14", "a"))
+    assert store.datas_do_mes(2025, 2) == {datetime.date(2025, 2, 14)}
+
+    store.salvar(_relatorio("2025-02-20", "b"))
+    store.salvar(_relatorio("2025-03-01", "c"))
+    assert store.datas_do_mes(2025, 2) == {datetime.date(2025, 2, 14), datetime.date(2025, 2, 20)}
+    assert store.datas_do_mes(2025, 3) == {datetime.date(2025, 3, 1)}
+
+def test_importar_json_uma_vez_runs_once_per_folder(store, tmp_path):
+    """Old JSON reports are imported on the first call only, never over a stored report."""
+    pasta = tmp_path / "antigos"
+    pasta.mkdir()
+    store.salvar(_relatorio("2025-02-15", "banco"))
+    for data, texto in (("2025-02-14", "json"), ("2025-02-15", "json")):
+        (pasta / f"relatorio_{data}.json").write_text(json.dumps(_relatorio(data, texto)), encoding="utf-8")
+    (pasta / "relatorio_quebrado.json").write_text("{", encoding="utf-8")
+
+    assert store.importar_json_uma_vez(str(pasta)) == 1
+    assert store.obter("2025-02-14")["repetir"] == "json"
+    assert store.obter("2025-02-15")["repetir"] == "banco"
+
+    (pasta / "relatorio_2025-02-16.json").write_text(json.dumps(_relatorio("2025-02-16", "novo")),
+                                                     encoding="utf-8")
+    assert store.importar_json_uma_vez(str(pasta)) == 0
+    assert store.obter("2025-02-16") is None
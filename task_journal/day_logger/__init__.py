@@ -1 +1,34 @@
 # This file marks src as a Python package for import resolution.
+#
+# Importing the package is side-effect free and loads no submodule: they are
+# imported on first attribute access (PEP 562), e.g. ``day_logger.cli`` or
+# ``day_logger.JournalDataManager``.
+_SUBMODULES = {
+    "api_server", "archive", "async_data_manager", "cli", "columnar_export",
+    "daily_file_reader", "intervals", "journal_data_manager", "main", "models",
+    "month_summary", "processors", "save_worker", "utils", "write_behind",
+}
+
+_ATTRIBUTES = {
+    "JournalDataManager": "day_logger.journal_data_manager",
+    "TimeBlock": "day_logger.models.timeblock",
+    "DataProcessor": "day_logger.processors.data_processor",
+}
+
+__all__ = sorted(_SUBMODULES | set(_ATTRIBUTES))
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
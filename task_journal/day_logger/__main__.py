@@ -0,0 +1,6 @@
+"""Allow running the headless CLI with ``python -m day_logger``."""
+import sys
+
+from day_logger.cli import main
+
+sys.exit(main())
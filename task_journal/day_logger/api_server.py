@@ -0,0 +1,283 @@
+"""
+HTTP read API module.
+Serves daily/weekly/monthly aggregates and block search over the daily files
+to local clients such as the metrics dashboard, using only the standard library.
+
+Per-day rollups are computed once and reused until the day file's mtime or
+size changes. Responses carry an ETag and Last-Modified derived from the files
+in the requested range, so a dashboard refresh that sends If-None-Match /
+If-Modified-Since gets a 304 without any aggregation.
+
+Browsers only let a page read the responses when its origin is the one given
+with ``--allow-origin`` (e.g. the dashboard's); other websites can't read the
+journal through it.
+
+Usage:
+    python -m day_logger serve --port 8765 --allow-origin http://localhost:3000
+    curl "http://127.0.0.1:8765/api/weekly?from=2025-02-01&to=2025-02-28"
+
+Endpoints:
+    GET /api/health
+    GET /api/daily?from=YYYY-MM-DD&to=YYYY-MM-DD
+    GET /api/weekly?from=...&to=...
+    GET /api/monthly?from=...&to=...
+    GET /api/search?q=text&from=...&to=...&limit=50
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from day_logger.models.timeblock import block_duration_minutes
+from journal_processor import JournalProcessor
+
+PERIODS = {
+    "daily": lambda day: day,
+    "weekly": lambda day: "{0}-W{1:02d}".format(*datetime.strptime(day, "%Y-%m-%d").isocalendar()[:2]),
+    "monthly": lambda day: day[:7],
+}
+
+
+class RollupStore:
+    """
+    Per-day rollups of the daily files, invalidated on mtime/size changes.
+
+    Thread safe; one store is shared by every request handler thread.
+    """
+
+    def __init__(self, processor: JournalProcessor, max_responses: int = 128):
+        """
+        Args:
+            processor: JournalProcessor whose data manager locates the daily files.
+            max_responses: Number of rendered responses kept, keyed by ETag.
+        """
+        self.processor = processor
+        self.max_responses = max_responses
+        self._days: Dict[str, tuple[tuple[int, int], Dict[str, Any]]] = {}
+        self._responses: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def daily_files(self, start: Optional[str] = None,
+                    end: Optional[str] = None) -> Dict[str, tuple[Path, int, int]]:
+        """List the daily files in a date range: date -> (path, mtime_ns, size)."""
+        return self.processor.data_manager.list_daily_files(start, end)
+
+    def fingerprint(self, route: str, files: Dict[str, tuple[Path, int, int]]) -> tuple[str, float]:
+        """Return (ETag, Last-Modified timestamp) for a route over a set of files."""
+        digest = hashlib.sha1(route.encode("utf-8"))
+        last_modified = 0
+        for day, (_, mtime_ns, size) in files.items():
+            digest.update(f"{day}:{mtime_ns}:{size};".encode("ascii"))
+            last_modified = max(last_modified, mtime_ns)
+        return f'"{digest.hexdigest()}"', last_modified / 1e9
+
+    def day_rollup(self, day: str, path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Return the blocks/hours rollup of one day, recomputing it only when the file changed."""
+        with self._lock:
+            cached = self._days.get(day)
+        if cached and cached[0] == (mtime_ns, size):
+            return cached[1]
+
+        blocks = 0
+        hours = 0.0
+        by_block: Dict[str, Dict[str, float]] = {}
+        date = datetime.strptime(day, "%Y-%m-%d")
+        for block in self.processor.data_manager.iter_daily_blocks(date):
+            duration = block_duration_minutes(block) / 60
+            totals = by_block.setdefault(block.get("block_name", ""), {"blocks": 0, "hours": 0.0})
+            totals["blocks"] += 1
+            totals["hours"] += duration
+            blocks += 1
+            hours += duration
+        rollup = {"date": day, "blocks": blocks, "hours": hours, "by_block": by_block}
+        with self._lock:
+            self._days[day] = ((mtime_ns, size), rollup)
+        return rollup
+
+    def aggregate(self, period: str, files: Dict[str, tuple[Path, int, int]]) -> Dict[str, Any]:
+        """Combine day rollups into daily, weekly or monthly buckets."""
+        bucket_of = PERIODS[period]
+        buckets: Dict[str, Dict[str, Any]] = {}
+        for day, (path, mtime_ns, size) in files.items():
+            rollup = self.day_rollup(day, path, mtime_ns, size)
+            if not rollup["blocks"]:
+                continue
+            key = bucket_of(day)
+            bucket = buckets.setdefault(key, {"period": key, "days": 0, "blocks": 0, "hours": 0.0, "by_block": {}})
+            bucket["days"] += 1
+            bucket["blocks"] += rollup["blocks"]
+            bucket["hours"] += rollup["hours"]
+            for name, totals in rollup["by_block"].items():
+                target = bucket["by_block"].setdefault(name, {"blocks": 0, "hours": 0.0})
+                target["blocks"] += totals["blocks"]
+                target["hours"] += totals["hours"]
+        for bucket in buckets.values():
+            bucket["hours"] = round(bucket["hours"], 2)
+            for totals in bucket["by_block"].values():
+                totals["hours"] = round(totals["hours"], 2)
+        return {
+            "period": period,
+            "total_blocks": sum(b["blocks"] for b in buckets.values()),
+            "total_hours": round(sum(b["hours"] for b in buckets.values()), 2),
+            "buckets": list(buckets.values())
+        }
+
+    def search(self, query: str, files: Dict[str, tuple[Path, int, int]], limit: int = 50) -> Dict[str, Any]:
+        """Find blocks whose name or content contains ``query`` (case insensitive), newest day first."""
+        needle = query.lower()
+        matches = []
+        for day in reversed(list(files)):
+            date = datetime.strptime(day, "%Y-%m-%d")
+            for block in self.processor.data_manager.iter_daily_blocks(date):
+                content = block.content or ""
+                if needle in content.lower() or needle in block.get("block_name", "").lower():
+                    matches.append({**block.header(), "date": day, "content": content})
+                    if len(matches) >= limit:
+                        return {"query": query, "matches": matches, "truncated": True}
+        return {"query": query, "matches": matches, "truncated": False}
+
+    def cached_response(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._responses.get(etag)
+            if body is not None:
+                self._responses.move_to_end(etag)
+            return body
+
+    def store_response(self, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._responses[etag] = body
+            self._responses.move_to_end(etag)
+            while len(self._responses) > self.max_responses:
+                self._responses.popitem(last=False)
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the server's RollupStore."""
+
+    server_version = "day_logger"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = url.path.rstrip("/")
+
+        if route == "/api/health":
+            self._send_json(200, {"status": "ok"})
+            return
+        period = route.rsplit("/", 1)[-1]
+        if not route.startswith("/api/") or (period not in PERIODS and period != "search"):
+            self._send_json(404, {"error": f"unknown endpoint '{url.path}'"})
+            return
+
+        try:
+            start = _parse_day(params.get("from"))
+            end = _parse_day(params.get("to"))
+            limit = int(params.get("limit", 50))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        if period == "search" and not params.get("q"):
+            self._send_json(400, {"error": "missing query parameter 'q'"})
+            return
+
+        store: RollupStore = self.server.store
+        files = store.daily_files(start, end)
+        etag, last_modified = store.fingerprint(f"{route}?{sorted(params.items())}", files)
+        if self._not_modified(etag, last_modified):
+            self._send_headers(304, etag, last_modified)
+            self.end_headers()
+            return
+
+        body = store.cached_response(etag)
+        if body is None:
+            if period == "search":
+                payload = store.search(params["q"], files, limit)
+            else:
+                payload = store.aggregate(period, files)
+            body = json.dumps(payload).encode("utf-8")
+            store.store_response(etag, body)
+        self._send_headers(200, etag, last_modified)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self, etag: str, last_modified: float) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since and last_modified:
+            try:
+                return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send_headers(self, status: int, etag: str, last_modified: float) -> None:
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", formatdate(last_modified, usegmt=True))
+        self.send_header("Cache-Control", "no-cache")
+        self._send_cors_headers()
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self._send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_cors_headers(self) -> None:
+        """Allow cross-origin reads only from the configured dashboard origin."""
+        allowed = getattr(self.server, "allow_origin", None)
+        if allowed and self.headers.get("Origin") == allowed:
+            self.send_header("Access-Control-Allow-Origin", allowed)
+            self.send_header("Access-Control-Expose-Headers", "ETag, Last-Modified")
+        self.send_header("Vary", "Origin")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+
+def _parse_day(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
+def make_server(processor: JournalProcessor, host: str = "127.0.0.1", port: int = 8765,
+                quiet: bool = False, allow_origin: Optional[str] = None) -> ThreadingHTTPServer:
+    """
+    Create (but don't start) the API server.
+
+    Args:
+        processor: JournalProcessor whose daily files are served.
+        host: Interface to bind; defaults to loopback only.
+        port: TCP port (0 picks a free one).
+        quiet: Suppress the per-request access log.
+        allow_origin: The one origin (scheme://host[:port]) browsers may read
+            responses from, e.g. the dashboard; no cross-origin reads if None.
+
+    Returns:
+        ThreadingHTTPServer: Call ``serve_forever()`` to start it.
+    """
+    server = ThreadingHTTPServer((host, port), ApiRequestHandler)
+    server.store = RollupStore(processor)
+    server.quiet = quiet
+    server.allow_origin = allow_origin.rstrip("/") if allow_origin else None
+    return server
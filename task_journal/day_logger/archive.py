@@ -0,0 +1,231 @@
+"""
+Entry archive module.
+Packs the loose journal_entry_*.json files of a closed month or year into one
+compressed container and reads single days back with random access.
+
+An archive is two files under ``<base_path>/archive``:
+    2025-02.jsonl.gz     one gzip member per day, each holding JSON Lines of
+                         {"name": <original file name>, "entry": <entry data>}
+    2025-02.index.json   {"period", "entries", "days": {"YYYY-MM-DD": [offset, length, count]}}
+
+Because every day is an independent gzip member, reading a day seeks to its
+offset and decompresses only that member.
+
+Records are keyed by their file name within a day: a loose file left next to
+an archive (``pack(..., remove_loose=False)``) or written again later replaces
+the archived record of the same name, on reads and on the next pack. A day
+lives in at most one archive, so a month can't be packed while its year is,
+and the other way round.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from day_logger.journal_data_manager import JournalDataManager
+
+ARCHIVE_DIR = "archive"
+FORMAT_VERSION = 1
+
+
+def archive_paths(base_path: Path, period: str) -> tuple[Path, Path]:
+    """Return the (data, index) paths of the archive of ``period`` (YYYY or YYYY-MM)."""
+    folder = Path(base_path) / ARCHIVE_DIR
+    return folder / f"{period}.jsonl.gz", folder / f"{period}.index.json"
+
+
+def parse_period(period: str) -> tuple[int, Optional[int]]:
+    """
+    Parse a period string into (year, month); month is None for a whole year.
+
+    Raises:
+        ValueError: If the period is not YYYY or YYYY-MM
+    """
+    try:
+        if len(period) == 4:
+            return int(period), None
+        parsed = datetime.strptime(period, "%Y-%m")
+        return parsed.year, parsed.month
+    except ValueError:
+        raise ValueError(f"invalid period '{period}', expected YYYY or YYYY-MM")
+
+
+def is_closed(period: str, today: Optional[datetime] = None) -> bool:
+    """Return True when no new entries can be filed in ``period`` any more."""
+    today = today or datetime.now()
+    year, month = parse_period(period)
+    if month is None:
+        return year < today.year
+    return (year, month) < (today.year, today.month)
+
+
+def overlapping_archives(base_path: Path, period: str) -> list[str]:
+    """Return the other archived periods covering days of ``period`` (its year, or its months)."""
+    year, month = parse_period(period)
+    folder = Path(base_path) / ARCHIVE_DIR
+    if month is not None:
+        candidates = [f"{year:04d}"]
+    else:
+        candidates = sorted(path.name[:7] for path in folder.glob(f"{year:04d}-??.index.json"))
+    return [other for other in candidates if archive_paths(base_path, other)[1].exists()]
+
+
+def iter_loose_days(base_path: Path, period: str) -> Iterator[tuple[str, list[Path]]]:
+    """
+    Yield (YYYY-MM-DD, entry files) for every day folder of ``period``, in date order.
+
+    Day folders are named ddd-DD-MM-YY; only the numeric part is parsed, so
+    the locale used for the weekday abbreviation doesn't matter.
+    """
+    year, month = parse_period(period)
+    prefix = f"{year % 100:02d}-" + (f"{month:02d}" if month else "")
+    days: Dict[str, list[Path]] = {}
+    for month_dir in sorted(Path(base_path).glob(f"{prefix}*")):
+        if not month_dir.is_dir():
+            continue
+        for day_dir in month_dir.glob("*/*"):
+            if not day_dir.is_dir():
+                continue
+            try:
+                day = datetime.strptime(day_dir.name[-8:], "%d-%m-%y").strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+            days.setdefault(day, []).extend(sorted(day_dir.glob("*.json")))
+    for day in sorted(days):
+        if days[day]:
+            yield day, days[day]
+
+
+def pack(manager: "JournalDataManager", period: str, remove_loose: bool = True,
+         force: bool = False) -> Dict[str, Any]:
+    """
+    Pack the loose entries of a closed month or year into an archive.
+
+    Entries already archived for the period are kept; loose files written
+    since are appended, replacing an archived record of the same name. The
+    container and index are written to temporary files and swapped in, and
+    loose files are only removed afterwards.
+
+    Args:
+        manager: Data manager whose base_path holds the entries.
+        period: YYYY-MM for a month, YYYY for a year.
+        remove_loose: Delete the packed files and their empty folders.
+        force: Pack even if the period is still open.
+
+    Returns:
+        Dict[str, Any]: The archive index.
+
+    Raises:
+        ValueError: If the period is invalid, still open, or overlaps another archive
+    """
+    if not force and not is_closed(period):
+        raise ValueError(f"period {period} is not closed yet")
+    overlapping = overlapping_archives(manager.base_path, period)
+    if overlapping:
+        raise ValueError(f"period {period} overlaps the {', '.join(overlapping)} archive; unpack it first")
+    data_path, index_path = archive_paths(manager.base_path, period)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    previous = EntryArchive(data_path, index_path) if index_path.exists() else None
+
+    loose = dict(iter_loose_days(manager.base_path, period))
+    days = sorted(set(loose) | set(previous.days() if previous else ()))
+    index: Dict[str, Any] = {"format": FORMAT_VERSION, "period": period, "entries": 0, "days": {}}
+    tmp_data = data_path.with_name(data_path.name + ".tmp")
+    with open(tmp_data, 'wb') as out:
+        for day in days:
+            records = {record["name"]: record for record in (previous.read_records(day) if previous else [])}
+            for path in loose.get(day, []):
+                records[path.name] = {"name": path.name, "entry": manager.cache.load(path)}
+            records = list(records.values())
+            payload = "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+            member = gzip.compress(payload, mtime=0)
+            index["days"][day] = [out.tell(), len(member), len(records)]
+            index["entries"] += len(records)
+            out.write(member)
+        out.flush()
+        os.fsync(out.fileno())
+
+    tmp_index = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_data, data_path)
+    os.replace(tmp_index, index_path)
+
+    if remove_loose:
+        for files in loose.values():
+            for path in files:
+                path.unlink()
+                manager.cache.invalidate(path)
+        _remove_empty_dirs(manager.base_path, period)
+    return index
+
+
+def _remove_empty_dirs(base_path: Path, period: str) -> None:
+    year, month = parse_period(period)
+    prefix = f"{year % 100:02d}-" + (f"{month:02d}" if month else "")
+    for month_dir in Path(base_path).glob(f"{prefix}*"):
+        for root, dirs, files in os.walk(month_dir, topdown=False):
+            if not os.listdir(root):
+                os.rmdir(root)
+
+
+def unpack(manager: "JournalDataManager", period: str) -> int:
+    """Restore the loose files of an archive and delete it; returns the number of entries."""
+    data_path, index_path = archive_paths(manager.base_path, period)
+    archive = EntryArchive(data_path, index_path)
+    restored = 0
+    for day in archive.days():
+        folder = manager.get_entry_folder(datetime.strptime(day, "%Y-%m-%d"))
+        folder.mkdir(parents=True, exist_ok=True)
+        for record in archive.read_records(day):
+            with open(folder / record["name"], 'w', encoding='utf-8') as f:
+                json.dump(record["entry"], f, indent=2)
+            restored += 1
+    index_path.unlink()
+    data_path.unlink()
+    return restored
+
+
+class EntryArchive:
+    """Random access reader for one packed archive."""
+
+    def __init__(self, data_path: Path, index_path: Path, index: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            data_path: The .jsonl.gz container.
+            index_path: Its .index.json offset index.
+            index: Already parsed index (e.g. from a DocumentCache), read from index_path if None.
+        """
+        self.data_path = Path(data_path)
+        self.index_path = Path(index_path)
+        if index is None:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        self.index = index
+
+    def days(self) -> list[str]:
+        """Return the archived days (YYYY-MM-DD) in date order."""
+        return sorted(self.index["days"])
+
+    def __contains__(self, day: str) -> bool:
+        return day in self.index["days"]
+
+    def read_records(self, day: str) -> list[Dict[str, Any]]:
+        """Return the {"name", "entry"} records of a day by decompressing only its member."""
+        location = self.index["days"].get(day)
+        if location is None:
+            return []
+        offset, length, _ = location
+        with open(self.data_path, 'rb') as f:
+            f.seek(offset)
+            member = f.read(length)
+        return [json.loads(line) for line in gzip.decompress(member).decode("utf-8").splitlines() if line]
+
+    def get_entries(self, day: str) -> list[Dict[str, Any]]:
+        """Return the entries archived for a day (YYYY-MM-DD)."""
+        return [record["entry"] for record in self.read_records(day)]
+
@@ -0,0 +1,146 @@
+"""
+Async data manager module.
+Exposes JournalDataManager to asyncio code without blocking the event loop:
+file work runs on a bounded thread pool and writes to the same file are
+serialized.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from day_logger.journal_data_manager import JournalDataManager
+
+if TYPE_CHECKING:
+    from day_logger.models.timeblock import TimeBlock
+
+
+class AsyncJournalDataManager:
+    """
+    asyncio front end for JournalDataManager.
+
+    Usage:
+        async with AsyncJournalDataManager("work-logs") as manager:
+            entries = await manager.get_entries_by_date(datetime(2025, 2, 15))
+            async for date, entries in manager.iter_entries(start, end):
+                ...
+    """
+
+    def __init__(self, base_path: str = "journal_entries", max_workers: int = 4,
+                 manager: Optional[JournalDataManager] = None, **manager_kwargs: Any):
+        """
+        Args:
+            base_path: Base path handed to the wrapped JournalDataManager.
+            max_workers: Upper bound on concurrent file operations.
+            manager: Existing JournalDataManager to wrap instead of creating one.
+            manager_kwargs: Extra keyword arguments for JournalDataManager.
+        """
+        self.manager = manager or JournalDataManager(base_path, **manager_kwargs)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="journal-io")
+        # Per-path write lock and the number of coroutines holding or awaiting it
+        self._write_locks: Dict[Path, tuple[asyncio.Lock, int]] = {}
+
+    async def __aenter__(self) -> "AsyncJournalDataManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Wait for running file operations and shut the thread pool down, off the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """
+        Wait for running file operations and shut the thread pool down.
+
+        Blocks the calling thread; asyncio code should await ``aclose`` instead.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    @asynccontextmanager
+    async def _write_lock(self, path: Path) -> AsyncIterator[None]:
+        """
+        Hold the lock serializing writes to ``path``.
+
+        The lock is dropped once nobody holds or awaits it, so writing to many
+        different days doesn't keep a lock per day forever.
+        """
+        lock, users = self._write_locks.get(path) or (asyncio.Lock(), 0)
+        self._write_locks[path] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._write_locks[path]
+            if users == 1:
+                del self._write_locks[path]
+            else:
+                self._write_locks[path] = (lock, users - 1)
+
+    async def save_entry(self, task_journal_instance) -> tuple[bool, str]:
+        """
+        Save a journal entry without blocking the event loop.
+
+        The widgets are read on the event loop thread (they are not thread
+        safe); only the folder creation and the write run on the pool.
+        """
+        try:
+            entry_data = self.manager.collect_entry_data(task_journal_instance)
+        except Exception as e:
+            return False, f"Error saving entry: {str(e)}"
+        return await self.save_entry_data(entry_data)
+
+    async def save_entry_data(self, entry_data: Dict[str, Any]) -> tuple[bool, str]:
+        """Save an already collected entry; writes to the same day are serialized."""
+        async with self._write_lock(self.manager.get_entry_folder(datetime.now())):
+            return await self._run(self.manager.save_entry_data, entry_data)
+
+    async def save_daily_timeblocks(self, blocks: list["TimeBlock"]) -> tuple[bool, str]:
+        """Save time blocks; concurrent saves of the same day run one after another."""
+        if not blocks:
+            return False, "No blocks to save."
+        async with self._write_lock(self.manager.get_daily_file_path(blocks[0].date)):
+            return await self._run(self.manager.save_daily_timeblocks, blocks)
+
+    async def load_latest_entry(self) -> Dict[str, Any]:
+        """Load the most recent journal entry."""
+        return await self._run(self.manager.load_latest_entry)
+
+    async def get_entries_by_date(self, date: datetime) -> list[Dict[str, Any]]:
+        """Retrieve all entries for a specific date."""
+        return await self._run(self.manager.get_entries_by_date, date)
+
+    async def get_entries_by_dates(self, dates: Iterable[datetime]) -> Dict[datetime, list[Dict[str, Any]]]:
+        """Fetch several days concurrently (bounded by ``max_workers``)."""
+        dates = list(dates)
+        results = await asyncio.gather(*(self.get_entries_by_date(date) for date in dates))
+        return dict(zip(dates, results))
+
+    async def iter_entries(self, start: datetime,
+                           end: datetime) -> AsyncIterator[tuple[datetime, list[Dict[str, Any]]]]:
+        """
+        Yield (date, entries) for each day from ``start`` to ``end`` inclusive.
+
+        Days are fetched ``max_workers`` at a time while results are still
+        yielded in date order.
+        """
+        day = start
+        while day <= end:
+            window = []
+            while day <= end and len(window) < self.max_workers:
+                window.append(day)
+                day += timedelta(days=1)
+            fetched = await self.get_entries_by_dates(window)
+            for date in window:
+                yield date, fetched[date]
@@ -0,0 +1,387 @@
+"""
+Command line interface module.
+Headless entry point for bulk ingest and range reports; never imports tkinter.
+
+Usage:
+    python -m day_logger ingest blocks.jsonl entries.json export.csv
+    cat blocks.jsonl | python -m day_logger ingest -
+    python -m day_logger report --from 2025-02-01 --to 2025-02-28 --format json
+    python -m day_logger serve --port 8765
+    python -m day_logger archive 2024
+    python -m day_logger export analytics/ --from 2025-01-01
+    python -m day_logger summary 2025-02
+    python -m day_logger utilisation --from 2025-02-01 --to 2025-02-28 --window 09:00-18:00
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from day_logger.models.timeblock import TimeBlock, block_duration_minutes
+from journal_processor import JournalProcessor
+
+
+class IngestStats:
+    """Counts what an ingest run did and how fast it went."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = 0
+        self.blocks = 0
+        self.days = set()
+        self.errors = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        elapsed = max(self.elapsed, 1e-9)
+        return (f"Ingested {self.records} records ({self.blocks} blocks, {len(self.days)} days, "
+                f"{self.errors} errors) in {elapsed:.2f}s - "
+                f"{self.records / elapsed:.0f} records/s, {self.blocks / elapsed:.0f} blocks/s")
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from a JSON Lines, JSON or CSV stream.
+
+    JSON Lines and CSV are read one line at a time; a JSON document may be a
+    single record or a list of records.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "json":
+        data = json.load(stream)
+        yield from (data if isinstance(data, list) else [data])
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def detect_format(path: str) -> str:
+    """Guess the input format from a file name (stdin defaults to JSON Lines)."""
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith(".json"):
+        return "json"
+    return "jsonl"
+
+
+def record_to_blocks(processor: JournalProcessor, record: Dict[str, Any]) -> List[TimeBlock]:
+    """
+    Convert an input record to TimeBlocks.
+
+    A record is either a raw entry as saved by the GUI ({"timestamp", "time_blocks"})
+    or a single block with date, block_name, start_time, end_time and content.
+    """
+    if "time_blocks" in record:
+        return processor.build_timeblocks(record)
+    return [TimeBlock.from_json(record)]
+
+
+def flush_blocks(processor: JournalProcessor, pending: Dict[str, List[TimeBlock]],
+                 stats: IngestStats, out: TextIO) -> None:
+    """Write the buffered blocks with one save per day."""
+    for day in sorted(pending):
+        success, message = processor.data_manager.save_daily_timeblocks(pending[day])
+        if not success:
+            stats.errors += 1
+            _say(out, message)
+    pending.clear()
+
+
+def ingest(processor: JournalProcessor, sources: Iterable[tuple[str, TextIO, str]],
+           batch_size: int = 1000, progress_every: int = 10000,
+           out: Optional[TextIO] = sys.stderr) -> IngestStats:
+    """
+    Ingest records into daily files in bulk.
+
+    Blocks are buffered and grouped by day, so each daily file is rewritten
+    once per batch instead of once per record.
+
+    Args:
+        processor: JournalProcessor whose data manager does the writes.
+        sources: (name, stream, format) tuples to read records from.
+        batch_size: Number of buffered blocks that triggers a flush.
+        progress_every: Print a progress line every this many records.
+        out: Where progress and errors are printed (None to stay quiet).
+
+    Returns:
+        IngestStats: Counters and timing of the run.
+    """
+    stats = IngestStats()
+    pending: Dict[str, List[TimeBlock]] = defaultdict(list)
+    buffered = 0
+    for name, stream, fmt in sources:
+        for record_no, record in enumerate(read_records(stream, fmt), start=1):
+            stats.records += 1
+            try:
+                blocks = record_to_blocks(processor, record)
+            except (KeyError, TypeError, ValueError) as e:
+                stats.errors += 1
+                _say(out, f"{name}: record {record_no}: skipped invalid record ({e!r})")
+                continue
+            for block in blocks:
+                day = block.date.strftime("%Y-%m-%d")
+                pending[day].append(block)
+                stats.days.add(day)
+            stats.blocks += len(blocks)
+            buffered += len(blocks)
+            if buffered >= batch_size:
+                flush_blocks(processor, pending, stats, out)
+                buffered = 0
+            if progress_every and stats.records % progress_every == 0:
+                _say(out, f"... {stats.records} records, "
+                          f"{stats.records / max(stats.elapsed, 1e-9):.0f} records/s")
+    flush_blocks(processor, pending, stats, out)
+    return stats
+
+
+def build_report(processor: JournalProcessor, start: datetime, end: datetime) -> Dict[str, Any]:
+    """
+    Summarize the daily files between two dates (inclusive).
+
+    Only block names and times are read; the content of each block is
+    never decoded.
+    """
+    days = []
+    totals: Dict[str, Dict[str, float]] = defaultdict(lambda: {"blocks": 0, "hours": 0.0})
+    day = start
+    while day <= end:
+        blocks = hours = 0
+        for block in processor.data_manager.iter_daily_blocks(day):
+            duration = block_duration_minutes(block) / 60
+            blocks += 1
+            hours += duration
+            totals[block.get("block_name", "")]["blocks"] += 1
+            totals[block.get("block_name", "")]["hours"] += duration
+        if blocks:
+            days.append({"date": day.strftime("%Y-%m-%d"), "blocks": blocks, "hours": round(hours, 2)})
+        day += timedelta(days=1)
+    return {
+        "from": start.strftime("%Y-%m-%d"),
+        "to": end.strftime("%Y-%m-%d"),
+        "days_with_entries": len(days),
+        "total_blocks": sum(d["blocks"] for d in days),
+        "total_hours": round(sum(d["hours"] for d in days), 2),
+        "days": days,
+        "by_block": {name: {"blocks": int(t["blocks"]), "hours": round(t["hours"], 2)}
+                     for name, t in sorted(totals.items())}
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as plain text."""
+    lines = [
+        f"Report {report['from']} .. {report['to']}",
+        f"Days with entries: {report['days_with_entries']}",
+        f"Blocks: {report['total_blocks']}  Hours: {report['total_hours']:.2f}",
+        ""
+    ]
+    lines += [f"{d['date']}  {d['blocks']:4d} blocks  {d['hours']:6.2f} h" for d in report["days"]]
+    if report["by_block"]:
+        lines.append("")
+        lines += [f"{name:<24} {t['blocks']:5d} blocks  {t['hours']:8.2f} h"
+                  for name, t in report["by_block"].items()]
+    return "\n".join(lines)
+
+
+def _parse_day(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
+def _parse_month(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM")
+
+
+def _parse_window(value: str) -> tuple[int, int]:
+    from day_logger.intervals import parse_window
+
+    try:
+        return parse_window(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _say(out: Optional[TextIO], message: str) -> None:
+    if out is not None:
+        print(message, file=out)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="day_logger", description="Headless day_logger tools.")
+    parser.add_argument("--work-logs", default="work-logs",
+                        help="Root folder of the journal data (default: work-logs)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_cmd = commands.add_parser("ingest", help="Bulk ingest JSON/JSONL/CSV records into daily files")
+    ingest_cmd.add_argument("inputs", nargs="+", help="Input files, or - for stdin")
+    ingest_cmd.add_argument("--format", choices=["auto", "jsonl", "json", "csv"], default="auto")
+    ingest_cmd.add_argument("--batch-size", type=int, default=1000,
+                            help="Buffered blocks per flush (default: 1000)")
+    ingest_cmd.add_argument("--quiet", action="store_true", help="Only print the final summary")
+
+    report_cmd = commands.add_parser("report", help="Summarize daily files over a date range")
+    report_cmd.add_argument("--from", dest="start", type=_parse_day, required=True)
+    report_cmd.add_argument("--to", dest="end", type=_parse_day, required=True)
+    report_cmd.add_argument("--format", choices=["text", "json"], default="text")
+
+    serve_cmd = commands.add_parser("serve", help="Serve aggregates and search over HTTP for the dashboard")
+    serve_cmd.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve_cmd.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    serve_cmd.add_argument("--allow-origin", metavar="ORIGIN",
+                           help="Origin of the dashboard allowed to read responses in a browser")
+
+    archive_cmd = commands.add_parser("archive", help="Pack the entries of a closed month or year into one file")
+    archive_cmd.add_argument("period", help="YYYY-MM or YYYY")
+    archive_cmd.add_argument("--keep-loose", action="store_true", help="Keep the packed entry files")
+    archive_cmd.add_argument("--force", action="store_true", help="Pack a period that is still open")
+    archive_cmd.add_argument("--unpack", action="store_true", help="Restore the loose files of an archive")
+
+    export_cmd = commands.add_parser("export", help="Export time blocks to a columnar dataset (Parquet or .npz)")
+    export_cmd.add_argument("output", help="Dataset folder")
+    export_cmd.add_argument("--from", dest="start", type=_parse_day)
+    export_cmd.add_argument("--to", dest="end", type=_parse_day)
+    export_cmd.add_argument("--engine", choices=["auto", "parquet", "npz"], default="auto")
+
+    summary_cmd = commands.add_parser("summary", help="Show the days, blocks and hours logged in a month")
+    summary_cmd.add_argument("month", type=_parse_month, help="YYYY-MM")
+    summary_cmd.add_argument("--rebuild", action="store_true",
+                             help="Recompute the summary from the daily files first")
+    summary_cmd.add_argument("--format", choices=["text", "json"], default="text")
+
+    utilisation_cmd = commands.add_parser("utilisation", help="Report overlapping blocks, gaps and covered time")
+    utilisation_cmd.add_argument("--from", dest="start", type=_parse_day, required=True)
+    utilisation_cmd.add_argument("--to", dest="end", type=_parse_day, required=True)
+    utilisation_cmd.add_argument("--window", type=_parse_window,
+                                 help="HH:MM-HH:MM to measure gaps against (default: each day's first to last block)")
+    utilisation_cmd.add_argument("--format", choices=["text", "json"], default="text")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from day_logger.main import configure_logging
+
+    args = build_parser().parse_args(argv)
+    # Progress and results go to stderr via print; logging only reports problems
+    configure_logging(logging.WARNING)
+    processor = JournalProcessor(args.work_logs)
+
+    if args.command == "ingest":
+        def sources():
+            for path in args.inputs:
+                fmt = args.format if args.format != "auto" else detect_format(path)
+                if path == "-":
+                    yield "<stdin>", sys.stdin, fmt
+                    continue
+                with open(path, 'r', encoding='utf-8', newline='') as f:
+                    yield path, f, fmt
+
+        stats = ingest(processor, sources(), batch_size=args.batch_size,
+                       out=None if args.quiet else sys.stderr)
+        print(stats.summary(), file=sys.stderr)
+        return 1 if stats.errors else 0
+
+    if args.command == "serve":
+        from day_logger.api_server import make_server
+
+        server = make_server(processor, args.host, args.port, allow_origin=args.allow_origin)
+        print(f"Serving {args.work_logs} on http://{args.host}:{server.server_port}/api/", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    if args.command == "archive":
+        from day_logger import archive
+
+        try:
+            if args.unpack:
+                restored = archive.unpack(processor.data_manager, args.period)
+                print(f"Restored {restored} entries from the {args.period} archive", file=sys.stderr)
+            else:
+                index = archive.pack(processor.data_manager, args.period,
+                                     remove_loose=not args.keep_loose, force=args.force)
+                print(f"Packed {index['entries']} entries ({len(index['days'])} days) "
+                      f"into {archive.archive_paths(processor.data_manager.base_path, args.period)[0]}",
+                      file=sys.stderr)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.command == "export":
+        from day_logger.columnar_export import export_timeblocks
+
+        try:
+            stats = export_timeblocks(processor, args.output,
+                                      args.start.strftime("%Y-%m-%d") if args.start else None,
+                                      args.end.strftime("%Y-%m-%d") if args.end else None,
+                                      engine=args.engine)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Exported {stats['exported_days']} days ({stats['rows']} rows), "
+              f"{stats['unchanged_days']} unchanged, {stats['removed_days']} removed", file=sys.stderr)
+        return 0
+
+    if args.command == "summary":
+        from day_logger import month_summary
+
+        year, month = args.month.year, args.month.month
+        if args.rebuild:
+            summary = month_summary.rebuild_month(processor.data_manager, year, month)
+        else:
+            summary = processor.data_manager.get_month_summary(year, month)
+        if args.format == "json":
+            print(json.dumps(summary, indent=2))
+        else:
+            print(f"{summary['month']}: {summary['days_with_entries']} days, "
+                  f"{summary['blocks']} blocks, {summary['hours']:.2f} h")
+            for day, info in summary["days"].items():
+                print(f"  {day}  {info['blocks']:3d} blocks  {info['hours']:6.2f} h")
+        return 0
+
+    if args.command == "utilisation":
+        from day_logger.intervals import utilisation
+
+        report = utilisation(processor.data_manager, args.start, args.end, args.window)
+        if args.format == "json":
+            print(json.dumps(report, indent=2))
+            return 0
+        print(f"{report['from']} .. {report['to']}: {report['days_with_entries']} days, "
+              f"{report['covered_minutes'] / 60:.2f} h covered, {report['overlap_minutes'] / 60:.2f} h overlapping, "
+              f"{report['gap_minutes'] / 60:.2f} h in gaps")
+        for day, info in report["days"].items():
+            overlaps = ", ".join(f"{o['start']}-{o['end']} ({' + '.join(o['blocks'])})" for o in info["overlaps"])
+            print(f"  {day}  {info['utilisation']:6.1%} used  {info['gap_minutes']:4d} min gaps"
+                  + (f"  overlaps: {overlaps}" if overlaps else ""))
+        return 0
+
+    report = build_report(processor, args.start, args.end)
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Columnar export module.
+Exports the time blocks of the daily files into a partitioned columnar dataset
+for analysis: Parquet when pyarrow is installed, NumPy ``.npz`` otherwise.
+
+Layout (Hive style, readable with pyarrow.dataset or pandas):
+    <out>/year=2025/month=02/2025-02-15.parquet   (or .npz)
+    <out>/_manifest.json                          source mtime/size and rows per day
+
+Exports are incremental: a day is only rewritten when its daily file changed
+since the last export, and partitions of deleted days are removed.
+
+Usage:
+    python -m day_logger export analytics/ --from 2025-01-01 --to 2025-12-31
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from day_logger.models.timeblock import block_duration_minutes
+
+if TYPE_CHECKING:
+    from journal_processor import JournalProcessor
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MANIFEST = "_manifest.json"
+COLUMNS = ("date", "block_name", "start_time", "end_time", "duration_hours", "content")
+
+
+def default_engine() -> str:
+    """Return the engine used by ``engine="auto"``."""
+    if pa is not None:
+        return "parquet"
+    if np is not None:
+        return "npz"
+    raise RuntimeError("columnar export needs pyarrow or numpy: pip install pyarrow")
+
+
+def _partition_path(out_dir: Path, day: str, engine: str) -> Path:
+    suffix = "parquet" if engine == "parquet" else "npz"
+    return out_dir / f"year={day[:4]}" / f"month={day[5:7]}" / f"{day}.{suffix}"
+
+
+def day_columns(processor: "JournalProcessor", day: str, path: Path) -> Dict[str, list]:
+    """Read one daily file into column lists."""
+    columns: Dict[str, list] = {name: [] for name in COLUMNS}
+    for block in processor.data_manager.cache.load(path).get("blocks", []):
+        start, end = block.get("start_time", ""), block.get("end_time", "")
+        columns["date"].append(day)
+        columns["block_name"].append(block.get("block_name", ""))
+        columns["start_time"].append(start)
+        columns["end_time"].append(end)
+        columns["duration_hours"].append(block_duration_minutes(block) / 60)
+        columns["content"].append(block.get("content") or "")
+    return columns
+
+
+def _write_partition(path: Path, columns: Dict[str, list], engine: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if engine == "parquet":
+        table = pa.table({
+            "date": pa.array(columns["date"], pa.string()),
+            "block_name": pa.array(columns["block_name"], pa.string()),
+            "start_time": pa.array(columns["start_time"], pa.string()),
+            "end_time": pa.array(columns["end_time"], pa.string()),
+            "duration_hours": pa.array(columns["duration_hours"], pa.float64()),
+            "content": pa.array(columns["content"], pa.string()),
+        })
+        pq.write_table(table, tmp_path)
+    else:
+        arrays = {name: np.array(values, dtype=np.float64 if name == "duration_hours" else np.str_)
+                  for name, values in columns.items()}
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(out_dir: Path) -> Dict[str, Any]:
+    """Return the export manifest, or an empty one for a new dataset."""
+    try:
+        with open(Path(out_dir) / MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"engine": None, "days": {}}
+
+
+def export_timeblocks(processor: "JournalProcessor", out_dir: str, start: Optional[str] = None,
+                      end: Optional[str] = None, engine: str = "auto") -> Dict[str, int]:
+    """
+    Export the daily files between two dates (YYYY-MM-DD, inclusive) to ``out_dir``.
+
+    Args:
+        processor: JournalProcessor whose data manager locates the daily files.
+        out_dir: Dataset folder; created if needed.
+        start: First day, or None for the earliest file.
+        end: Last day, or None for the latest file.
+        engine: "parquet", "npz" or "auto" (Parquet if pyarrow is available).
+
+    Returns:
+        Dict[str, int]: Counts of exported, unchanged and removed days and exported rows.
+    """
+    out_dir = Path(out_dir)
+    engine = default_engine() if engine == "auto" else engine
+    if engine == "parquet" and pa is None:
+        raise RuntimeError("the parquet engine needs pyarrow: pip install pyarrow")
+    if engine == "npz" and np is None:
+        raise RuntimeError("the npz engine needs numpy: pip install numpy")
+
+    manifest = load_manifest(out_dir)
+    if manifest["engine"] != engine:
+        # Switching formats rewrites everything; old partitions are left for the user to remove
+        manifest = {"engine": engine, "days": {}}
+    stats = {"exported_days": 0, "unchanged_days": 0, "removed_days": 0, "rows": 0}
+
+    sources = processor.data_manager.list_daily_files(start, end)
+    for day, (path, mtime_ns, size) in sources.items():
+        previous = manifest["days"].get(day)
+        if previous and previous[:2] == [mtime_ns, size]:
+            stats["unchanged_days"] += 1
+            continue
+        columns = day_columns(processor, day, path)
+        _write_partition(_partition_path(out_dir, day, engine), columns, engine)
+        manifest["days"][day] = [mtime_ns, size, len(columns["date"])]
+        stats["exported_days"] += 1
+        stats["rows"] += len(columns["date"])
+
+    for day in [d for d in manifest["days"] if (not start or d >= start) and (not end or d <= end)]:
+        if day not in sources:
+            _partition_path(out_dir, day, engine).unlink(missing_ok=True)
+            del manifest["days"][day]
+            stats["removed_days"] += 1
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp_manifest = out_dir / (MANIFEST + ".tmp")
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump({"engine": engine, "days": dict(sorted(manifest["days"].items()))}, f, indent=2)
+    os.replace(tmp_manifest, out_dir / MANIFEST)
+    return stats
+
+
+def read_columns(out_dir: str, start: Optional[str] = None,
+                 end: Optional[str] = None) -> Dict[str, list]:
+    """
+    Read an exported dataset back as plain column lists (mainly for quick checks).
+
+    For real analysis point pyarrow.dataset or pandas.read_parquet at ``out_dir``.
+    """
+    out_dir = Path(out_dir)
+    manifest = load_manifest(out_dir)
+    columns: Dict[str, list] = {name: [] for name in COLUMNS}
+    for day in manifest["days"]:
+        if (start and day < start) or (end and day > end):
+            continue
+        path = _partition_path(out_dir, day, manifest["engine"])
+        if manifest["engine"] == "parquet":
+            part = pq.read_table(path).to_pydict()
+        else:
+            with np.load(path) as data:
+                part = {name: data[name].tolist() for name in COLUMNS}
+        for name in COLUMNS:
+            columns[name].extend(part[name])
+    return columns
@@ -0,0 +1,380 @@
+"""
+Daily file reader module.
+Reads work-logs daily files (YYYY-MM-DD.json) through a memory map and yields
+their blocks lazily, without decoding the content strings up front.
+"""
+
+import json
+import mmap
+import os
+import re
+import threading
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+
+from day_logger.journal_data_manager import register_rewrite_hook
+
+if TYPE_CHECKING:
+    from day_logger.models.timeblock import TimeBlock
+
+_WHITESPACE = frozenset(b" \t\n\r")
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_SCALAR_END = re.compile(rb'[,}\]\s]')
+
+# Unloaded LazyContents still in use, by daily file, so they can be read
+# before the file is rewritten (see load_pending); paths whose proxies are
+# all gone are dropped whenever another file is listed
+_pending: Dict[str, "weakref.WeakSet[LazyContent]"] = {}
+_pending_lock = threading.Lock()
+
+
+class LazyBlock:
+    """
+    A block from a daily file whose fields are decoded on first access.
+
+    Only the byte spans of the values are recorded while scanning; a field is
+    sliced out of the memory map and decoded when it is read. Fields must be
+    read while the owning reader is open, or copied out with ``to_dict``.
+    """
+
+    __slots__ = ("_reader", "_spans", "_values")
+
+    def __init__(self, reader: "DailyFileReader", spans: Dict[str, tuple[int, int]]):
+        self._reader = reader
+        self._spans = spans
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            start, end = self._spans[key]
+            self._values[key] = self._reader.decode(start, end)
+        return self._values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._spans
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a decoded field, or ``default`` if the block doesn't have it."""
+        return self[key] if key in self._spans else default
+
+    def keys(self) -> list[str]:
+        """Return the field names in file order."""
+        return list(self._spans)
+
+    def span(self, key: str) -> tuple[int, int]:
+        """Return the (offset, length) of a raw JSON value in the file."""
+        start, end = self._spans[key]
+        return start, end - start
+
+    @property
+    def content(self) -> str:
+        """The block's content text, decoded on access."""
+        return self.get("content", "")
+
+    def header(self) -> Dict[str, Any]:
+        """Return every field except the content."""
+        return {key: self[key] for key in self._spans if key != "content"}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode every field into a plain dictionary."""
+        return {key: self[key] for key in self._spans}
+
+
+class LazyContent:
+    """
+    A block's content in a daily file, recorded as a byte offset and length.
+
+    The text is read and decoded on the first ``load`` and kept afterwards;
+    unlike a LazyBlock it doesn't need the reader to stay open. The file's
+    mtime and size are checked before reading, so a file rewritten in the
+    meantime (which moves every block) raises instead of returning other text;
+    JournalDataManager avoids that for its own saves by calling
+    ``load_pending`` (registered as its rewrite hook) before it rewrites a
+    daily file.
+    """
+
+    __slots__ = ("path", "offset", "length", "_stamp", "_value", "__weakref__")
+
+    def __init__(self, path: Union[str, os.PathLike], offset: int, length: int,
+                 stamp: tuple[int, int]):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self._stamp = stamp
+        self._value: Optional[str] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def load(self) -> str:
+        """
+        Return the content, reading it from the file on first use.
+
+        Raises:
+            RuntimeError: If the file changed since the block was listed
+        """
+        if self._value is None:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_mtime_ns, stat.st_size) != self._stamp:
+                    raise RuntimeError(f"{self.path} changed since its blocks were listed; list them again")
+                f.seek(self.offset)
+                self._value = json.loads(f.read(self.length)) or ""
+        return self._value
+
+
+def _pending_key(path: Union[str, os.PathLike]) -> str:
+    return os.path.abspath(path)
+
+
+def load_pending(path: Union[str, os.PathLike]) -> int:
+    """
+    Read the content of every unloaded LazyContent of a daily file still in use.
+
+    Called before the file is rewritten, so blocks listed from it keep their
+    text instead of going stale. Returns how many were loaded; ones that
+    can't be read any more are left to raise on access.
+    """
+    with _pending_lock:
+        proxies = _pending.pop(_pending_key(path), None)
+    loaded = 0
+    for proxy in list(proxies or ()):
+        if proxy.loaded:
+            continue
+        try:
+            proxy.load()
+            loaded += 1
+        except (OSError, RuntimeError, ValueError):
+            continue
+    return loaded
+
+
+register_rewrite_hook(load_pending)
+
+
+def _prune_pending() -> None:
+    """Drop the files whose listed proxies have all been collected."""
+    with _pending_lock:
+        for key in [key for key, proxies in _pending.items() if not proxies]:
+            del _pending[key]
+
+
+def _track_pending(key: str, content: LazyContent) -> None:
+    with _pending_lock:
+        pending = _pending.get(key)
+        if pending is None:
+            pending = _pending[key] = weakref.WeakSet()
+        pending.add(content)
+
+
+class DailyFileReader:
+    """
+    Memory-mapped reader for a single daily file.
+
+    Usage:
+        with DailyFileReader(path) as reader:
+            for block in reader.iter_blocks():
+                print(block["block_name"], block["start_time"], block["end_time"])
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "DailyFileReader":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Open and memory-map the file."""
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"Daily file is empty: {self.path}")
+        stat = os.fstat(self._file.fileno())
+        self._stamp = (stat.st_mtime_ns, stat.st_size)
+
+    def close(self) -> None:
+        """Release the memory map and the file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def decode(self, start: int, end: int) -> Any:
+        """Decode the JSON value stored between two byte offsets."""
+        if self._map is None:
+            raise ValueError("Reader is closed")
+        return json.loads(self._map[start:end])
+
+    def read_header(self) -> Dict[str, Any]:
+        """Return the top-level fields (date, last_updated, ...) without touching the blocks."""
+        return {key: self.decode(start, end)
+                for key, (start, end) in self._scan_object(self._root_start())[0].items()
+                if key != "blocks"}
+
+    def iter_blocks(self) -> Iterator[LazyBlock]:
+        """Yield the blocks of the file one at a time, in file order."""
+        mm = self._map
+        root, _ = self._scan_object(self._root_start(), stop_at="blocks")
+        if "blocks" not in root:
+            return
+        pos = self._skip_whitespace(root["blocks"][0])
+        if mm[pos] != ord('['):
+            raise ValueError("'blocks' is not a list")
+        pos = self._skip_whitespace(pos + 1)
+        if mm[pos] == ord(']'):
+            return
+        while True:
+            if mm[pos] != ord('{'):
+                raise ValueError(f"Block at offset {pos} is not an object")
+            spans, end = self._scan_object(pos)
+            yield LazyBlock(self, spans)
+            pos = self._skip_whitespace(end)
+            if mm[pos] == ord(']'):
+                return
+            if mm[pos] != ord(','):
+                raise ValueError(f"Expected ',' at offset {pos}")
+            pos = self._skip_whitespace(pos + 1)
+
+    def iter_timeblocks(self) -> Iterator["TimeBlock"]:
+        """
+        Yield the blocks as TimeBlocks whose content is a LazyContent proxy.
+
+        Names, times and dates are decoded now; the text is only read when
+        ``block.content`` is accessed, even after the reader is closed. Blocks
+        with times TimeBlock rejects are skipped.
+        """
+        from day_logger.models.timeblock import TimeBlock
+
+        _prune_pending()
+        pending_key = _pending_key(self.path)
+        # A day's blocks mostly share a few date strings: parse each once
+        dates = {}
+        for block in self.iter_blocks():
+            key = block.get("date") or Path(self.path).stem
+            date = dates.get(key)
+            if date is None:
+                date = dates[key] = datetime.fromisoformat(key)
+            if "content" in block:
+                content = LazyContent(self.path, *block.span("content"), self._stamp)
+                _track_pending(pending_key, content)
+            else:
+                content = ""
+            try:
+                yield TimeBlock(block.get("block_name", ""), block.get("start_time", ""),
+                                block.get("end_time", ""), content, date)
+            except ValueError:
+                continue
+
+    def _root_start(self) -> int:
+        if self._map is None:
+            raise ValueError("Reader is closed")
+        pos = self._skip_whitespace(0)
+        if self._map[pos] != ord('{'):
+            raise ValueError("Daily file does not contain a JSON object")
+        return pos
+
+    def _skip_whitespace(self, pos: int) -> int:
+        mm = self._map
+        while mm[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _string_end(self, pos: int) -> int:
+        """Return the offset just past the string starting at ``pos``."""
+        mm = self._map
+        search = pos + 1
+        while True:
+            quote = mm.find(b'"', search)
+            if quote < 0:
+                raise ValueError(f"Unterminated string at offset {pos}")
+            backslashes = 0
+            while mm[quote - 1 - backslashes] == ord('\\'):
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return quote + 1
+            search = quote + 1
+
+    def _value_end(self, pos: int) -> int:
+        """Return the offset just past the JSON value starting at ``pos``."""
+        mm = self._map
+        first = mm[pos]
+        if first == ord('"'):
+            return self._string_end(pos)
+        if first in (ord('{'), ord('[')):
+            depth = 0
+            search = pos
+            while True:
+                match = _STRUCTURAL.search(mm, search)
+                if match is None:
+                    raise ValueError(f"Unterminated container at offset {pos}")
+                char = mm[match.start()]
+                if char == ord('"'):
+                    search = self._string_end(match.start())
+                    continue
+                depth += 1 if char in (ord('{'), ord('[')) else -1
+                search = match.start() + 1
+                if depth == 0:
+                    return search
+        match = _SCALAR_END.search(mm, pos)
+        return match.start() if match else len(mm)
+
+    def _scan_object(self, pos: int,
+                     stop_at: Optional[str] = None) -> tuple[Dict[str, tuple[int, int]], int]:
+        """
+        Map each key of the object at ``pos`` to the byte span of its value.
+
+        Returns the spans and the offset just past the object. With ``stop_at``
+        the scan stops at the start of that key's value instead.
+        """
+        mm = self._map
+        spans: Dict[str, tuple[int, int]] = {}
+        pos = self._skip_whitespace(pos + 1)
+        if mm[pos] == ord('}'):
+            return spans, pos + 1
+        while True:
+            key_end = self._string_end(pos)
+            key = json.loads(mm[pos:key_end])
+            pos = self._skip_whitespace(key_end)
+            if mm[pos] != ord(':'):
+                raise ValueError(f"Expected ':' at offset {pos}")
+            value_start = self._skip_whitespace(pos + 1)
+            if key == stop_at:
+                spans[key] = (value_start, value_start)
+                return spans, value_start
+            value_end = self._value_end(value_start)
+            spans[key] = (value_start, value_end)
+            pos = self._skip_whitespace(value_end)
+            if mm[pos] == ord('}'):
+                return spans, pos + 1
+            if mm[pos] != ord(','):
+                raise ValueError(f"Expected ',' at offset {pos}")
+            pos = self._skip_whitespace(pos + 1)
+
+
+def iter_block_headers(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every block of a daily file as a dictionary without its content.
+
+    Args:
+        path: Path to a YYYY-MM-DD.json daily file.
+
+    Returns:
+        Iterator[Dict[str, Any]]: block_name, start_time, end_time, date, ... per block
+    """
+    with DailyFileReader(path) as reader:
+        for block in reader.iter_blocks():
+            yield block.header()
@@ -0,0 +1,204 @@
+"""
+Interval index module.
+Finds overlapping blocks, gaps and covered time within a day's time blocks,
+and rolls them up over a date range for utilisation reports.
+
+A day's blocks are sorted by start minute once and every query is a single
+sweep over them. Merging and gaps cost O(n log n); listing overlaps also
+costs the size of what it reports, since each stretch names every block
+running in it. Times are minutes since the day's midnight; a block running
+past midnight ends after minute 1440 (reported times wrap to "HH:MM").
+
+Usage:
+    python -m day_logger utilisation --from 2025-02-01 --to 2025-02-28 --window 09:00-18:00
+"""
+
+import bisect
+import heapq
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+from day_logger.models.timeblock import block_duration_minutes, format_minute_of_day, parse_minute_of_day
+
+if TYPE_CHECKING:
+    from day_logger.journal_data_manager import JournalDataManager
+
+
+def _start_minute(block: Any) -> int:
+    start = block.get("start_minute")
+    return start if start is not None else parse_minute_of_day(block.get("start_time", ""))
+
+
+class DayIntervals:
+    """
+    Sorted intervals of one day's blocks.
+
+    Accepts serialized blocks (dicts or LazyBlocks from ``iter_daily_blocks``);
+    blocks with invalid or equal start and end times are left out.
+    """
+
+    def __init__(self, blocks: Iterable[Any]):
+        intervals = []
+        for block in blocks:
+            try:
+                start = _start_minute(block)
+            except ValueError:
+                continue
+            duration = block_duration_minutes(block)
+            if duration:
+                intervals.append((start, start + duration, block.get("block_name", "")))
+        intervals.sort()
+        self.intervals: list[tuple[int, int, str]] = intervals
+        self.merged = self._merge()
+
+    def _merge(self) -> list[tuple[int, int]]:
+        merged: list[list[int]] = []
+        for start, end, _ in self.intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [(start, end) for start, end in merged]
+
+    @property
+    def covered_minutes(self) -> int:
+        """Minutes covered by at least one block (overlaps counted once)."""
+        return sum(end - start for start, end in self.merged)
+
+    @property
+    def span(self) -> Optional[tuple[int, int]]:
+        """(first start, last end), or None for a day without blocks."""
+        return (self.merged[0][0], self.merged[-1][1]) if self.merged else None
+
+    def overlaps(self) -> list[tuple[int, int, list[str]]]:
+        """
+        Return the stretches where two or more blocks run at once.
+
+        Each stretch is (start, end, names of the blocks running); consecutive
+        stretches with the same blocks are joined.
+        """
+        result: list[tuple[int, int, list[str]]] = []
+        active: list[tuple[int, int]] = []  # heap of (end, interval index)
+        names: list[str] = []               # names of the active blocks, kept sorted
+        changed = True                      # names differ from the last reported stretch
+        position = 0
+        now = None
+        while position < len(self.intervals) or active:
+            # Next event: the earliest of the next start and the earliest end
+            next_start = self.intervals[position][0] if position < len(self.intervals) else None
+            next_end = active[0][0] if active else None
+            event = next_end if next_start is None or (next_end is not None and next_end <= next_start) else next_start
+            if now is not None and len(active) >= 2 and event > now:
+                if result and result[-1][1] == now and (not changed or result[-1][2] == names):
+                    result[-1] = (result[-1][0], event, result[-1][2])
+                else:
+                    result.append((now, event, list(names)))
+                    changed = False
+            now = event
+            while active and active[0][0] == event:
+                _, index = heapq.heappop(active)
+                del names[bisect.bisect_left(names, self.intervals[index][2])]
+                changed = True
+            while position < len(self.intervals) and self.intervals[position][0] == event:
+                heapq.heappush(active, (self.intervals[position][1], position))
+                bisect.insort(names, self.intervals[position][2])
+                changed = True
+                position += 1
+        return result
+
+    def gaps(self, window: Optional[tuple[int, int]] = None) -> list[tuple[int, int]]:
+        """
+        Return the uncovered stretches inside ``window`` (start, end minutes).
+
+        Without a window, the gaps between the first start and the last end.
+        """
+        low, high = window or self.span or (0, 0)
+        result = []
+        cursor = low
+        for start, end in self.merged:
+            if end <= cursor:
+                continue
+            if start >= high:
+                break
+            if start > cursor:
+                result.append((cursor, start))
+            cursor = max(cursor, end)
+        if cursor < high:
+            result.append((cursor, high))
+        return result
+
+    def covered_within(self, window: tuple[int, int]) -> int:
+        """Minutes of ``window`` covered by at least one block."""
+        low, high = window
+        return sum(max(0, min(end, high) - max(start, low)) for start, end in self.merged)
+
+    def report(self, window: Optional[tuple[int, int]] = None) -> Dict[str, Any]:
+        """Return covered, overlap and gap minutes and the stretches, with HH:MM times."""
+        overlaps = self.overlaps()
+        gaps = self.gaps(window)
+        span = window or self.span
+        span_minutes = span[1] - span[0] if span else 0
+        covered = self.covered_within(span) if span else 0
+        return {
+            "blocks": len(self.intervals),
+            "covered_minutes": self.covered_minutes,
+            "overlap_minutes": sum(end - start for start, end, _ in overlaps),
+            "gap_minutes": sum(end - start for start, end in gaps),
+            "utilisation": round(covered / span_minutes, 4) if span_minutes else 0.0,
+            "overlaps": [{"start": format_minute_of_day(start), "end": format_minute_of_day(end), "blocks": names}
+                         for start, end, names in overlaps],
+            "gaps": [{"start": format_minute_of_day(start), "end": format_minute_of_day(end)}
+                     for start, end in gaps],
+        }
+
+
+def parse_window(value: str) -> tuple[int, int]:
+    """
+    Parse an "HH:MM-HH:MM" window; an end before the start runs past midnight.
+
+    Raises:
+        ValueError: If the window is malformed
+    """
+    start, sep, end = value.partition("-")
+    if not sep:
+        raise ValueError(f"invalid window {value!r}, expected HH:MM-HH:MM")
+    start_minute, end_minute = parse_minute_of_day(start), parse_minute_of_day(end)
+    if end_minute <= start_minute:
+        end_minute += 24 * 60
+    return start_minute, end_minute
+
+
+def utilisation(manager: "JournalDataManager", start: datetime, end: datetime,
+                window: Optional[tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Build the interval report of every day with blocks between two dates (inclusive).
+
+    Only block names and times are read from the daily files, never the content.
+
+    Args:
+        manager: Data manager owning the daily files.
+        start: First day.
+        end: Last day.
+        window: Optional (start, end) minutes, e.g. working hours, that gaps
+            and utilisation are measured against; defaults to each day's span.
+
+    Returns:
+        Dict[str, Any]: Totals over the range and the report of each day.
+    """
+    files = manager.list_daily_files(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+    days = {}
+    for day in files:
+        intervals = DayIntervals(manager.iter_daily_blocks(datetime.strptime(day, "%Y-%m-%d")))
+        if intervals.intervals:
+            days[day] = intervals.report(window)
+    totals = {key: sum(report[key] for report in days.values())
+              for key in ("blocks", "covered_minutes", "overlap_minutes", "gap_minutes")}
+    return {
+        "from": start.strftime("%Y-%m-%d"),
+        "to": end.strftime("%Y-%m-%d"),
+        "window": [format_minute_of_day(minute) for minute in window] if window else None,
+        "days_with_entries": len(days),
+        **totals,
+        "days_with_overlaps": sum(1 for report in days.values() if report["overlaps"]),
+        "days": days,
+    }
@@ -1,62 +1,110 @@
 import json
+import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, Optional
+from day_logger.models.timeblock import compute_block_hash
+from day_logger import month_summary
+from day_logger.utils import file_lock, instrumentation
+from day_logger.utils.cache import DocumentCache
+
+logger = logging.getLogger(__name__)
+
+# Called with a daily file's path right before it is replaced (see register_rewrite_hook)
+_rewrite_hooks: list[Callable[[Path], Any]] = []
+
+def register_rewrite_hook(hook: Callable[[Path], Any]) -> None:
+    """
+    Call ``hook(path)`` before every daily file rewrite by save_daily_timeblocks.
+
+    DailyFileReader registers one so blocks it listed from the file read their
+    content while it is still the file they were listed from.
+    """
+    if hook not in _rewrite_hooks:
+        _rewrite_hooks.append(hook)
+
+if TYPE_CHECKING:
+    from day_logger.daily_file_reader import LazyBlock
+    from day_logger.models.timeblock import TimeBlock
 
 class JournalDataManager:
-    def __init__(self, base_path: str = "journal_entries"):
-        """Initialize the data manager with base path for saving entries."""
+    def __init__(self, base_path: str = "journal_entries", cache_size: int = 64,
+                 daily_root: str = "work-logs"):
+        """
+        Initialize the data manager with base path for saving entries.
+
+        Daily time block files are kept under ``daily_root``/YYYY/daily.
+
+        Parsed entry and day files are kept in an LRU cache of ``cache_size``
+        documents (0 disables it). Documents returned by the read methods may
+        be shared with the cache and should not be modified in place.
+        """
         self.base_path = Path(base_path)
+        self.daily_root = Path(daily_root)
+        self.cache = DocumentCache(max_entries=cache_size)
         self._ensure_base_directory()
 
     def _ensure_base_directory(self) -> None:
         """Create base directory structure if it doesn't exist."""
         self.base_path.mkdir(parents=True, exist_ok=True)
 
+    def get_entry_folder(self, date: datetime) -> Path:
+        """Return the folder holding the journal entries of a day."""
+        year_month = date.strftime("%y-%m")  # YY-MM
+        week_folder = f"w{date.strftime('%V')}-{date.strftime('%m-%d')}"  # [w]ww-MM-dd
+        day_folder = date.strftime("%a-%d-%m-%y")  # ddd-DD-MM-YY
+        return self.base_path / year_month / week_folder / day_folder
+
     def _create_timestamp_folders(self) -> Path:
         """Create timestamp-based folder structure and return the path."""
-        now = datetime.now()
-        
-        # Create folder paths
-        year_month = now.strftime("%y-%m")  # YY-MM
-        week_folder = f"w{now.strftime('%V')}-{now.strftime('%m-%d')}"  # [w]ww-MM-dd
-        day_folder = now.strftime("%a-%d-%m-%y")  # ddd-DD-MM-YY
-        
-        # Create complete path
-        entry_path = self.base_path / year_month / week_folder / day_folder
-        entry_path.mkdir(parents=True, exist_ok=True)
-        
-        return entry_path
+        with instrumentation.timer("create_timestamp_folders"):
+            entry_path = self.get_entry_folder(datetime.now())
+            entry_path.mkdir(parents=True, exist_ok=True)
+            
+            return entry_path
 
     def collect_entry_data(self, task_journal_instance) -> Dict[str, Any]:
         """Collect all data from the task journal widgets using stored references."""
-        entry_data = {
-            "timestamp": datetime.now().isoformat(),
-            "time_blocks": {}
-        }
- 
-        for key, widgets in task_journal_instance.entry_widgets.items():
-            start_time = widgets["start"].get()
-            end_time = widgets["end"].get()
-            content = widgets["text"].get('1.0', 'end-1c')
-            placeholder = f"Enter your {key} tasks here..."
-            if content.strip() == placeholder:
-                content = ""
-            entry_data["time_blocks"][key] = {
-                "start_time": start_time,
-                "end_time": end_time,
-                "content": content
+        with instrumentation.timer("collect_entry_data"):
+            entry_data = {
+                "timestamp": datetime.now().isoformat(),
+                "time_blocks": {}
             }
- 
-        return entry_data
+     
+            for key in task_journal_instance.entry_widgets:
+                entry_data["time_blocks"][key] = self.collect_block_data(task_journal_instance, key)
+     
+            return entry_data
+
+    def collect_block_data(self, task_journal_instance, key: str) -> Dict[str, str]:
+        """Collect the start/end times and content of a single time block."""
+        widgets = task_journal_instance.entry_widgets[key]
+        start_time = widgets["start"].get()
+        end_time = widgets["end"].get()
+        content = widgets["text"].get('1.0', 'end-1c')
+        placeholder = f"Enter your {key} tasks here..."
+        if content.strip() == placeholder:
+            content = ""
+        return {
+            "start_time": start_time,
+            "end_time": end_time,
+            "content": content
+        }
 
     def save_entry(self, task_journal_instance) -> tuple[bool, str]:
         """Save the journal entry to a JSON file."""
         try:
             # Collect the data
             entry_data = self.collect_entry_data(task_journal_instance)
-            
+        except Exception as e:
+            return False, f"Error saving entry: {str(e)}"
+
+        return self.save_entry_data(entry_data)
+
+    def save_entry_data(self, entry_data: Dict[str, Any]) -> tuple[bool, str]:
+        """Save an already collected journal entry; never touches widgets."""
+        try:
             # Create timestamp folders
             entry_path = self._create_timestamp_folders()
             
@@ -66,22 +114,83 @@ class JournalDataManager:
             
             # Save the entry as a JSON file
             file_path = entry_path / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(entry_data, f, indent=2)
+            self._write_json(file_path, entry_data, "save_entry")
+            self.cache.invalidate(file_path)
             
             return True, f"Entry saved successfully to {file_path}"
 
         except Exception as e:
             return False, f"Error saving entry: {str(e)}"
 
+    def save_entries(self, entries: list[Dict[str, Any]]) -> list[tuple[bool, str]]:
+        """
+        Save a batch of collected entries, creating and listing each folder once.
+
+        Unlike ``save_entry_data``, every entry is filed under the day and time
+        of its own "timestamp", so entries written late (e.g. from a
+        write-behind queue or an import) land where they belong. Entries from
+        the same second get a numeric suffix instead of overwriting each other.
+
+        Args:
+            entries (list[Dict[str, Any]]): Entries as returned by collect_entry_data.
+
+        Returns:
+            list[tuple[bool, str]]: A (success, message) pair per entry, in input order.
+        """
+        results: list[tuple[bool, str]] = [(False, "")] * len(entries)
+        by_folder: Dict[Path, list[tuple[int, datetime]]] = {}
+        for index, entry_data in enumerate(entries):
+            try:
+                timestamp = datetime.fromisoformat(entry_data["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                timestamp = datetime.now()
+            by_folder.setdefault(self.get_entry_folder(timestamp), []).append((index, timestamp))
+
+        for folder, items in by_folder.items():
+            try:
+                folder.mkdir(parents=True, exist_ok=True)
+                taken = set(os.listdir(folder))
+            except OSError as e:
+                for index, _ in items:
+                    results[index] = (False, f"Error saving entry: {str(e)}")
+                continue
+            for index, timestamp in items:
+                stem = f"journal_entry_{timestamp.strftime('%H-%M-%S')}"
+                filename, suffix = f"{stem}.json", 1
+                while filename in taken:
+                    suffix += 1
+                    filename = f"{stem}_{suffix}.json"
+                taken.add(filename)
+                file_path = folder / filename
+                try:
+                    self._write_json(file_path, entries[index], "save_entry")
+                    self.cache.invalidate(file_path)
+                    results[index] = (True, f"Entry saved successfully to {file_path}")
+                except Exception as e:
+                    results[index] = (False, f"Error saving entry: {str(e)}")
+        return results
+
     def load_latest_entry(self) -> Dict[str, Any]:
-        """Load the most recent journal entry."""
+        """
+        Load the most recent journal entry.
+
+        The newest loose file wins unless it belongs to an earlier day than
+        the last archived day, in which case the last entry of that day is
+        read from its archive.
+        """
         try:
             # Find the most recent entry
             latest_file = None
             latest_time = None
             
-            for root, _, files in os.walk(self.base_path):
+            for root, dirs, files in os.walk(self.base_path):
+                # Autosave drafts, archive indexes and month summaries (which
+                # live in daily_root/YYYY/summary, inside base_path when both
+                # are the same folder) are not journal entries
+                if Path(root) == self.base_path:
+                    dirs[:] = [d for d in dirs if d not in ("drafts", "archive")]
+                if Path(root).parent == self.daily_root:
+                    dirs[:] = [d for d in dirs if d != "summary"]
                 for file in files:
                     if file.endswith('.json'):
                         file_path = Path(root) / file
@@ -91,9 +200,12 @@ class JournalDataManager:
                             latest_time = file_time
                             latest_file = file_path
 
+            archived_day, archived_entry = self._latest_archived_entry()
+            if archived_entry is not None and (latest_file is None
+                                               or self._entry_day(latest_file) < archived_day):
+                return archived_entry
             if latest_file:
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self.cache.load(latest_file)
             
             return {}
 
@@ -102,31 +214,176 @@ class JournalDataManager:
             return {}
 
     def get_entries_by_date(self, date: datetime) -> list[Dict[str, Any]]:
-        """Retrieve all entries for a specific date."""
+        """
+        Retrieve all entries for a specific date (served from the cache when unchanged).
+
+        Days packed into a month or year archive are read from it with a
+        single seek; loose files of the same day are returned as well, and
+        replace the archived entry of the same file name.
+        """
         try:
             # Create the path for the specified date
-            year_month = date.strftime("%y-%m")
-            week_folder = f"w{date.strftime('%V')}-{date.strftime('%m-%d')}"
-            day_folder = date.strftime("%a-%d-%m-%y")
+            target_path = self.get_entry_folder(date)
             
-            target_path = self.base_path / year_month / week_folder / day_folder
-            
-            entries = []
+            entries = self._archived_entries(date)
             if target_path.exists():
                 for file in target_path.glob("*.json"):
-                    with open(file, 'r', encoding='utf-8') as f:
-                        entries.append(json.load(f))
+                    entries[file.name] = self.cache.load(file)
             
-            return entries
+            return list(entries.values())
 
         except Exception as e:
             print(f"Error retrieving entries: {str(e)}")
         return []
 
+    @staticmethod
+    def _entry_day(file_path: Path) -> str:
+        """Return the YYYY-MM-DD of an entry file from its ddd-DD-MM-YY folder ("" if it isn't in one)."""
+        try:
+            return datetime.strptime(file_path.parent.name[-8:], "%d-%m-%y").strftime("%Y-%m-%d")
+        except ValueError:
+            return ""
+
+    def _latest_archived_entry(self) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return the last archived day (YYYY-MM-DD) and its last entry, or (None, None)."""
+        archive_dir = self.base_path / "archive"
+        if not archive_dir.is_dir():
+            return None, None
+        from day_logger.archive import EntryArchive, archive_paths
+
+        latest = None
+        for index_path in archive_dir.glob("*.index.json"):
+            index = self.cache.load(index_path)
+            if index["days"]:
+                day = max(index["days"])
+                if latest is None or day > latest[0]:
+                    latest = (day, index_path, index)
+        if latest is None:
+            return None, None
+        day, index_path, index = latest
+        data_path, _ = archive_paths(self.base_path, index["period"])
+        records = EntryArchive(data_path, index_path, index).read_records(day)
+        # Entry files are named after their time of day, so the largest name is the last one
+        return day, max(records, key=lambda record: record["name"])["entry"]
+
+    def _archived_entries(self, date: datetime) -> Dict[str, Dict[str, Any]]:
+        """Return file name -> entry for a day found in its month or year archive."""
+        archive_dir = self.base_path / "archive"
+        if not archive_dir.is_dir():
+            return {}
+        from day_logger.archive import EntryArchive, archive_paths
+
+        day = date.strftime("%Y-%m-%d")
+        for period in (date.strftime("%Y-%m"), date.strftime("%Y")):
+            data_path, index_path = archive_paths(self.base_path, period)
+            if index_path.exists():
+                archive = EntryArchive(data_path, index_path, self.cache.load(index_path))
+                if day in archive:
+                    return {record["name"]: record["entry"] for record in archive.read_records(day)}
+        return {}
+
+    def get_daily_file_path(self, date: datetime) -> Path:
+        """Return the path of the daily time block file (work-logs/YYYY/daily/YYYY-MM-DD.json)."""
+        return self.daily_root / date.strftime("%Y") / "daily" / f"{date.strftime('%Y-%m-%d')}.json"
+
+    def list_daily_files(self, start: Optional[str] = None,
+                         end: Optional[str] = None) -> Dict[str, tuple[Path, int, int]]:
+        """
+        List the daily files in a date range without reading them.
+
+        Args:
+            start (str, optional): First day (YYYY-MM-DD), inclusive.
+            end (str, optional): Last day (YYYY-MM-DD), inclusive.
+
+        Returns:
+            Dict[str, tuple[Path, int, int]]: date -> (path, mtime_ns, size), sorted by date.
+        """
+        files = {}
+        for path in self.daily_root.glob("*/daily/*.json"):
+            day = path.stem
+            if (start and day < start) or (end and day > end):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files[day] = (path, stat.st_mtime_ns, stat.st_size)
+        return dict(sorted(files.items()))
+
+    def get_month_summary(self, year: int, month: int) -> Dict[str, Any]:
+        """
+        Return the days with blocks, block counts and hours logged in a month.
+
+        Reads one small per-month summary file kept up to date on save, so a
+        month's totals (the TaskJournal status line, the ``summary`` command)
+        don't require opening its daily files.
+
+        Args:
+            year (int): Four-digit year.
+            month (int): Month number (1-12).
+
+        Returns:
+            Dict[str, Any]: {"month", "days_with_entries", "blocks", "hours",
+            "days": {"YYYY-MM-DD": {"blocks", "hours"}}}; shared with the cache,
+            so it must not be modified in place.
+        """
+        return month_summary.month_summary(self, year, month)
+
+    def iter_daily_blocks(self, date: datetime) -> Iterator["LazyBlock"]:
+        """
+        Yield the time blocks saved for a day without decoding their content.
+
+        The file is memory-mapped and scanned lazily, so listing names and times
+        of a large daily file never materializes the content strings. A block's
+        content can still be read during iteration through ``block.content``.
+
+        Args:
+            date (datetime): The day to read.
+
+        Returns:
+            Iterator[LazyBlock]: The blocks in file order (newest first).
+        """
+        file_path = self.get_daily_file_path(date)
+        if not file_path.exists():
+            return
+        from day_logger.daily_file_reader import DailyFileReader
+
+        with DailyFileReader(file_path) as reader:
+            yield from reader.iter_blocks()
+
+    def load_timeblocks(self, date: datetime) -> list["TimeBlock"]:
+        """
+        Return the time blocks saved for a day, with their content loaded lazily.
+
+        Each block's content is a proxy holding its offset and length in the
+        daily file; the text is read on first access of ``block.content``.
+        Scans that only need names, times or durations never load it.
+
+        Args:
+            date (datetime): The day to read.
+
+        Returns:
+            list[TimeBlock]: The blocks in file order (newest first).
+        """
+        file_path = self.get_daily_file_path(date)
+        if not file_path.exists():
+            return []
+        from day_logger.daily_file_reader import DailyFileReader
+
+        with DailyFileReader(file_path) as reader:
+            return list(reader.iter_timeblocks())
+
     def save_daily_timeblocks(self, blocks: list["TimeBlock"]) -> tuple[bool, str]:
         """
-        Save a list of time blocks to the 'work-logs/2025/daily' folder,
+        Save a list of time blocks to the 'work-logs/YYYY/daily' folder,
         storing them in a JSON file named after the date (YYYY-MM-DD.json).
+
+        Blocks are deduplicated by a hash of their name, times and content,
+        kept in the file's "block_hashes" index, so saving the same journal
+        twice leaves the file untouched. The read-merge-write runs under the
+        day file's lock, so concurrent writers of one day (threads or other
+        processes) are serialized while other days are written in parallel.
+        The month's summary (see ``get_month_summary``) is updated as well.
         
         Args:
             blocks (list[TimeBlock]): The list of TimeBlock objects to save.
@@ -135,34 +392,165 @@ class JournalDataManager:
             (bool, str): A tuple containing a success flag and a message.
         """
         try:
-            from pathlib import Path
-            daily_path = Path('work-logs/2025/daily')
-            daily_path.mkdir(parents=True, exist_ok=True)
-            
             if not blocks:
                 return False, "No blocks to save."
             
             date_str = blocks[0].date.strftime("%Y-%m-%d")
-            filename = f"{date_str}.json"
-            file_path = daily_path / filename
-            
-            # Convert blocks to JSON format
-            blocks_data = {
-                "date": date_str,
-                "blocks": [block.to_json() for block in blocks],
-                "last_updated": datetime.now().isoformat()
-            }
-            
-            # Save as JSON, preserving any existing blocks for the same day
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    existing_blocks = existing_data.get("blocks", [])
-                    blocks_data["blocks"].extend(existing_blocks)
+            file_path = self.get_daily_file_path(blocks[0].date)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Read-merge-write under the day's lock so concurrent writers don't lose blocks
+            with file_lock.locked(file_path):
+                # Existing blocks for the same day and their hash index
+                existing_blocks, existing_hashes, stored_count = [], [], 0
+                if file_path.exists():
+                    with instrumentation.timer("save_daily_timeblocks.read"):
+                        existing_data = self.cache.load(file_path)
+                    stored_count = len(existing_data.get("blocks", []))
+                    existing_blocks, existing_hashes = self._unique_blocks(
+                        existing_data.get("blocks", []), existing_data.get("block_hashes"))
+                seen = set(existing_hashes)
+
+                # Convert blocks to JSON format, skipping the ones already stored
+                new_blocks, new_hashes = [], []
+                for block in blocks:
+                    block_json = block.to_json()
+                    block_hash = compute_block_hash(block_json)
+                    if block_hash in seen:
+                        continue
+                    seen.add(block_hash)
+                    new_blocks.append(block_json)
+                    new_hashes.append(block_hash)
+
+                # Nothing new and nothing to compact: keep the file as it is
+                if not new_blocks and len(existing_blocks) == stored_count:
+                    return True, f"Time blocks already saved in {file_path}"
+
+                # Newest blocks first, followed by the ones already in the file
+                blocks_data = {
+                    "date": date_str,
+                    "blocks": new_blocks + existing_blocks,
+                    "block_hashes": new_hashes + existing_hashes,
+                    "last_updated": datetime.now().isoformat()
+                }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(blocks_data, f, indent=2)
+                for hook in _rewrite_hooks:
+                    hook(file_path)
+                self._write_json(file_path, blocks_data, "save_daily_timeblocks")
+                self.cache.invalidate(file_path)
+                with instrumentation.timer("save_daily_timeblocks.month_summary"):
+                    month_summary.update_day(self, date_str, blocks_data["blocks"])
             
-            return True, f"Time blocks saved successfully to {file_path}"
+                return True, f"Time blocks saved successfully to {file_path}"
         except Exception as e:
             return False, f"Error saving time blocks: {str(e)}"
+
+    def _write_json(self, file_path: Path, data: Dict[str, Any], operation: str) -> None:
+        """
+        Encode ``data`` and write it to ``file_path``, timing both steps separately.
+
+        The payload goes to a temporary file in the same folder that then
+        replaces the target, so a reader that has the old file open or
+        mmapped (DailyFileReader) keeps seeing it whole instead of a
+        truncated file.
+        """
+        with instrumentation.timer(f"{operation}.json_encode"):
+            payload = json.dumps(data, indent=2)
+        with instrumentation.timer(f"{operation}.write"):
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        instrumentation.count("files_written")
+        instrumentation.count("bytes_written", len(payload))
+
+    def _unique_blocks(self, blocks: list[Dict[str, Any]],
+                       block_hashes: Optional[list[str]]) -> tuple[list[Dict[str, Any]], list[str]]:
+        """
+        Return a day's blocks without duplicates, along with their hashes.
+
+        The stored index is trusted when it lines up with the blocks; files
+        written before the index existed are hashed and compacted here.
+        """
+        if block_hashes is not None and len(block_hashes) == len(blocks):
+            return blocks, block_hashes
+        unique_blocks, hashes, seen = [], [], set()
+        for block in blocks:
+            block_hash = compute_block_hash(block)
+            if block_hash not in seen:
+                seen.add(block_hash)
+                unique_blocks.append(block)
+                hashes.append(block_hash)
+        return unique_blocks, hashes
+
+    def _drafts_path(self, date: Optional[datetime] = None) -> Path:
+        """Return the folder holding the autosave drafts of a day."""
+        date = date or datetime.now()
+        return self.base_path / "drafts" / date.strftime("%Y-%m-%d")
+
+    def save_draft(self, block_key: str, block_data: Dict[str, Any],
+                   date: Optional[datetime] = None) -> tuple[bool, str]:
+        """
+        Save an autosave draft for a single time block.
+
+        Each block gets its own small file, so an edit only rewrites that block.
+        The file is written to a temporary name and swapped in, so a crash
+        mid-write keeps the previous draft.
+
+        Args:
+            block_key (str): Block key as used in entry_widgets, e.g. "morning".
+            block_data (Dict[str, Any]): start_time, end_time and content of the block.
+            date (datetime, optional): Day the draft belongs to, defaults to today.
+
+        Returns:
+            (bool, str): A tuple containing a success flag and a message.
+        """
+        try:
+            drafts_path = self._drafts_path(date)
+            drafts_path.mkdir(parents=True, exist_ok=True)
+            draft = dict(block_data, block=block_key, saved_at=datetime.now().isoformat())
+            file_path = drafts_path / f"{block_key}.json"
+            tmp_path = file_path.with_suffix(".json.tmp")
+            with instrumentation.timer("save_draft.write"):
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(draft, f)
+                os.replace(tmp_path, file_path)
+            return True, f"Draft saved to {file_path}"
+        except Exception as e:
+            return False, f"Error saving draft: {str(e)}"
+
+    def load_drafts(self, date: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """Load the autosave drafts of a day, keyed by block."""
+        drafts = {}
+        drafts_path = self._drafts_path(date)
+        if not drafts_path.exists():
+            return drafts
+        for file in drafts_path.glob("*.json"):
+            try:
+                with open(file, 'r', encoding='utf-8') as f:
+                    draft = json.load(f)
+                drafts[draft.get("block", file.stem)] = draft
+            except (OSError, ValueError) as e:
+                logger.warning(f"Error loading draft {file}: {str(e)}")
+        return drafts
+
+    def clear_drafts(self, date: Optional[datetime] = None) -> tuple[bool, str]:
+        """
+        Remove the autosave drafts of a day, e.g. after the journal was saved.
+
+        A draft written while clearing is left in place rather than failing.
+
+        Returns:
+            (bool, str): A tuple containing a success flag and a message.
+        """
+        drafts_path = self._drafts_path(date)
+        if not drafts_path.exists():
+            return True, "No drafts to clear"
+        for file in drafts_path.iterdir():
+            file.unlink(missing_ok=True)
+        try:
+            drafts_path.rmdir()
+        except OSError:
+            # A new draft landed in the folder meanwhile; keep it
+            pass
+        return True, f"Drafts cleared from {drafts_path}"
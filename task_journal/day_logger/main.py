@@ -10,13 +10,22 @@ from datetime import datetime
 from day_logger.processors.data_processor import DataProcessor
 from day_logger.utils.formatters import OutputFormatter
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for scripts built on this module.
+
+    Importing the module leaves logging untouched; entry points call this.
+
+    Args:
+        level (int): Minimum level of the messages to show
+    """
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
 def process_data(input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Process incoming data and transform it according to business rules.
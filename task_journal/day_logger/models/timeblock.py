@@ -1,23 +1,149 @@
-from dataclasses import dataclass
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional
 
-@dataclass
+MINUTES_PER_DAY = 24 * 60
+
+# Time string attributes of a TimeBlock and the minute attributes parsed from them
+_TIME_FIELDS = {"start_time": "start_minute", "end_time": "end_minute"}
+
+# A day has 1440 valid times, seen over and over when loading many blocks:
+# parse and format each one once (invalid times raise and are not cached).
+@lru_cache(maxsize=4096)
+def parse_minute_of_day(value: str) -> int:
+    """
+    Parse an "HH:MM" (or "H:MM") time into minutes since midnight.
+
+    Raises:
+        ValueError: If the value is not a valid time of day
+    """
+    hours, sep, minutes = str(value).strip().partition(":")
+    if not sep or not hours.isdigit() or len(minutes) != 2 or not minutes.isdigit():
+        raise ValueError(f"invalid time {value!r}, expected HH:MM")
+    hours, minutes = int(hours), int(minutes)
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"invalid time {value!r}, expected HH:MM")
+    return hours * 60 + minutes
+
+@lru_cache(maxsize=MINUTES_PER_DAY * 2)
+def format_minute_of_day(minute: int) -> str:
+    """Format minutes since midnight as "HH:MM"; minutes past the next midnight wrap around."""
+    minute %= MINUTES_PER_DAY
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def span_minutes(start_minute: int, end_minute: int) -> int:
+    """Minutes from start to end; an end before the start falls on the next day."""
+    return (end_minute - start_minute) % MINUTES_PER_DAY
+
+def block_duration_minutes(block_data: dict) -> int:
+    """
+    Return the duration of a serialized block in minutes.
+
+    Uses the stored ``duration_minutes`` when present; blocks saved before it
+    was stored are parsed from their time strings, and invalid times count as 0.
+    """
+    duration = block_data.get("duration_minutes")
+    if duration is not None:
+        return duration
+    try:
+        return span_minutes(parse_minute_of_day(block_data.get("start_time", "")),
+                            parse_minute_of_day(block_data.get("end_time", "")))
+    except ValueError:
+        return 0
+
+def compute_block_hash(block_data: dict) -> str:
+    """
+    Return a stable hash of a serialized block's name, times and content.
+
+    The block's date is left out on purpose: saving the same journal twice
+    stamps a new date on each block, but it is still the same block.
+    """
+    key = json.dumps([
+        block_data.get("block_name", ""),
+        block_data.get("start_time", ""),
+        block_data.get("end_time", ""),
+        (block_data.get("content") or "").strip()
+    ], ensure_ascii=False)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+@dataclass(init=False, eq=False)
 class TimeBlock:
     """
     Represents a block of time-based tasks in a single day.
     
     Attributes:
         block_name: e.g. "Morning Tasks", "Mid-day Tasks", "Evening Tasks"
-        start_time: string from spinbox e.g. "08:00"
-        end_time:   string from spinbox e.g. "12:00"
-        content:    actual user-entered text describing tasks
+        start_time: string from spinbox e.g. "08:00" (normalized to HH:MM)
+        end_time:   string from spinbox e.g. "12:00" (normalized to HH:MM)
+        content:    actual user-entered text describing tasks, or a lazy
+                    proxy (see ``DailyFileReader.iter_timeblocks``) whose
+                    text is only read from disk on first access
         date:       date (defaults to current date if not given)
+        start_minute: start_time as minutes since midnight
+        end_minute:   end_time as minutes since midnight
+
+    The times are parsed when set, on construction or by assigning
+    ``start_time``/``end_time`` later, which raises ValueError for an invalid
+    time and keeps the minutes and duration in step; the minutes themselves
+    are read-only. A block whose end is before its start runs past midnight.
+    The content is left out of repr, so printing a block never reads a lazy
+    proxy from disk; equality compares it last, loading it only when
+    everything else matches.
     """
     block_name: str
     start_time: str
     end_time: str
-    content: str
-    date: datetime = datetime.now()
+    date: datetime
+    _content: Any = field(repr=False)
+    start_minute: int = field(init=False, repr=False)
+    end_minute: int = field(init=False, repr=False)
+
+    def __init__(self, block_name: str, start_time: str, end_time: str, content: Any,
+                 date: Optional[datetime] = None):
+        start_minute = parse_minute_of_day(start_time)
+        end_minute = parse_minute_of_day(end_time)
+        # Filled in directly: __setattr__ is for later changes, and would cost
+        # more than the rest of the constructor on this hot path
+        fields = self.__dict__
+        fields["block_name"] = block_name
+        fields["start_time"] = format_minute_of_day(start_minute)
+        fields["end_time"] = format_minute_of_day(end_minute)
+        fields["date"] = date if date is not None else datetime.now()
+        fields["_content"] = content
+        fields["start_minute"] = start_minute
+        fields["end_minute"] = end_minute
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _TIME_FIELDS:
+            minute = parse_minute_of_day(value)
+            object.__setattr__(self, _TIME_FIELDS[name], minute)
+            value = format_minute_of_day(minute)
+            # The duration is cached on first use
+            self.__dict__.pop("duration_minutes", None)
+        elif name in _TIME_FIELDS.values():
+            raise AttributeError(f"{name} is derived from the time strings; set start_time/end_time instead")
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.block_name, self.start_time, self.end_time, self.date)
+                == (other.block_name, other.start_time, other.end_time, other.date)
+                and self.content == other.content)
+
+    @cached_property
+    def duration_minutes(self) -> int:
+        """Length of the block in minutes."""
+        return span_minutes(self.start_minute, self.end_minute)
+
+    @property
+    def crosses_midnight(self) -> bool:
+        """True when the block ends on the next day."""
+        return self.end_minute < self.start_minute
     
     def to_text(self) -> str:
         """
@@ -38,6 +164,55 @@ class TimeBlock:
             "block_name": self.block_name,
             "start_time": self.start_time,
             "end_time": self.end_time,
+            "start_minute": self.start_minute,
+            "end_minute": self.end_minute,
+            "duration_minutes": self.duration_minutes,
             "content": self.content.strip(),
             "date": self.date.isoformat()
         }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any], date: Optional[datetime] = None) -> "TimeBlock":
+        """
+        Build a TimeBlock from a dictionary produced by ``to_json``.
+
+        Args:
+            data: A serialized block.
+            date: The block's date, used instead of parsing ``data["date"]``
+                (e.g. a parsed date shared by many blocks).
+
+        Returns:
+            TimeBlock: The block; stored minutes and durations are recomputed
+            from the time strings, and the name is interned, since a journal
+            repeats the same few block names every day.
+
+        Raises:
+            KeyError: If the block has no name, or no date and none is given
+            ValueError: If the date or a time is invalid
+        """
+        return cls(sys.intern(data["block_name"]), data.get("start_time", ""), data.get("end_time", ""),
+                   data.get("content") or "",
+                   date if date is not None else datetime.fromisoformat(data["date"]))
+
+    def content_hash(self) -> str:
+        """
+        Returns the hash used to detect duplicate blocks within a daily file.
+        """
+        return compute_block_hash(self.to_json())
+
+    @property
+    def content(self) -> str:
+        """The block's text, read from disk on first access if lazy."""
+        content = self._content
+        if not isinstance(content, str):
+            content = self._content = content.load()
+        return content
+
+    @content.setter
+    def content(self, value: Any) -> None:
+        self._content = value
+
+    @property
+    def content_loaded(self) -> bool:
+        """False while the content is still a lazy proxy that hasn't been read."""
+        return isinstance(self._content, str) or self._content.loaded
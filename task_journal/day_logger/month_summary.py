@@ -0,0 +1,127 @@
+"""
+Month summary module.
+Keeps one small summary file per month of daily files, so which days have
+blocks and how many hours were logged can be read without opening every
+day's file.
+
+A summary lives next to the daily files of its year:
+    work-logs/2025/summary/2025-02.json
+    {"month": "2025-02", "days_with_entries": 1, "blocks": 2, "hours": 3.5,
+     "days": {"2025-02-14": {"blocks": 2, "hours": 3.5}}}
+
+JournalDataManager.save_daily_timeblocks updates the day that was saved; a
+month without a summary file (older data, files copied in by hand) is built
+from its daily files on first lookup. Lookups go through the manager's
+document cache, so repeated reads of a month cost one ``stat``.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable
+
+from day_logger.models.timeblock import block_duration_minutes
+from day_logger.utils import file_lock
+
+if TYPE_CHECKING:
+    from day_logger.journal_data_manager import JournalDataManager
+
+SUMMARY_DIR = "summary"
+
+
+def summary_path(manager: "JournalDataManager", year: int, month: int) -> Path:
+    """Return the summary file of a month (work-logs/YYYY/summary/YYYY-MM.json)."""
+    return manager.daily_root / f"{year:04d}" / SUMMARY_DIR / f"{year:04d}-{month:02d}.json"
+
+
+def day_summary(blocks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the block count and logged hours of a day's serialized blocks."""
+    count, minutes = 0, 0
+    for block in blocks:
+        count += 1
+        minutes += block_duration_minutes(block)
+    return {"blocks": count, "hours": round(minutes / 60, 2)}
+
+
+def _with_totals(month: str, days: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    days = dict(sorted((day, info) for day, info in days.items() if info["blocks"]))
+    return {
+        "month": month,
+        "days_with_entries": len(days),
+        "blocks": sum(info["blocks"] for info in days.values()),
+        "hours": round(sum(info["hours"] for info in days.values()), 2),
+        "days": days,
+    }
+
+
+def _write(manager: "JournalDataManager", path: Path, summary: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    os.replace(tmp_path, path)
+    # Keep the new summary cached so the next save or lookup doesn't parse it again
+    manager.cache.store(path, summary)
+
+
+def _scan_month(manager: "JournalDataManager", year: int, month: int) -> Dict[str, Any]:
+    prefix = f"{year:04d}-{month:02d}"
+    days = {}
+    for path in (manager.daily_root / f"{year:04d}" / "daily").glob(f"{prefix}-*.json"):
+        try:
+            days[path.stem] = day_summary(manager.cache.load(path).get("blocks", []))
+        except (OSError, ValueError):
+            continue
+    return _with_totals(prefix, days)
+
+
+def rebuild_month(manager: "JournalDataManager", year: int, month: int) -> Dict[str, Any]:
+    """Recompute a month's summary from its daily files and store it (empty months are not stored)."""
+    path = summary_path(manager, year, month)
+    summary = _scan_month(manager, year, month)
+    if not summary["days"] and not path.exists():
+        return summary
+    with file_lock.locked(path):
+        # Scan again under the lock so a concurrent save isn't overwritten
+        summary = _scan_month(manager, year, month)
+        _write(manager, path, summary)
+    return summary
+
+
+def update_day(manager: "JournalDataManager", day: str, blocks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Record the blocks now stored for ``day`` (YYYY-MM-DD) in its month's summary.
+
+    Args:
+        manager: Data manager owning the daily files.
+        day: The day that was saved.
+        blocks: All serialized blocks of that day after the save.
+
+    Returns:
+        Dict[str, Any]: The updated month summary.
+    """
+    year, month = int(day[:4]), int(day[5:7])
+    path = summary_path(manager, year, month)
+    with file_lock.locked(path):
+        try:
+            days = dict(manager.cache.load(path)["days"])
+        except (OSError, ValueError, KeyError):
+            # No usable summary yet: start from what is already on disk
+            days = dict(_scan_month(manager, year, month)["days"])
+        days[day] = day_summary(blocks)
+        summary = _with_totals(day[:7], days)
+        _write(manager, path, summary)
+    return summary
+
+
+def month_summary(manager: "JournalDataManager", year: int, month: int) -> Dict[str, Any]:
+    """
+    Return the summary of a month, building it on the first lookup.
+
+    The returned dict may be shared with the document cache and must not be
+    modified in place.
+    """
+    try:
+        return manager.cache.load(summary_path(manager, year, month))
+    except (OSError, ValueError):
+        return rebuild_month(manager, year, month)
@@ -0,0 +1,162 @@
+"""
+Background save worker module.
+Runs journal saves on a dedicated thread so the GUI never blocks on disk I/O.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BackgroundSaveWorker:
+    """
+    Writer thread fed by a queue of entry snapshots.
+
+    The GUI takes a snapshot of its widgets on the UI thread and submits it;
+    building and writing happen on the worker thread. Snapshots submitted
+    with a key (e.g. a block's autosave draft) replace older ones of the same
+    key that the worker hasn't got to yet; snapshots without a key, such as
+    entry saves, are additive and always saved.
+    Results are parked in a completion queue and handed to their callbacks by
+    ``process_completed``, which the GUI calls from a ``root.after`` loop so
+    callbacks always run on the UI thread.
+    """
+
+    def __init__(self, save_func: Callable[[Dict[str, Any]], tuple[bool, str]]):
+        """
+        Args:
+            save_func: Called with a snapshot on the worker thread, returns (success, message).
+        """
+        self.save_func = save_func
+        self.saved_count = 0
+        self.coalesced_count = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._completed: "queue.Queue[tuple]" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="journal-save-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: Dict[str, Any],
+               on_done: Optional[Callable[[bool, str], None]] = None,
+               key: Hashable = None) -> None:
+        """
+        Queue a snapshot for saving; ``on_done(success, message)`` is called when written.
+
+        Only snapshots sharing the same non-None ``key`` are coalesced with
+        each other; without a key the snapshot is never dropped.
+
+        Raises:
+            RuntimeError: If the worker was closed, since the snapshot would never be saved
+        """
+        if self._closed:
+            raise RuntimeError("Save worker is closed")
+        self._queue.put((key, snapshot, on_done))
+
+    def discard_pending(self) -> int:
+        """
+        Drop the snapshots the worker hasn't started on; returns how many.
+
+        A save already in progress still finishes, and a pending stop is kept.
+        """
+        dropped = 0
+        stop = False
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                stop = True
+            else:
+                dropped += 1
+        if stop:
+            self._queue.put(_STOP)
+        return dropped
+
+    def close(self) -> None:
+        """
+        Ask the worker to save whatever is still queued and stop, without waiting.
+
+        Later ``submit`` calls raise; closing again does nothing.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Save whatever is still queued, then stop the worker thread.
+
+        Returns:
+            bool: False if the worker was still saving when ``timeout`` ran out.
+        """
+        self.close()
+        self._thread.join(timeout)
+        return not self.is_running()
+
+    def is_running(self) -> bool:
+        """True until the worker thread has finished its last save."""
+        return self._thread.is_alive()
+
+    def _drain(self, job: Any) -> tuple[Dict[Hashable, list], bool]:
+        """Drain the queue behind ``job``, keeping only the newest snapshot per key."""
+        pending: Dict[Hashable, list] = {}
+        stop = False
+        while True:
+            key, snapshot, on_done = job
+            if key is None:
+                # Unkeyed saves are all kept, in submission order
+                key = object()
+            if key in pending:
+                self.coalesced_count += 1
+                pending[key][0] = snapshot
+                pending[key][1].append(on_done)
+            else:
+                pending[key] = [snapshot, [on_done]]
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                stop = True
+                break
+        return pending, stop
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            pending, stop = self._drain(job)
+            for snapshot, callbacks in pending.values():
+                self._save(snapshot, callbacks)
+            if stop:
+                return
+
+    def _save(self, snapshot: Dict[str, Any], callbacks: list) -> None:
+        try:
+            success, message = self.save_func(snapshot)
+        except Exception as e:
+            logger.error(f"Background save failed: {str(e)}")
+            success, message = False, f"Error saving entry: {str(e)}"
+        if success:
+            self.saved_count += 1
+        for callback in callbacks:
+            if callback is not None:
+                self._completed.put((callback, success, message))
+
+    def process_completed(self) -> int:
+        """Run callbacks of finished saves on the calling thread; returns how many ran."""
+        count = 0
+        while True:
+            try:
+                callback, success, message = self._completed.get_nowait()
+            except queue.Empty:
+                return count
+            callback(success, message)
+            count += 1
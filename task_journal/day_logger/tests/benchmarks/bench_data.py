@@ -0,0 +1,96 @@
+"""
+Synthetic data generators for the day_logger benchmark suite.
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+from day_logger.models.timeblock import TimeBlock
+
+START_DATE = datetime(2023, 1, 1, 9, 0)
+
+
+def generate_entries(base_path: Path, years: int, entries_per_day: int,
+                     blocks_per_entry: int = 3) -> Path:
+    """
+    Write ``years`` worth of journal entries in JournalDataManager's folder layout.
+
+    Returns:
+        Path: The day folder of the last generated day.
+    """
+    day_path = base_path
+    for offset in range(365 * years):
+        date = START_DATE + timedelta(days=offset)
+        day_path = (base_path / date.strftime("%y-%m")
+                    / f"w{date.strftime('%V')}-{date.strftime('%m-%d')}"
+                    / date.strftime("%a-%d-%m-%y"))
+        day_path.mkdir(parents=True, exist_ok=True)
+        for n in range(entries_per_day):
+            entry = make_raw_entry(blocks_per_entry, seed=offset * entries_per_day + n)
+            with open(day_path / f"journal_entry_{n:02d}-00-00.json", 'w', encoding='utf-8') as f:
+                json.dump(entry, f, indent=2)
+    return day_path
+
+
+def make_raw_entry(blocks: int, seed: int = 0) -> Dict[str, Any]:
+    """Build an entry in the shape produced by JournalDataManager.collect_entry_data."""
+    return {
+        "timestamp": (START_DATE + timedelta(minutes=seed)).isoformat(),
+        "time_blocks": {
+            f"block{b}": {
+                "start_time": f"{(8 + b) % 24:02d}:00",
+                "end_time": f"{(9 + b) % 24:02d}:00",
+                "content": f"Task {seed}-{b}\nFollow up on item {b}\nReview notes"
+            }
+            for b in range(blocks)
+        }
+    }
+
+
+def make_timeblocks(count: int, date: datetime = START_DATE, seed: int = 0) -> List[TimeBlock]:
+    """Build ``count`` distinct TimeBlocks for a single day."""
+    return [
+        TimeBlock(f"Block {seed}-{n}", f"{n % 24:02d}:00", f"{(n + 1) % 24:02d}:00",
+                  f"Worked on task {seed}-{n}\nwith some notes", date)
+        for n in range(count)
+    ]
+
+
+def make_items(count: int) -> List[Dict[str, Any]]:
+    """Build task dictionaries accepted by DataProcessor and validate_input."""
+    return [
+        {
+            "title": f"  Task {n}  ",
+            "description": f"Description for task {n}",
+            "due_date": (START_DATE + timedelta(days=n % 365)).date().isoformat(),
+            "priority": n % 5,
+            "tags": ["work", None, f"tag{n % 7}"],
+            "source": "benchmark"
+        }
+        for n in range(count)
+    ]
+
+
+class _FakeWidget:
+    def __init__(self, value: str):
+        self.value = value
+
+    def get(self, *args) -> str:
+        return self.value
+
+
+class FakeTaskJournal:
+    """Stands in for the GUI: exposes entry_widgets backed by plain strings."""
+
+    def __init__(self, blocks: int = 3):
+        entry = make_raw_entry(blocks)
+        self.entry_widgets = {
+            key: {
+                "start": _FakeWidget(data["start_time"]),
+                "end": _FakeWidget(data["end_time"]),
+                "text": _FakeWidget(data["content"])
+            }
+            for key, data in entry["time_blocks"].items()
+        }
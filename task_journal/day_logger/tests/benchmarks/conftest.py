@@ -0,0 +1,71 @@
+"""
+Shared fixtures for the day_logger benchmark suite.
+
+Provides a temporary data manager and an opt-in baseline guard: with
+DAY_LOGGER_BENCH_GATE=1, every benchmark's median is compared with
+day_logger/tests/benchmarks/baselines.json and the test fails when it is
+slower than the baseline by more than the threshold. The baselines are
+absolute timings of one machine, so a plain ``pytest`` run only measures.
+
+Environment variables:
+    DAY_LOGGER_BENCH_GATE:      set to 1 to fail benchmarks slower than their baseline
+    DAY_LOGGER_BENCH_THRESHOLD: allowed slowdown as a fraction (default 0.5 = 50%)
+    DAY_LOGGER_BENCH_UPDATE:    set to 1 to rewrite baselines.json from this run
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from day_logger.journal_data_manager import JournalDataManager
+
+BASELINE_FILE = Path(__file__).with_name("baselines.json")
+THRESHOLD = float(os.environ.get("DAY_LOGGER_BENCH_THRESHOLD", "0.5"))
+UPDATE_BASELINES = os.environ.get("DAY_LOGGER_BENCH_UPDATE") == "1"
+GATE = os.environ.get("DAY_LOGGER_BENCH_GATE") == "1"
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A JournalDataManager rooted in a temporary directory (daily files included)."""
+    monkeypatch.chdir(tmp_path)
+    return JournalDataManager(base_path=str(tmp_path / "journal_entries"))
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    """Load baselines.json; rewrite it at the end of the session when updating."""
+    data = {}
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    results: Dict[str, Dict[str, float]] = {}
+    yield data, results
+    if UPDATE_BASELINES and results:
+        data.update(results)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(data.items())), f, indent=2)
+            f.write("\n")
+
+
+@pytest.fixture
+def guarded_benchmark(benchmark, baselines, request):
+    """The pytest-benchmark fixture, checked against the stored baseline afterwards when gating."""
+    yield benchmark
+    stats = getattr(benchmark, "stats", None)
+    if not stats:
+        # --benchmark-disable or the benchmark was never run
+        return
+    stored, results = baselines
+    name = request.node.name
+    median = stats.stats.median
+    results[name] = {"median": median}
+    baseline = stored.get(name)
+    if baseline and GATE and not UPDATE_BASELINES:
+        limit = baseline["median"] * (1 + THRESHOLD)
+        if median > limit:
+            pytest.fail(f"{name} regressed: median {median * 1e3:.3f} ms exceeds "
+                        f"baseline {baseline['median'] * 1e3:.3f} ms by more than {THRESHOLD:.0%}")
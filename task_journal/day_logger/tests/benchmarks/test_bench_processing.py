@@ -0,0 +1,36 @@
+"""
+Benchmarks for the processing and validation paths at several batch sizes.
+"""
+
+import logging
+import pytest
+
+from bench_data import make_items
+from day_logger.main import validate_input
+from day_logger.processors.data_processor import DataProcessor
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    """Keep per-call INFO logging out of the measurements."""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.mark.parametrize("batch_size", [100, 1000, 10000])
+def test_bench_process_batch(guarded_benchmark, batch_size):
+    """DataProcessor.process_batch over ``batch_size`` task dictionaries."""
+    items = make_items(batch_size)
+    results = guarded_benchmark(DataProcessor().process_batch, items)
+    assert len(results) == batch_size
+
+
+@pytest.mark.parametrize("batch_size", [100, 1000, 10000])
+def test_bench_validate_input(guarded_benchmark, batch_size):
+    """validate_input over ``batch_size`` valid task dictionaries."""
+    items = make_items(batch_size)
+    is_valid, errors = guarded_benchmark(validate_input, items)
+    assert is_valid, errors
@@ -0,0 +1,100 @@
+"""
+Benchmarks for JournalDataManager's storage paths at several data scales.
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bench_data import FakeTaskJournal, START_DATE, generate_entries, make_timeblocks
+from day_logger.models import timeblock
+from day_logger.models.timeblock import TimeBlock
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("blocks", [3, 30])
+def test_bench_save_entry(guarded_benchmark, manager, blocks):
+    """save_entry with the GUI's block count and a ten times larger form."""
+    journal = FakeTaskJournal(blocks)
+    success, _ = guarded_benchmark(manager.save_entry, journal)
+    assert success
+
+
+@pytest.mark.parametrize("existing_blocks", [0, 100, 1000])
+def test_bench_save_daily_timeblocks(guarded_benchmark, manager, existing_blocks):
+    """Adding three new blocks to a day that already holds ``existing_blocks``."""
+    if existing_blocks:
+        manager.save_daily_timeblocks(make_timeblocks(existing_blocks))
+    rounds = iter(range(1, 10**9))
+
+    def setup():
+        return (make_timeblocks(3, seed=next(rounds)),), {}
+
+    result = guarded_benchmark.pedantic(manager.save_daily_timeblocks, setup=setup, rounds=20)
+    assert result[0]
+
+
+@pytest.mark.parametrize("years", [1, 3])
+def test_bench_load_latest_entry(guarded_benchmark, manager, years):
+    """load_latest_entry over one entry per day for ``years`` years."""
+    generate_entries(Path(manager.base_path), years=years, entries_per_day=1)
+    latest = guarded_benchmark(manager.load_latest_entry)
+    assert "time_blocks" in latest
+
+
+@pytest.mark.parametrize("entries_per_day", [3, 30])
+def test_bench_get_entries_by_date(guarded_benchmark, manager, entries_per_day):
+    """get_entries_by_date for a day with ``entries_per_day`` saved entries."""
+    generate_entries(Path(manager.base_path), years=1, entries_per_day=entries_per_day)
+    last_day = datetime(START_DATE.year, 12, 31)
+    entries = guarded_benchmark(manager.get_entries_by_date, last_day)
+    assert len(entries) == entries_per_day
+
+
+def _load_daily_files_naive(paths):
+    """The hand-written per-block loop: every date string parsed anew."""
+    blocks = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for block in data.get("blocks", []):
+            blocks.append(TimeBlock(block["block_name"], block["start_time"], block["end_time"],
+                                    block.get("content") or "", datetime.fromisoformat(block["date"])))
+    return blocks
+
+
+def _load_daily_files_from_json(paths):
+    """TimeBlock.from_json with each file's date strings parsed once."""
+    blocks = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        dates = {}
+        for block in data.get("blocks", []):
+            date = dates.get(block["date"])
+            if date is None:
+                date = dates[block["date"]] = datetime.fromisoformat(block["date"])
+            blocks.append(TimeBlock.from_json(block, date))
+    return blocks
+
+
+@pytest.mark.parametrize("loader", ["unmemoized", "naive", "from_json"])
+def test_bench_load_daily_files(guarded_benchmark, manager, monkeypatch, loader):
+    """
+    Loading 30 days of 100 blocks each into TimeBlocks.
+
+    ``unmemoized`` is the naive loop with the HH:MM parse/format caches bypassed,
+    which measures what memoizing them saves.
+    """
+    days = [START_DATE + timedelta(days=offset) for offset in range(30)]
+    for day in days:
+        manager.save_daily_timeblocks(make_timeblocks(100, date=day))
+    paths = [manager.get_daily_file_path(day) for day in days]
+    if loader == "unmemoized":
+        monkeypatch.setattr(timeblock, "parse_minute_of_day", timeblock.parse_minute_of_day.__wrapped__)
+        monkeypatch.setattr(timeblock, "format_minute_of_day", timeblock.format_minute_of_day.__wrapped__)
+    load = _load_daily_files_from_json if loader == "from_json" else _load_daily_files_naive
+    blocks = guarded_benchmark(load, paths)
+    assert len(blocks) == 3000
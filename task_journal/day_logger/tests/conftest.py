@@ -0,0 +1,12 @@
+"""
+Shared fixtures for the day_logger tests.
+"""
+
+import pytest
+
+from day_logger.journal_data_manager import JournalDataManager
+
+@pytest.fixture
+def manager(tmp_path):
+    """A data manager with its entries and daily files in temporary folders."""
+    return JournalDataManager(str(tmp_path / "journal"), daily_root=str(tmp_path / "work-logs"))
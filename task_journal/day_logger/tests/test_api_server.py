@@ -0,0 +1,102 @@
+"""
+Tests for the local HTTP read API (aggregates, search and conditional requests).
+"""
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+import pytest
+from day_logger.api_server import make_server
+from day_logger.models.timeblock import TimeBlock
+from journal_processor import JournalProcessor
+
+@pytest.fixture
+def api(tmp_path):
+    """A running API server over a temporary work-logs folder with three days of blocks."""
+    processor = JournalProcessor(str(tmp_path / "work-logs"))
+    for day, start, end, content in [(3, "08:00", "10:00", "wrote tests"),
+                                     (4, "09:00", "10:30", "code review"),
+                                     (11, "08:00", "09:00", "more tests")]:
+        processor.data_manager.save_daily_timeblocks(
+            [TimeBlock("Morning", start, end, content, datetime(2025, 2, day))])
+    server = make_server(processor, port=0, quiet=True, allow_origin="http://localhost:3000/")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield processor, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def _get(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, e.headers, json.loads(body) if body else None
+
+def test_weekly_and_monthly_aggregates(api):
+    """Day rollups are grouped into ISO weeks and months."""
+    _, base = api
+    status, _, weekly = _get(f"{base}/api/weekly?from=2025-02-01&to=2025-02-28")
+    assert status == 200
+    assert [(b["period"], b["days"], b["hours"]) for b in weekly["buckets"]] == [
+        ("2025-W06", 2, 3.5), ("2025-W07", 1, 1.0)]
+    _, _, monthly = _get(f"{base}/api/monthly")
+    assert monthly["total_blocks"] == 3
+    assert monthly["buckets"][0]["by_block"] == {"Morning": {"blocks": 3, "hours": 4.5}}
+
+def test_search_matches_content(api):
+    """Search returns matching blocks newest first."""
+    _, base = api
+    _, _, result = _get(f"{base}/api/search?q=TESTS")
+    assert [m["date"] for m in result["matches"]] == ["2025-02-11", "2025-02-03"]
+    assert result["matches"][0]["content"] == "more tests"
+
+def test_conditional_requests_return_304_until_a_file_changes(api):
+    """The ETag only changes when a daily file in the requested range changes."""
+    processor, base = api
+    url = f"{base}/api/daily?from=2025-02-01&to=2025-02-05"
+    _, headers, _ = _get(url)
+    etag = headers["ETag"]
+
+    status, _, _ = _get(url, {"If-None-Match": etag})
+    assert status == 304
+    status, _, _ = _get(url, {"If-Modified-Since": headers["Last-Modified"]})
+    assert status == 304
+
+    # A day outside the range doesn't invalidate the response
+    processor.data_manager.save_daily_timeblocks(
+        [TimeBlock("Evening", "18:00", "19:00", "outside", datetime(2025, 2, 20))])
+    assert _get(url, {"If-None-Match": etag})[0] == 304
+
+    path = processor.data_manager.get_daily_file_path(datetime(2025, 2, 4))
+    processor.data_manager.save_daily_timeblocks(
+        [TimeBlock("Evening", "18:00", "20:00", "inside", datetime(2025, 2, 4))])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    status, headers, daily = _get(url, {"If-None-Match": etag})
+    assert status == 200
+    assert headers["ETag"] != etag
+    assert daily["buckets"][1]["hours"] == 3.5
+
+def test_invalid_requests(api):
+    """Bad dates, missing queries and unknown paths are client errors."""
+    _, base = api
+    assert _get(f"{base}/api/daily?from=2025-13-01")[0] == 400
+    assert _get(f"{base}/api/search")[0] == 400
+    assert _get(f"{base}/api/yearly")[0] == 404
+
+def test_only_the_configured_origin_may_read(api):
+    """Cross-origin reads are allowed for the dashboard's origin and no other."""
+    _, base = api
+    _, headers, _ = _get(f"{base}/api/search?q=tests", {"Origin": "https://evil.example"})
+    assert headers.get("Access-Control-Allow-Origin") is None
+    _, headers, _ = _get(f"{base}/api/search?q=tests", {"Origin": "http://localhost:3000"})
+    assert headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+    _, headers, _ = _get(f"{base}/api/health")
+    assert headers.get("Access-Control-Allow-Origin") is None
@@ -0,0 +1,85 @@
+"""
+Tests for packing journal entries into month/year archives and reading them back.
+"""
+
+from datetime import datetime
+
+import pytest
+from day_logger import archive
+
+@pytest.fixture
+def manager(manager):
+    """The shared data manager with three entries over two days of February 2024."""
+    manager.save_entries([
+        {"timestamp": "2024-02-14T09:00:00", "note": "a"},
+        {"timestamp": "2024-02-15T09:00:00", "note": "b"},
+        {"timestamp": "2024-02-15T18:30:00", "note": "c"},
+    ])
+    return manager
+
+def test_pack_month_and_read_days_back(manager):
+    """Packed days are served by get_entries_by_date and the loose files are gone."""
+    index = archive.pack(manager, "2024-02")
+
+    assert index["entries"] == 3
+    assert sorted(index["days"]) == ["2024-02-14", "2024-02-15"]
+    assert not list(manager.base_path.glob("24-02*"))
+    entries = manager.get_entries_by_date(datetime(2024, 2, 15))
+    assert sorted(e["note"] for e in entries) == ["b", "c"]
+    assert manager.get_entries_by_date(datetime(2024, 2, 16)) == []
+    assert manager.load_latest_entry()["note"] == "c"
+
+def test_latest_entry_prefers_newer_loose_files(manager):
+    """A loose entry of a later day wins over the archive; one of an archived day doesn't."""
+    archive.pack(manager, "2024-02")
+    manager.save_entries([{"timestamp": "2024-02-14T20:00:00", "note": "kept"}])
+    assert manager.load_latest_entry()["note"] == "c"
+
+    manager.save_entries([{"timestamp": "2024-03-01T09:00:00", "note": "march"}])
+    assert manager.load_latest_entry()["note"] == "march"
+
+def test_loose_files_are_merged_with_the_archive(manager):
+    """Entries written after packing are returned too and appended by a repack."""
+    archive.pack(manager, "2024")
+    manager.save_entries([{"timestamp": "2024-02-15T20:00:00", "note": "late"}])
+
+    notes = sorted(e["note"] for e in manager.get_entries_by_date(datetime(2024, 2, 15)))
+    assert notes == ["b", "c", "late"]
+
+    index = archive.pack(manager, "2024")
+    assert index["days"]["2024-02-15"][2] == 3
+    assert sorted(e["note"] for e in manager.get_entries_by_date(datetime(2024, 2, 15))) == notes
+
+def test_open_periods_are_refused_and_unpack_restores(manager):
+    """The current month can't be packed by accident, and unpack brings the files back."""
+    with pytest.raises(ValueError):
+        archive.pack(manager, datetime.now().strftime("%Y-%m"))
+    with pytest.raises(ValueError):
+        archive.pack(manager, "Feb-2024")
+
+    archive.pack(manager, "2024-02")
+    assert archive.unpack(manager, "2024-02") == 3
+    assert not (manager.base_path / "archive" / "2024-02.index.json").exists()
+    folder = manager.get_entry_folder(datetime(2024, 2, 15))
+    assert sorted(p.name for p in folder.iterdir()) == ["journal_entry_09-00-00.json",
+                                                       "journal_entry_18-30-00.json"]
+
+def test_kept_loose_files_are_not_returned_twice(manager):
+    """Packing with remove_loose=False, and packing again, keeps one copy of each entry."""
+    archive.pack(manager, "2024-02", remove_loose=False)
+    assert sorted(e["note"] for e in manager.get_entries_by_date(datetime(2024, 2, 15))) == ["b", "c"]
+
+    index = archive.pack(manager, "2024-02", remove_loose=False)
+    assert index["entries"] == 3
+    assert sorted(e["note"] for e in manager.get_entries_by_date(datetime(2024, 2, 15))) == ["b", "c"]
+
+def test_month_and_year_archives_do_not_overlap(manager):
+    """A day lives in one archive: the year can't be packed over a month archive, nor the reverse."""
+    archive.pack(manager, "2024-02", remove_loose=False)
+    with pytest.raises(ValueError, match="2024-02"):
+        archive.pack(manager, "2024")
+
+    archive.unpack(manager, "2024-02")
+    archive.pack(manager, "2024")
+    with pytest.raises(ValueError, match="2024"):
+        archive.pack(manager, "2024-02")
@@ -0,0 +1,98 @@
+"""
+Tests for AsyncJournalDataManager: concurrent reads and serialized writes.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+from day_logger.async_data_manager import AsyncJournalDataManager
+from day_logger.models.timeblock import TimeBlock
+
+def _write_entry(manager, date, name, content):
+    folder = manager.get_entry_folder(date)
+    folder.mkdir(parents=True, exist_ok=True)
+    with open(folder / name, 'w', encoding='utf-8') as f:
+        json.dump({"timestamp": date.isoformat(), "content": content}, f)
+
+def test_get_entries_by_dates_fetches_days_concurrently(manager):
+    """Multi-day fetches return every day's entries keyed by date."""
+    days = [datetime(2025, 2, 10) + timedelta(days=n) for n in range(3)]
+    for day in days:
+        _write_entry(manager, day, "entry.json", day.day)
+
+    async def run():
+        async with AsyncJournalDataManager(manager=manager) as async_manager:
+            return await async_manager.get_entries_by_dates(days)
+
+    result = asyncio.run(run())
+    assert [[e["content"] for e in result[day]] for day in days] == [[10], [11], [12]]
+
+def test_iter_entries_yields_every_day_in_order(manager):
+    """iter_entries covers the inclusive range in date order, empty days included."""
+    _write_entry(manager, datetime(2025, 2, 11), "entry.json", "b")
+    _write_entry(manager, datetime(2025, 2, 16), "entry.json", "g")
+
+    async def run():
+        async with AsyncJournalDataManager(manager=manager, max_workers=2) as async_manager:
+            return [(d.day, [e["content"] for e in entries])
+                    async for d, entries in async_manager.iter_entries(datetime(2025, 2, 10),
+                                                                       datetime(2025, 2, 16))]
+
+    assert asyncio.run(run()) == [(10, []), (11, ["b"]), (12, []), (13, []),
+                                  (14, []), (15, []), (16, ["g"])]
+
+def test_writes_to_the_same_day_are_serialized(manager):
+    """Concurrent saves of one day never overlap, so no block is lost."""
+    original = manager.save_daily_timeblocks
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def tracked_save(blocks):
+        with lock:
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(len(active))
+        time.sleep(0.01)
+        try:
+            return original(blocks)
+        finally:
+            with lock:
+                active.pop()
+
+    manager.save_daily_timeblocks = tracked_save
+    day = datetime(2025, 2, 15)
+
+    async def run():
+        async with AsyncJournalDataManager(manager=manager, max_workers=4) as async_manager:
+            return await asyncio.gather(*(
+                async_manager.save_daily_timeblocks(
+                    [TimeBlock(f"block-{n}", "08:00", "09:00", f"content {n}", day)])
+                for n in range(6)
+            ))
+
+    results = asyncio.run(run())
+    assert all(success for success, _ in results)
+    assert overlaps == []
+    with open(manager.get_daily_file_path(day), 'r', encoding='utf-8') as f:
+        assert len(json.load(f)["blocks"]) == 6
+
+def test_write_locks_are_dropped_after_use(manager):
+    """Saving many days leaves no per-day write lock behind."""
+    days = [datetime(2025, 2, 1) + timedelta(days=n) for n in range(5)]
+
+    async def run():
+        async with AsyncJournalDataManager(manager=manager, max_workers=2) as async_manager:
+            results = await asyncio.gather(*(
+                async_manager.save_daily_timeblocks(
+                    [TimeBlock(f"block-{n}", "08:00", "09:00", f"content {n}", day)])
+                for n in range(2) for day in days
+            ))
+            return results, dict(async_manager._write_locks)
+
+    results, locks = asyncio.run(run())
+    assert all(success for success, _ in results)
+    assert locks == {}
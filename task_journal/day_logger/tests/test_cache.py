@@ -0,0 +1,67 @@
+"""
+Tests for the DocumentCache LRU used by JournalDataManager.
+"""
+
+import json
+import os
+from datetime import datetime
+from day_logger.utils.cache import DocumentCache
+from day_logger.journal_data_manager import JournalDataManager
+
+def _write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+def test_repeated_loads_are_hits(tmp_path):
+    """The second load of an unchanged file is served from memory."""
+    path = tmp_path / "day.json"
+    _write(path, {"blocks": [1, 2]})
+    cache = DocumentCache()
+    first = cache.load(path)
+    second = cache.load(path)
+    assert first == {"blocks": [1, 2]}
+    assert second is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+def test_changed_file_is_reloaded(tmp_path):
+    """A different mtime/size invalidates the cached document."""
+    path = tmp_path / "day.json"
+    _write(path, {"blocks": [1]})
+    cache = DocumentCache()
+    cache.load(path)
+    _write(path, {"blocks": [1, 2, 3]})
+    os.utime(path, ns=(1, 1))
+    assert cache.load(path) == {"blocks": [1, 2, 3]}
+    assert cache.misses == 2
+
+def test_least_recently_used_is_evicted(tmp_path):
+    """The cache never holds more than max_entries documents."""
+    cache = DocumentCache(max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.json"
+        _write(path, {"i": i})
+        paths.append(path)
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])  # 0 is now most recent
+    cache.load(paths[2])  # evicts 1
+    assert cache.stats()["size"] == 2
+    cache.load(paths[0])
+    assert cache.hits == 2
+    cache.load(paths[1])
+    assert cache.misses == 4
+
+def test_data_manager_serves_repeated_reads_from_cache(tmp_path):
+    """get_entries_by_date only parses the files once while they are unchanged."""
+    manager = JournalDataManager(base_path=str(tmp_path))
+    day = datetime.now()
+    day_path = (tmp_path / day.strftime("%y-%m") / f"w{day.strftime('%V')}-{day.strftime('%m-%d')}"
+                / day.strftime("%a-%d-%m-%y"))
+    day_path.mkdir(parents=True)
+    _write(day_path / "journal_entry_08-00-00.json", {"time_blocks": {}})
+
+    assert len(manager.get_entries_by_date(day)) == 1
+    assert len(manager.get_entries_by_date(day)) == 1
+    assert manager.cache.stats()["hits"] == 1
+    assert manager.cache.stats()["misses"] == 1
@@ -0,0 +1,75 @@
+"""
+Tests for the headless day_logger CLI.
+"""
+
+import io
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from day_logger.cli import build_report, ingest, main
+from journal_processor import JournalProcessor
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """A JournalProcessor writing below a temporary work-logs folder."""
+    monkeypatch.chdir(tmp_path)
+    return JournalProcessor(str(tmp_path / "work-logs"))
+
+def test_ingest_groups_records_by_day(processor):
+    """Block records, GUI entries and CSV rows land in their daily files."""
+    jsonl = io.StringIO(
+        '{"date": "2025-03-01", "block_name": "Morning", "start_time": "08:00", "end_time": "10:30", "content": "a"}\n'
+        '\n'
+        '{"timestamp": "2025-03-02T21:00:00", "time_blocks": {"evening": '
+        '{"start_time": "18:00", "end_time": "19:00", "content": "b"}}}\n'
+        '{"block_name": "missing date"}\n'
+    )
+    csv_rows = io.StringIO('date,block_name,start_time,end_time,content\n2025-03-01,Evening,18:00,20:00,"x, y"\n')
+    out = io.StringIO()
+
+    stats = ingest(processor, [("in.jsonl", jsonl, "jsonl"), ("in.csv", csv_rows, "csv")],
+                   batch_size=2, out=out)
+
+    assert (stats.records, stats.blocks, len(stats.days), stats.errors) == (4, 3, 2, 1)
+    assert "in.jsonl: record 3: skipped invalid record" in out.getvalue()
+    first_day = json.loads(processor.data_manager.get_daily_file_path(datetime(2025, 3, 1)).read_text())
+    assert {b["block_name"] for b in first_day["blocks"]} == {"Morning", "Evening"}
+    second_day = json.loads(processor.data_manager.get_daily_file_path(datetime(2025, 3, 2)).read_text())
+    assert second_day["blocks"][0]["block_name"] == "Evening Tasks"
+
+def test_report_over_range(processor):
+    """Reports total blocks and hours per day and per block name."""
+    records = io.StringIO(
+        '[{"date": "2025-03-01", "block_name": "Morning", "start_time": "08:00", "end_time": "10:30", "content": "a"},'
+        ' {"date": "2025-03-03", "block_name": "Morning", "start_time": "08:00", "end_time": "09:00", "content": "b"}]'
+    )
+    ingest(processor, [("in.json", records, "json")], out=None)
+
+    report = build_report(processor, datetime(2025, 3, 1), datetime(2025, 3, 2))
+    assert report["days_with_entries"] == 1
+    assert report["total_hours"] == 2.5
+    assert report["by_block"] == {"Morning": {"blocks": 1, "hours": 2.5}}
+
+def test_main_ingest_and_report(tmp_path, monkeypatch, capsys):
+    """The argparse entry point ingests files and prints a JSON report."""
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "blocks.jsonl"
+    source.write_text('{"date": "2025-03-01", "block_name": "Morning", "start_time": "08:00", '
+                      '"end_time": "09:00", "content": "a"}\n', encoding='utf-8')
+
+    assert main(["--work-logs", "logs", "ingest", str(source), "--quiet"]) == 0
+    assert "Ingested 1 records" in capsys.readouterr().err
+    assert main(["--work-logs", "logs", "report", "--from", "2025-03-01", "--to", "2025-03-01",
+                 "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out)["total_blocks"] == 1
+
+def test_cli_does_not_import_tkinter():
+    """The CLI must work on servers without a display."""
+    root = Path(__file__).resolve().parents[2]
+    code = "import sys, day_logger.cli; print('tkinter' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
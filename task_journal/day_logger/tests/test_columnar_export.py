@@ -0,0 +1,58 @@
+"""
+Tests for the incremental columnar export of time blocks.
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+from day_logger.models.timeblock import TimeBlock
+from journal_processor import JournalProcessor
+
+np = pytest.importorskip("numpy")
+from day_logger.columnar_export import export_timeblocks, load_manifest, read_columns
+
+@pytest.fixture
+def processor(tmp_path):
+    """A processor with blocks on two days."""
+    processor = JournalProcessor(str(tmp_path / "work-logs"))
+    processor.data_manager.save_daily_timeblocks([
+        TimeBlock("Morning", "08:00", "10:30", "a", datetime(2025, 2, 14)),
+        TimeBlock("Evening", "18:00", "19:00", "b", datetime(2025, 2, 14)),
+    ])
+    processor.data_manager.save_daily_timeblocks([TimeBlock("Morning", "09:00", "10:00", "c", datetime(2025, 2, 15))])
+    return processor
+
+@pytest.mark.parametrize("engine", ["npz", "parquet"])
+def test_export_writes_partitions_and_reads_back(processor, tmp_path, engine):
+    """Each day becomes a year/month partition holding one row per block."""
+    if engine == "parquet":
+        pytest.importorskip("pyarrow")
+    out = tmp_path / "analytics"
+
+    stats = export_timeblocks(processor, str(out), engine=engine)
+
+    assert stats == {"exported_days": 2, "unchanged_days": 0, "removed_days": 0, "rows": 3}
+    assert (out / "year=2025" / "month=02" / f"2025-02-14.{engine}").exists()
+    columns = read_columns(str(out))
+    assert sorted(zip(columns["date"], columns["content"], columns["duration_hours"])) == [
+        ("2025-02-14", "a", 2.5), ("2025-02-14", "b", 1.0), ("2025-02-15", "c", 1.0)]
+
+def test_export_is_incremental(processor, tmp_path):
+    """Only days whose daily file changed are rewritten; deleted days are dropped."""
+    out = tmp_path / "analytics"
+    export_timeblocks(processor, str(out), engine="npz")
+
+    assert export_timeblocks(processor, str(out), engine="npz")["unchanged_days"] == 2
+
+    manager = processor.data_manager
+    manager.save_daily_timeblocks([TimeBlock("Night", "21:00", "22:00", "d", datetime(2025, 2, 15))])
+    path = manager.get_daily_file_path(datetime(2025, 2, 15))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    manager.get_daily_file_path(datetime(2025, 2, 14)).unlink()
+
+    stats = export_timeblocks(processor, str(out), engine="npz")
+    assert (stats["exported_days"], stats["unchanged_days"], stats["removed_days"], stats["rows"]) == (1, 0, 1, 2)
+    assert list(load_manifest(out)["days"]) == ["2025-02-15"]
+    assert sorted(read_columns(str(out))["content"]) == ["c", "d"]
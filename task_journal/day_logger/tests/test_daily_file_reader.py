@@ -0,0 +1,144 @@
+"""
+Tests for the memory-mapped DailyFileReader.
+"""
+
+import json
+import pytest
+from datetime import datetime
+from day_logger import daily_file_reader
+from day_logger.daily_file_reader import DailyFileReader, iter_block_headers
+from day_logger.models.timeblock import TimeBlock
+
+TRICKY_CONTENT = 'Quote " and backslash \\ and braces {[ ]} and ação\nsecond line \\"'
+
+def _daily_doc():
+    return {
+        "date": "2025-02-15",
+        "blocks": [
+            {"block_name": "Morning Tasks", "start_time": "08:00", "end_time": "12:00",
+             "content": TRICKY_CONTENT, "date": "2025-02-15T08:00:00"},
+            {"block_name": "Evening Tasks", "start_time": "18:00", "end_time": "20:00",
+             "content": "", "date": "2025-02-15T18:00:00", "tags": ["a", {"b": [1]}]},
+        ],
+        "last_updated": "2025-02-15T20:00:00"
+    }
+
+@pytest.fixture(params=[2, None], ids=["indented", "compact"])
+def daily_file(tmp_path, request):
+    path = tmp_path / "2025-02-15.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(_daily_doc(), f, indent=request.param)
+    return path
+
+def test_iter_blocks_matches_json_load(daily_file):
+    """Lazily decoded blocks equal what json.load produces."""
+    with DailyFileReader(daily_file) as reader:
+        blocks = [block.to_dict() for block in reader.iter_blocks()]
+    assert blocks == _daily_doc()["blocks"]
+
+def test_headers_skip_content(daily_file):
+    """Headers list names and times without the content field."""
+    headers = list(iter_block_headers(daily_file))
+    assert [h["block_name"] for h in headers] == ["Morning Tasks", "Evening Tasks"]
+    assert headers[0]["start_time"] == "08:00"
+    assert all("content" not in h for h in headers)
+
+def test_content_is_decoded_on_access(daily_file):
+    """Content is only decoded when read, and its span points into the file."""
+    with DailyFileReader(daily_file) as reader:
+        block = next(reader.iter_blocks())
+        assert "content" not in block._values
+        assert block.content == TRICKY_CONTENT
+        offset, length = block.span("content")
+    raw = daily_file.read_bytes()[offset:offset + length]
+    assert json.loads(raw) == TRICKY_CONTENT
+
+def test_read_header(daily_file):
+    """Top-level fields are available without the blocks."""
+    with DailyFileReader(daily_file) as reader:
+        assert reader.read_header() == {"date": "2025-02-15", "last_updated": "2025-02-15T20:00:00"}
+
+def test_empty_blocks(tmp_path):
+    """A file without blocks yields nothing."""
+    path = tmp_path / "empty.json"
+    path.write_text('{"date": "2025-02-15", "blocks": []}', encoding='utf-8')
+    with DailyFileReader(path) as reader:
+        assert list(reader.iter_blocks()) == []
+
+def test_data_manager_iter_daily_blocks(manager):
+    """JournalDataManager exposes the lazy reader for saved days."""
+    day = datetime(2025, 2, 15, 10, 30)
+    manager.save_daily_timeblocks([TimeBlock("Morning", "08:00", "12:00", "Test tasks", day)])
+
+    names = [block["block_name"] for block in manager.iter_daily_blocks(day)]
+    assert names == ["Morning"]
+    assert list(manager.iter_daily_blocks(datetime(2025, 2, 16))) == []
+
+def test_timeblocks_load_content_on_access(daily_file):
+    """TimeBlocks keep a file span and read the text only when asked, after the reader closed."""
+    with DailyFileReader(daily_file) as reader:
+        blocks = list(reader.iter_timeblocks())
+
+    assert [(b.block_name, b.duration_minutes) for b in blocks] == [("Morning Tasks", 240), ("Evening Tasks", 120)]
+    assert not any(b.content_loaded for b in blocks)
+    assert blocks[0].content == TRICKY_CONTENT
+    assert blocks[0].content_loaded and not blocks[1].content_loaded
+    assert blocks[0].date == datetime(2025, 2, 15, 8)
+
+def test_lazy_content_survives_saves_and_refuses_foreign_rewrites(manager):
+    """Saves load the lazy text of the file first; other rewrites make proxies refuse to read."""
+    day = datetime(2025, 2, 15, 10, 30)
+    manager.save_daily_timeblocks([TimeBlock("Morning", "08:00", "12:00", "Test tasks", day)])
+    listed = manager.load_timeblocks(day)
+    assert not listed[0].content_loaded
+    assert repr(listed[0]).startswith("TimeBlock(block_name='Morning'") and not listed[0].content_loaded
+
+    manager.save_daily_timeblocks([TimeBlock("Evening", "18:00", "19:00", "More", day)])
+    assert listed[0].content_loaded and listed[0].content == "Test tasks"
+    # Re-saving blocks listed before the file changed still works
+    assert manager.save_daily_timeblocks(listed)[0]
+    assert [b.content for b in manager.load_timeblocks(day)] == ["More", "Test tasks"]
+    assert manager.load_timeblocks(datetime(2025, 2, 16)) == []
+
+    stale = manager.load_timeblocks(day)
+    path = manager.get_daily_file_path(day)
+    path.write_text(path.read_text(encoding="utf-8") + " ", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        stale[0].content
+
+def _list_timeblocks(path):
+    with DailyFileReader(path) as reader:
+        return list(reader.iter_timeblocks())
+
+def test_lazy_equality_and_pending_files_are_dropped(tmp_path):
+    """Lazy blocks compare by their text, and files whose blocks are gone stop being tracked."""
+    paths = []
+    for n, text in enumerate(["foo", "bar"]):
+        path = tmp_path / f"2025-02-1{n}.json"
+        path.write_text(json.dumps({"blocks": [TimeBlock("A", "08:00", "09:00", text,
+                                                          datetime(2025, 2, 14)).to_json()]}), encoding="utf-8")
+        paths.append(path)
+    first, second = (_list_timeblocks(path) for path in paths)
+    assert first != second
+    assert first[0].content_loaded and second[0].content_loaded
+
+    keys = {daily_file_reader._pending_key(path) for path in paths}
+    assert keys <= set(daily_file_reader._pending)
+    del first, second
+    blocks = _list_timeblocks(paths[0])
+    assert daily_file_reader._pending_key(paths[1]) not in daily_file_reader._pending
+    assert len(blocks) == 1
+
+def test_open_reader_survives_a_save(manager):
+    """Saves replace the daily file, so a reader mapping the old one keeps reading it whole."""
+    day = datetime(2025, 2, 15, 10, 30)
+    manager.save_daily_timeblocks([TimeBlock(f"Block {n}", "08:00", "09:00", f"text {n}", day) for n in range(50)])
+
+    with DailyFileReader(manager.get_daily_file_path(day)) as reader:
+        blocks = reader.iter_blocks()
+        first = next(blocks)["block_name"]
+        manager.save_daily_timeblocks([TimeBlock("Evening", "18:00", "19:00", "More", day)])
+        rest = [block["content"] for block in blocks]
+
+    assert first == "Block 0" and len(rest) == 49
+    assert [b["block_name"] for b in manager.iter_daily_blocks(day)][0] == "Evening"
@@ -0,0 +1,105 @@
+"""
+Tests for per-file locking and concurrent writers of the same daily file.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from day_logger.models.timeblock import TimeBlock
+from day_logger.utils import file_lock
+from day_logger.utils.file_lock import lock_file_path, locked
+
+def test_same_path_serializes_and_other_paths_run_in_parallel(tmp_path):
+    """Only holders of the same path wait for each other."""
+    first = tmp_path / "2025-02-15.json"
+    events = []
+
+    def hold(path, name):
+        with locked(path):
+            events.append(("start", name))
+            time.sleep(0.05)
+            events.append(("end", name))
+
+    threads = [threading.Thread(target=hold, args=(first, n)) for n in range(2)]
+    threads.append(threading.Thread(target=hold, args=(tmp_path / "2025-02-16.json", "other")))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    same_day = [event for event in events if event[1] != "other"]
+    assert same_day[0][0] == "start" and same_day[1] == ("end", same_day[0][1])
+    assert events.index(("start", "other")) < events.index(("end", "other")) - 1
+    assert lock_file_path(first).exists()
+    assert str(first) not in file_lock._path_locks
+
+def test_idle_path_locks_are_dropped(tmp_path):
+    """A path's lock is kept while threads hold or wait for it, then dropped."""
+    path = tmp_path / "2025-02-15.json"
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with locked(path):
+            holding.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait(5)
+    waiter = threading.Thread(target=hold)
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while file_lock._path_locks[str(path)][1] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert file_lock._path_locks[str(path)][1] == 2
+    release.set()
+    holder.join()
+    waiter.join()
+
+    for n in range(50):
+        with locked(tmp_path / f"day-{n}.json"):
+            pass
+    assert file_lock._path_locks == {}
+
+def test_concurrent_threads_do_not_lose_blocks(manager):
+    """Many threads adding blocks to one day all end up in the file."""
+    day = datetime(2025, 2, 15)
+
+    def save(n):
+        manager.save_daily_timeblocks([TimeBlock(f"block-{n}", "08:00", "09:00", f"content {n}", day)])
+
+    threads = [threading.Thread(target=save, args=(n,)) for n in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    data = json.loads(manager.get_daily_file_path(day).read_text(encoding='utf-8'))
+    assert sorted(b["block_name"] for b in data["blocks"]) == sorted(f"block-{n}" for n in range(20))
+
+def test_concurrent_processes_do_not_lose_blocks(manager, tmp_path):
+    """Separate processes (e.g. the GUI and a CLI ingest) serialize on the lock file."""
+    root = Path(__file__).resolve().parents[2]
+    code = (
+        "import sys\n"
+        "from datetime import datetime\n"
+        "from day_logger.journal_data_manager import JournalDataManager\n"
+        "from day_logger.models.timeblock import TimeBlock\n"
+        "manager = JournalDataManager(sys.argv[1] + '/journal', daily_root=sys.argv[1] + '/work-logs')\n"
+        "for n in range(10):\n"
+        "    ok, msg = manager.save_daily_timeblocks([TimeBlock(f'{sys.argv[2]}-{n}', '08:00', '09:00', 'x',"
+        " datetime(2025, 2, 15))])\n"
+        "    assert ok, msg\n"
+    )
+    workers = [subprocess.Popen([sys.executable, "-c", code, str(tmp_path), f"p{w}"], cwd=root)
+               for w in range(3)]
+    assert [worker.wait(60) for worker in workers] == [0, 0, 0]
+
+    data = json.loads(manager.get_daily_file_path(datetime(2025, 2, 15)).read_text(encoding='utf-8'))
+    assert len(data["blocks"]) == 30
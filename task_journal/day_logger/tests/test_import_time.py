@@ -0,0 +1,66 @@
+"""
+Import-time budget tests.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``
+and its cumulative import time (best of three runs) must stay below budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time budgets in microseconds
+IMPORT_BUDGETS_US = {
+    "day_logger": 5_000,
+    "journal_processor": 40_000,
+    "day_logger.journal_data_manager": 80_000,
+    "day_logger.cli": 120_000,
+}
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, check=True)
+
+def _cumulative_import_us(module):
+    """Return the cumulative import time of ``module`` reported by -X importtime."""
+    result = _run(f"import {module}", "-X", "importtime")
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module and cumulative.strip().isdigit():
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_US))
+def test_import_time_budget(module):
+    """Importing the module stays within its budget."""
+    best = min(_cumulative_import_us(module) for _ in range(3))
+    assert best <= IMPORT_BUDGETS_US[module], f"import {module} took {best} us"
+
+def test_package_import_is_lazy_and_side_effect_free():
+    """import day_logger loads no submodule and leaves logging unconfigured."""
+    code = (
+        "import logging, sys\n"
+        "import day_logger\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('day_logger.'))\n"
+        "print(loaded, logging.getLogger().handlers, 'tkinter' in sys.modules)\n"
+        "print(day_logger.JournalDataManager.__name__, day_logger.main.__name__)\n"
+    )
+    first, second = _run(code).stdout.splitlines()
+    assert first == "[] [] False"
+    assert second == "JournalDataManager day_logger.main"
+
+def test_main_import_does_not_configure_logging():
+    """day_logger.main no longer calls logging.basicConfig at import time."""
+    code = "import logging, day_logger.main; print(logging.getLogger().handlers)"
+    assert _run(code).stdout.strip() == "[]"
+
+def test_journal_processor_defers_heavy_imports():
+    """journal_processor only loads the data manager once a processor is created."""
+    code = "import sys, journal_processor; print('day_logger.journal_data_manager' in sys.modules)"
+    assert _run(code).stdout.strip() == "False"
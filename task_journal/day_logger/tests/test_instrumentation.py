@@ -0,0 +1,84 @@
+"""
+Tests for the instrumentation timers, counters and exporters.
+"""
+
+import json
+import pytest
+from day_logger.utils import instrumentation
+
+@pytest.fixture
+def enabled():
+    """Enable instrumentation with clean stats for a single test."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+def test_disabled_records_nothing():
+    """With instrumentation off, timers and counters are no-ops."""
+    instrumentation.reset()
+    instrumentation.disable()
+    with instrumentation.timer("noop") as t:
+        pass
+    instrumentation.count("noop")
+    assert t is instrumentation.timer("other")  # Shared null timer
+    assert instrumentation.snapshot() == {"timers": {}, "counters": {}}
+
+def test_timers_and_counters(enabled):
+    """Timers aggregate calls and counters accumulate values."""
+    for _ in range(3):
+        with instrumentation.timer("work"):
+            pass
+    instrumentation.count("bytes_written", 10)
+    instrumentation.count("bytes_written", 5)
+
+    stats = instrumentation.snapshot()
+    assert stats["timers"]["work"]["count"] == 3
+    assert stats["timers"]["work"]["min_seconds"] <= stats["timers"]["work"]["max_seconds"]
+    assert stats["counters"] == {"bytes_written": 15}
+
+def test_exporters(enabled, tmp_path):
+    """Stats can be exported as a log line, JSON and Prometheus text."""
+    with instrumentation.timer("save_entry.write"):
+        pass
+    instrumentation.count("files_written")
+
+    assert "save_entry.write=1x/" in instrumentation.format_log_line()
+
+    json_path = tmp_path / "stats.json"
+    instrumentation.write_json(str(json_path))
+    exported = json.loads(json_path.read_text(encoding='utf-8'))
+    assert exported["timers"]["save_entry.write"]["count"] == 1
+
+    text = instrumentation.to_prometheus()
+    assert '# TYPE day_logger_duration_seconds summary' in text
+    assert 'day_logger_duration_seconds_count{operation="save_entry.write"} 1' in text
+    assert "day_logger_files_written_total 1" in text
+
+def test_save_path_is_instrumented(enabled, tmp_path, monkeypatch):
+    """A full journal save reports each stage of the hot path."""
+    from journal_processor import JournalProcessor
+
+    class _Widget:
+        def __init__(self, value):
+            self.value = value
+        def get(self, *args):
+            return self.value
+
+    class _Journal:
+        entry_widgets = {"morning": {"start": _Widget("08:00"), "end": _Widget("09:00"),
+                                     "text": _Widget("Write report")}}
+
+    monkeypatch.chdir(tmp_path)
+    processor = JournalProcessor()
+    success, _ = processor.process_and_save_journal(_Journal())
+    processor.data_manager.save_entry(_Journal())
+    assert success
+
+    timers = instrumentation.snapshot()["timers"]
+    for name in ("process_and_save_journal", "collect_entry_data", "build_timeblocks",
+                 "create_timestamp_folders", "save_daily_timeblocks.json_encode",
+                 "save_daily_timeblocks.write", "save_entry.write"):
+        assert name in timers
+    assert instrumentation.snapshot()["counters"]["blocks_built"] == 1
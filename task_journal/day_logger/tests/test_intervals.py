@@ -0,0 +1,68 @@
+"""
+Tests for the per-day interval index and the utilisation report.
+"""
+
+from datetime import datetime
+
+import pytest
+from day_logger.cli import main
+from day_logger.intervals import DayIntervals, parse_window, utilisation
+from day_logger.journal_data_manager import JournalDataManager
+from day_logger.models.timeblock import TimeBlock
+
+def _blocks(*spans):
+    return [TimeBlock(name, start, end, "x").to_json() for name, start, end in spans]
+
+def test_overlaps_gaps_and_coverage():
+    """Overlapping stretches list the blocks running; coverage counts overlaps once."""
+    day = DayIntervals(_blocks(("A", "08:00", "10:00"), ("B", "09:00", "11:00"),
+                               ("C", "09:30", "09:45"), ("D", "13:00", "14:00")))
+
+    assert day.overlaps() == [(540, 570, ["A", "B"]), (570, 585, ["A", "B", "C"]), (585, 600, ["A", "B"])]
+    assert day.covered_minutes == 240
+    assert day.gaps() == [(660, 780)]
+    assert day.gaps(parse_window("07:00-15:00")) == [(420, 480), (660, 780), (840, 900)]
+
+    report = day.report(parse_window("08:00-16:00"))
+    assert (report["overlap_minutes"], report["gap_minutes"], report["utilisation"]) == (60, 240, 0.5)
+    assert report["gaps"][0] == {"start": "11:00", "end": "13:00"}
+
+def test_touching_blocks_and_midnight():
+    """Back-to-back blocks don't overlap, and a block past midnight runs beyond 24:00."""
+    day = DayIntervals(_blocks(("A", "22:00", "23:00"), ("B", "23:00", "00:30"), ("Empty", "12:00", "12:00")))
+    assert day.overlaps() == []
+    assert day.merged == [(1320, 1470)]
+    assert day.report()["gaps"] == []
+
+    night = DayIntervals(_blocks(("A", "23:00", "01:00"), ("B", "23:30", "00:45"))).report()
+    assert night["overlaps"] == [{"start": "23:30", "end": "00:45", "blocks": ["A", "B"]}]
+
+    with pytest.raises(ValueError):
+        parse_window("09:00")
+
+def test_many_overlapping_blocks():
+    """A pile of nested blocks yields one stretch per change in the running set."""
+    spans = [(f"B{n:03d}", f"{8 + n // 60:02d}:{n % 60:02d}", "20:00") for n in range(200)]
+    overlaps = DayIntervals(_blocks(*spans)).overlaps()
+
+    assert len(overlaps) == 199
+    assert overlaps[0] == (481, 482, ["B000", "B001"])
+    assert overlaps[-1][:2] == (679, 1200) and len(overlaps[-1][2]) == 200
+    # A block replaced by one of the same name at the same minute doesn't split the stretch
+    same = DayIntervals(_blocks(("A", "08:00", "09:00"), ("A", "09:00", "10:00"), ("B", "08:00", "10:00")))
+    assert same.overlaps() == [(480, 600, ["A", "B"])]
+
+def test_utilisation_over_range_and_cli(tmp_path, monkeypatch, capsys):
+    """The bulk report covers every day with blocks in the range."""
+    monkeypatch.chdir(tmp_path)
+    manager = JournalDataManager("journal", daily_root="logs")
+    manager.save_daily_timeblocks([TimeBlock("A", "09:00", "11:00", "a", datetime(2025, 3, 3)),
+                                   TimeBlock("B", "10:00", "12:00", "b", datetime(2025, 3, 3))])
+    manager.save_daily_timeblocks([TimeBlock("A", "09:00", "10:00", "c", datetime(2025, 3, 4))])
+
+    report = utilisation(manager, datetime(2025, 3, 1), datetime(2025, 3, 31), parse_window("09:00-13:00"))
+    assert (report["days_with_entries"], report["days_with_overlaps"]) == (2, 1)
+    assert (report["covered_minutes"], report["overlap_minutes"], report["gap_minutes"]) == (240, 60, 240)
+
+    assert main(["--work-logs", "logs", "utilisation", "--from", "2025-03-03", "--to", "2025-03-03"]) == 0
+    assert "10:00-11:00 (A + B)" in capsys.readouterr().out
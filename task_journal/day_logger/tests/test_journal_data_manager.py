@@ -5,8 +5,8 @@ Covers JournalDataManager's functionality with temporary directories for clean t
 
 import pytest
 import os
+import json
 from datetime import datetime
-from day_logger.journal_data_manager import JournalDataManager
 
 @pytest.fixture
 def mock_journal_instance():
@@ -41,22 +41,15 @@ def mock_journal_instance():
             }
     return MockTaskJournalInstance()
 
-@pytest.fixture
-def data_manager(tmp_path):
-    """
-    Pytest fixture to create a JournalDataManager with a temporary directory as base_path.
-    """
-    return JournalDataManager(base_path=str(tmp_path))
-
-def test_save_entry(data_manager, mock_journal_instance):
+def test_save_entry(manager, mock_journal_instance):
     """Test save_entry method to ensure it writes a JSON file with the correct structure."""
-    success, message = data_manager.save_entry(mock_journal_instance)
+    success, message = manager.save_entry(mock_journal_instance)
     assert success
     assert "Entry saved successfully" in message
 
     # Verify the file was created and contains proper JSON
     file_found = False
-    for root, _, files in os.walk(data_manager.base_path):
+    for root, _, files in os.walk(manager.base_path):
         for file in files:
             if file.endswith(".json"):
                 file_found = True
@@ -73,7 +66,7 @@ def test_save_entry(data_manager, mock_journal_instance):
                     assert morning["content"] == "Morning tasks text"
     assert file_found, "No .json file was found in the directory structure."
 
-def test_save_daily_timeblocks_new_file(data_manager, tmp_path):
+def test_save_daily_timeblocks_new_file(manager, tmp_path):
     """Test saving timeblocks to a new JSON file."""
     from day_logger.models.timeblock import TimeBlock
     
@@ -83,7 +76,7 @@ def test_save_daily_timeblocks_new_file(data_manager, tmp_path):
         TimeBlock("Afternoon", "13:00", "17:00", "More tasks", test_date)
     ]
     
-    success, message = data_manager.save_daily_timeblocks(blocks)
+    success, message = manager.save_daily_timeblocks(blocks)
     assert success
     assert "Time blocks saved successfully" in message
     
@@ -102,7 +95,7 @@ def test_save_daily_timeblocks_new_file(data_manager, tmp_path):
         assert block["start_time"] == "08:00"
         assert block["content"] == "Test tasks"
 
-def test_save_daily_timeblocks_merge_existing(data_manager, tmp_path):
+def test_save_daily_timeblocks_merge_existing(manager, tmp_path):
     """Test that saving timeblocks preserves existing blocks for the same day."""
     from day_logger.models.timeblock import TimeBlock
     
@@ -131,7 +124,7 @@ def test_save_daily_timeblocks_merge_existing(data_manager, tmp_path):
         TimeBlock("Afternoon", "13:00", "17:00", "New task", test_date)
     ]
     
-    success, _ = data_manager.save_daily_timeblocks(new_blocks)
+    success, _ = manager.save_daily_timeblocks(new_blocks)
     assert success
     
     # Verify both blocks exist
@@ -141,23 +134,23 @@ def test_save_daily_timeblocks_merge_existing(data_manager, tmp_path):
         block_names = {b["block_name"] for b in content["blocks"]}
         assert block_names == {"Morning", "Afternoon"}
 
-def test_load_latest_entry_no_file(data_manager):
+def test_load_latest_entry_no_file(manager):
     """Test load_latest_entry when no .json files exist (should return empty dict)."""
-    data = data_manager.load_latest_entry()
+    data = manager.load_latest_entry()
     assert data == {}
 
-def test_get_entries_by_date_empty(data_manager):
+def test_get_entries_by_date_empty(manager):
     """Test get_entries_by_date returns empty list when no JSON files exist."""
-    result = data_manager.get_entries_by_date(datetime.now())
+    result = manager.get_entries_by_date(datetime.now())
     assert isinstance(result, list)
     assert len(result) == 0
 
-def test_load_latest_entry_with_file(data_manager, tmp_path):
+def test_load_latest_entry_with_file(manager, tmp_path):
     """Test load_latest_entry returns the most recent JSON entry."""
     import time
     
     # Create two entries with different timestamps
-    entries_path = data_manager.base_path / "entries"
+    entries_path = manager.base_path / "entries"
     entries_path.mkdir(parents=True)
     
     older_entry = {
@@ -175,5 +168,93 @@ def test_load_latest_entry_with_file(data_manager, tmp_path):
     with open(entries_path / "new.json", 'w', encoding='utf-8') as f:
         json.dump(newer_entry, f)
     
-    latest = data_manager.load_latest_entry()
+    latest = manager.load_latest_entry()
     assert latest["time_blocks"]["morning"]["content"] == "New entry"
+
+def test_save_and_load_drafts(manager):
+    """Drafts are stored per block and read back keyed by block."""
+    day = datetime(2025, 2, 15)
+    ok, _ = manager.save_draft("morning", {"start_time": "08:00", "end_time": "09:00", "content": "draft"}, day)
+    assert ok
+    manager.save_draft("evening", {"start_time": "18:00", "end_time": "19:00", "content": "later"}, day)
+    manager.save_draft("morning", {"start_time": "08:00", "end_time": "10:00", "content": "draft v2"}, day)
+
+    drafts = manager.load_drafts(day)
+    assert set(drafts) == {"morning", "evening"}
+    assert drafts["morning"]["content"] == "draft v2"
+    assert drafts["morning"]["end_time"] == "10:00"
+    assert manager.load_drafts(datetime(2025, 2, 16)) == {}
+
+def test_clear_drafts(manager):
+    """clear_drafts removes the day's drafts folder."""
+    day = datetime(2025, 2, 15)
+    manager.save_draft("morning", {"start_time": "08:00", "end_time": "09:00", "content": "x"}, day)
+    manager.clear_drafts(day)
+    assert manager.load_drafts(day) == {}
+    manager.clear_drafts(day)  # No-op when nothing is left
+
+def test_load_latest_entry_ignores_drafts(manager, mock_journal_instance):
+    """Autosave drafts are never returned as the latest journal entry."""
+    manager.save_entry(mock_journal_instance)
+    manager.save_draft("morning", {"start_time": "08:00", "end_time": "09:00", "content": "draft"})
+    latest = manager.load_latest_entry()
+    assert "time_blocks" in latest
+
+def test_load_latest_entry_skips_month_summaries(tmp_path):
+    """With daily files inside base_path (JournalProcessor's layout) the month summary is never returned."""
+    from journal_processor import JournalProcessor
+
+    processor = JournalProcessor(str(tmp_path / "work-logs"))
+    raw_entry = {"timestamp": "2025-02-15T09:00:00",
+                 "time_blocks": {"morning": {"start_time": "08:00", "end_time": "12:00", "content": "Tasks"}}}
+    assert processor.process_and_save_entry(raw_entry)[0]
+    assert (tmp_path / "work-logs/2025/summary/2025-02.json").exists()
+
+    latest = processor.data_manager.load_latest_entry()
+    assert latest["date"] == "2025-02-15"
+    assert latest["blocks"][0]["content"] == "Tasks"
+
+def test_save_daily_timeblocks_is_idempotent(manager, tmp_path, monkeypatch):
+    """Saving the same blocks twice stores them once and keeps the hash index in sync."""
+    from day_logger.models.timeblock import TimeBlock
+
+    monkeypatch.chdir(tmp_path)
+    blocks = [
+        TimeBlock("Morning", "08:00", "12:00", "Test tasks", datetime(2025, 2, 15, 10, 30)),
+        TimeBlock("Afternoon", "13:00", "17:00", "More tasks", datetime(2025, 2, 15, 10, 30))
+    ]
+    assert manager.save_daily_timeblocks(blocks)[0]
+    file_path = manager.get_daily_file_path(blocks[0].date)
+    first_write = file_path.read_text(encoding='utf-8')
+
+    # Same content saved later: only the block dates differ
+    again = [TimeBlock(b.block_name, b.start_time, b.end_time, b.content + "  ", datetime(2025, 2, 15, 11))
+             for b in blocks]
+    success, message = manager.save_daily_timeblocks(again)
+    assert success
+    assert "already saved" in message
+    assert file_path.read_text(encoding='utf-8') == first_write
+
+    manager.save_daily_timeblocks([TimeBlock("Evening", "18:00", "20:00", "New", datetime(2025, 2, 15))])
+    content = json.loads(file_path.read_text(encoding='utf-8'))
+    assert [b["block_name"] for b in content["blocks"]] == ["Evening", "Morning", "Afternoon"]
+    assert len(content["block_hashes"]) == 3
+    assert content["block_hashes"][0] == TimeBlock("Evening", "18:00", "20:00", "New").content_hash()
+
+def test_save_daily_timeblocks_compacts_legacy_duplicates(manager, tmp_path, monkeypatch):
+    """Files written before the hash index get their duplicate blocks removed on the next save."""
+    from day_logger.models.timeblock import TimeBlock
+
+    monkeypatch.chdir(tmp_path)
+    day = datetime(2025, 2, 15)
+    file_path = manager.get_daily_file_path(day)
+    file_path.parent.mkdir(parents=True)
+    legacy_block = {"block_name": "Morning", "start_time": "08:00", "end_time": "12:00",
+                    "content": "Initial task", "date": "2025-02-15T08:00:00"}
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({"date": "2025-02-15", "blocks": [legacy_block, dict(legacy_block)]}, f)
+
+    assert manager.save_daily_timeblocks([TimeBlock("Morning", "08:00", "12:00", "Initial task", day)])[0]
+    content = json.loads(file_path.read_text(encoding='utf-8'))
+    assert len(content["blocks"]) == 1
+    assert len(content["block_hashes"]) == 1
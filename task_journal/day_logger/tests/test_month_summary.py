@@ -0,0 +1,52 @@
+"""
+Tests for the per-month summary of days, blocks and hours kept on save.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from day_logger import month_summary
+from day_logger.cli import main
+from day_logger.journal_data_manager import JournalDataManager
+from day_logger.models.timeblock import TimeBlock
+
+def test_save_keeps_the_month_summary_current(manager):
+    """Each save updates its day; totals are precomputed for the whole month."""
+    day = datetime(2025, 2, 14)
+    manager.save_daily_timeblocks([
+        TimeBlock("Morning", "08:00", "10:30", "a", day),
+        TimeBlock("Night", "23:00", "01:00", "b", day),
+    ])
+    manager.save_daily_timeblocks([TimeBlock("Morning", "09:00", "10:00", "c", datetime(2025, 2, 15))])
+    manager.save_daily_timeblocks([TimeBlock("Evening", "18:00", "18:30", "d", day)])
+
+    summary = manager.get_month_summary(2025, 2)
+    assert summary["days"] == {"2025-02-14": {"blocks": 3, "hours": 5.0},
+                               "2025-02-15": {"blocks": 1, "hours": 1.0}}
+    assert (summary["days_with_entries"], summary["blocks"], summary["hours"]) == (2, 4, 6.0)
+    assert month_summary.summary_path(manager, 2025, 2).exists()
+    assert manager.get_month_summary(2025, 3)["days"] == {}
+
+def test_missing_summary_is_built_from_daily_files(manager):
+    """Months saved before the summary existed are scanned once on first lookup."""
+    manager.save_daily_timeblocks([TimeBlock("Morning", "08:00", "09:00", "a", datetime(2024, 11, 3))])
+    path = month_summary.summary_path(manager, 2024, 11)
+    path.unlink()
+
+    assert manager.get_month_summary(2024, 11)["hours"] == 1.0
+    assert path.exists()
+
+    # A daily file copied in by hand is picked up by a rebuild
+    manual = manager.get_daily_file_path(datetime(2024, 11, 4))
+    manual.write_text(json.dumps({"blocks": [{"start_time": "10:00", "end_time": "12:00"}]}), encoding="utf-8")
+    assert month_summary.rebuild_month(manager, 2024, 11)["days_with_entries"] == 2
+
+def test_cli_summary(tmp_path, monkeypatch, capsys):
+    """The summary subcommand prints the month's totals."""
+    monkeypatch.chdir(tmp_path)
+    logs = JournalDataManager("journal", daily_root="logs")
+    logs.save_daily_timeblocks([TimeBlock("Morning", "08:00", "10:00", "a", datetime(2025, 3, 1))])
+
+    assert main(["--work-logs", "logs", "summary", "2025-03", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out)["hours"] == 2.0
@@ -0,0 +1,127 @@
+"""
+Tests for the background save worker used by the TaskJournal GUI.
+"""
+
+import threading
+import pytest
+from day_logger.save_worker import BackgroundSaveWorker
+
+def test_submit_saves_and_reports_on_caller_thread():
+    """Snapshots are saved off-thread and callbacks run in process_completed."""
+    saved = []
+    save_threads = []
+
+    def save_func(snapshot):
+        saved.append(snapshot)
+        save_threads.append(threading.current_thread())
+        return True, "saved"
+
+    worker = BackgroundSaveWorker(save_func)
+    results = []
+    worker.submit({"n": 1}, lambda ok, msg: results.append((ok, msg, threading.current_thread())))
+    worker.stop()
+
+    assert saved == [{"n": 1}]
+    assert save_threads[0] is not threading.current_thread()
+    assert results == []  # Nothing delivered until the UI polls
+    assert worker.process_completed() == 1
+    assert results[0][:2] == (True, "saved")
+    assert results[0][2] is threading.current_thread()
+
+def test_repeated_keyed_saves_are_coalesced():
+    """Keyed snapshots queued while a save is running collapse into the newest one."""
+    started = threading.Event()
+    release = threading.Event()
+    saved = []
+
+    def save_func(snapshot):
+        saved.append(snapshot)
+        started.set()
+        release.wait(5)
+        return True, "saved"
+
+    worker = BackgroundSaveWorker(save_func)
+    worker.submit({"n": 1}, key="morning")
+    started.wait(5)
+    for n in range(2, 6):
+        worker.submit({"n": n}, key="morning")
+    release.set()
+    worker.stop()
+
+    assert saved == [{"n": 1}, {"n": 5}]
+    assert worker.saved_count == 2
+    assert worker.coalesced_count == 3
+
+def test_unkeyed_saves_are_never_dropped():
+    """Entry saves are additive: every snapshot queued behind a running save is written."""
+    started = threading.Event()
+    release = threading.Event()
+    saved = []
+
+    def save_func(snapshot):
+        saved.append(snapshot)
+        started.set()
+        release.wait(5)
+        return True, "saved"
+
+    worker = BackgroundSaveWorker(save_func)
+    worker.submit({"n": 1})
+    started.wait(5)
+    worker.submit({"n": 2})
+    worker.submit({"n": 3})
+    release.set()
+
+    assert worker.stop(5)
+    assert saved == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert worker.coalesced_count == 0
+    assert not worker.is_running()
+
+def test_discard_pending_drops_queued_snapshots():
+    """Queued snapshots can be dropped; the save in progress and later submissions still run."""
+    started = threading.Event()
+    release = threading.Event()
+    saved = []
+
+    def save_func(snapshot):
+        saved.append(snapshot)
+        started.set()
+        release.wait(5)
+        return True, "saved"
+
+    worker = BackgroundSaveWorker(save_func)
+    worker.submit({"n": 1}, key="morning")
+    started.wait(5)
+    worker.submit({"n": 2}, key="morning")
+    worker.submit({"n": 3}, key="evening")
+    assert worker.discard_pending() == 2
+    worker.submit({"clear": True})
+    release.set()
+    worker.stop(5)
+
+    assert saved == [{"n": 1}, {"clear": True}]
+
+def test_save_errors_are_reported():
+    """Exceptions from the save function become a failed result instead of killing the thread."""
+    def save_func(snapshot):
+        raise IOError("disk full")
+
+    worker = BackgroundSaveWorker(save_func)
+    results = []
+    worker.submit({}, lambda ok, msg: results.append((ok, msg)))
+    worker.stop()
+    worker.process_completed()
+
+    assert results == [(False, "Error saving entry: disk full")]
+
+def test_submit_after_close_raises():
+    """A closed worker refuses new snapshots instead of silently never saving them."""
+    saved = []
+    worker = BackgroundSaveWorker(lambda snapshot: (saved.append(snapshot), (True, "saved"))[1])
+    worker.submit({"n": 1})
+    worker.close()
+    worker.close()
+    with pytest.raises(RuntimeError):
+        worker.submit({"n": 2})
+
+    assert worker.stop(5)
+    assert saved == [{"n": 1}]
@@ -1,9 +1,11 @@
 """
 Test suite for the TimeBlock dataclass, refactored to use Pytest.
 """
+import json
+
 import pytest
 from datetime import datetime
-from day_logger.models.timeblock import TimeBlock
+from day_logger.models.timeblock import TimeBlock, block_duration_minutes
 
 def test_timeblock_creation_defaults():
     """Test creation with default date."""
@@ -74,3 +76,80 @@ def test_to_json_date_serialization():
     )
     json_data = tb.to_json()
     assert json_data["date"] == "2025-02-15T14:30:45"
+
+def test_content_hash_ignores_date_and_whitespace():
+    """Blocks with the same name, times and content hash equally."""
+    a = TimeBlock("Morning", "08:00", "09:00", "Write report", datetime(2025, 2, 15, 8))
+    b = TimeBlock("Morning", "08:00", "09:00", " Write report\n", datetime(2025, 2, 15, 9))
+    c = TimeBlock("Morning", "08:00", "10:00", "Write report", datetime(2025, 2, 15, 8))
+    assert a.content_hash() == b.content_hash()
+    assert a.content_hash() != c.content_hash()
+
+def test_times_are_parsed_once_into_minutes():
+    """Times become minutes of the day, normalized to HH:MM, with a cached duration."""
+    tb = TimeBlock("Morning", "8:05", "12:00", "x")
+    assert (tb.start_time, tb.start_minute, tb.end_minute) == ("08:05", 485, 720)
+    assert tb.duration_minutes == 235
+    assert not tb.crosses_midnight
+
+def test_block_past_midnight():
+    """An end before the start falls on the next day."""
+    tb = TimeBlock("Night", "23:30", "01:00", "x")
+    assert tb.crosses_midnight
+    assert tb.duration_minutes == 90
+
+@pytest.mark.parametrize("value", ["", "24:00", "12:60", "12", "ab:cd", "7:5"])
+def test_invalid_times_are_rejected(value):
+    """Invalid spinbox values raise instead of silently counting as zero."""
+    with pytest.raises(ValueError):
+        TimeBlock("Morning", value, "12:00", "x")
+
+def test_to_json_carries_minutes_and_old_blocks_still_count():
+    """Saved blocks carry both forms; blocks saved without minutes are parsed on read."""
+    json_data = TimeBlock("Night", "22:00", "00:30", "x").to_json()
+    assert (json_data["start_minute"], json_data["end_minute"], json_data["duration_minutes"]) == (1320, 30, 150)
+    assert block_duration_minutes(json_data) == 150
+    assert block_duration_minutes({"start_time": "08:00", "end_time": "09:15"}) == 75
+    assert block_duration_minutes({"start_time": "", "end_time": "09:15"}) == 0
+
+def test_from_json_round_trips():
+    """from_json is the inverse of to_json; a given date skips parsing the stored one."""
+    tb = TimeBlock("Night", "22:00", "00:30", "  x  ", datetime(2025, 2, 14, 9, 30))
+    restored = TimeBlock.from_json(tb.to_json())
+    assert restored == TimeBlock("Night", "22:00", "00:30", "x", tb.date)
+    assert restored.content == "x"
+    assert TimeBlock.from_json({"block_name": "A", "start_time": "08:00", "end_time": "09:00"},
+                               datetime(2025, 1, 1)).content == ""
+    with pytest.raises(KeyError):
+        TimeBlock.from_json({"block_name": "A", "start_time": "08:00", "end_time": "09:00"})
+
+def test_from_json_interns_block_names():
+    """Blocks read from different documents share one copy of a repeated name."""
+    blocks = [TimeBlock.from_json(json.loads(json.dumps(TimeBlock("Morning Tasks", "08:00", "09:00", "x",
+                                                                    datetime(2025, 2, day)).to_json())))
+              for day in (14, 15)]
+    assert blocks[0].block_name is blocks[1].block_name
+
+def test_equality_compares_content():
+    """Blocks differing only in their text are not equal; TimeBlocks are unhashable like before."""
+    day = datetime(2025, 2, 14, 9, 30)
+    assert TimeBlock("A", "08:00", "09:00", "foo", day) == TimeBlock("A", "08:00", "09:00", "foo", day)
+    assert TimeBlock("A", "08:00", "09:00", "foo", day) != TimeBlock("A", "08:00", "09:00", "bar", day)
+    assert TimeBlock("A", "08:00", "09:00", "foo", day) != TimeBlock("A", "08:00", "10:00", "foo", day)
+    with pytest.raises(TypeError):
+        hash(TimeBlock("A", "08:00", "09:00", "foo", day))
+
+def test_assigning_times_keeps_minutes_and_duration_in_step():
+    """Changing a time re-parses it, so to_json never mixes old minutes with new strings."""
+    tb = TimeBlock("A", "08:00", "09:00", "x", datetime(2025, 2, 14))
+    assert tb.duration_minutes == 60
+    tb.start_time = "7:30"
+    assert (tb.start_time, tb.start_minute, tb.duration_minutes) == ("07:30", 450, 90)
+    tb.end_time = "01:00"
+    data = tb.to_json()
+    assert (data["end_minute"], data["duration_minutes"]) == (60, 1050)
+    with pytest.raises(ValueError):
+        tb.end_time = "25:00"
+    with pytest.raises(AttributeError):
+        tb.start_minute = 0
+    assert tb.end_time == "01:00"
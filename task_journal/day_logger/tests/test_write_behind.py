@@ -0,0 +1,74 @@
+"""
+Tests for the write-behind batching writer.
+"""
+
+import json
+import threading
+from datetime import datetime
+
+import pytest
+from day_logger.models.timeblock import TimeBlock
+from day_logger.write_behind import WriteBehindWriter
+
+def _entry(day, second):
+    return {"timestamp": datetime(2025, 2, day, 9, 0, second).isoformat(), "time_blocks": {}}
+
+def test_entries_are_filed_by_their_timestamp(manager):
+    """Batched entries land in their own day folder; same-second entries are kept apart."""
+    with WriteBehindWriter(manager, batch_size=100, flush_interval=60) as writer:
+        for entry in [_entry(14, 0), _entry(15, 0), _entry(15, 0), _entry(15, 1)]:
+            writer.save_entry_data(entry)
+        assert writer.pending == 4  # Nothing written before a threshold is reached
+
+    assert writer.written_count == 4
+    assert writer.batch_count == 1
+    assert writer.errors == []
+    assert len(manager.get_entries_by_date(datetime(2025, 2, 14))) == 1
+    names = sorted(p.name for p in manager.get_entry_folder(datetime(2025, 2, 15)).iterdir())
+    assert names == ["journal_entry_09-00-00.json", "journal_entry_09-00-00_2.json",
+                     "journal_entry_09-00-01.json"]
+
+def test_blocks_of_a_day_are_merged_into_one_save(manager, monkeypatch):
+    """Queued blocks of the same day are written with a single save per batch."""
+    calls = []
+    original = manager.save_daily_timeblocks
+    monkeypatch.setattr(manager, "save_daily_timeblocks", lambda blocks: calls.append(len(blocks)) or original(blocks))
+    day = datetime(2025, 2, 15)
+
+    writer = WriteBehindWriter(manager, batch_size=1000, flush_interval=60)
+    for n in range(5):
+        writer.save_daily_timeblocks([TimeBlock(f"block-{n}", "08:00", "09:00", "x", day)])
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    assert calls == [5]
+    data = json.loads(manager.get_daily_file_path(day).read_text(encoding='utf-8'))
+    assert len(data["blocks"]) == 5
+
+def test_batch_size_triggers_flush_and_back_pressure_blocks(manager, monkeypatch):
+    """A full queue blocks producers until the writer takes the batch."""
+    release = threading.Event()
+    original = manager.save_entries
+
+    def slow_save(entries):
+        release.wait(5)
+        return original(entries)
+
+    monkeypatch.setattr(manager, "save_entries", slow_save)
+    writer = WriteBehindWriter(manager, batch_size=2, flush_interval=60, max_pending=2)
+    writer.save_entry_data(_entry(15, 0))
+    writer.save_entry_data(_entry(15, 1))  # Batch size reached: the writer takes both
+
+    producer = threading.Thread(target=lambda: [writer.save_entry_data(_entry(15, s)) for s in range(2, 6)])
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()  # Blocked: two in flight, two more queued
+    release.set()
+    producer.join(5)
+    writer.close()
+
+    assert not producer.is_alive()
+    assert writer.blocked_count >= 1
+    assert writer.written_count == 6
+    with pytest.raises(RuntimeError):
+        writer.save_entry_data(_entry(15, 9))
@@ -0,0 +1,82 @@
+"""
+Caching utilities module.
+Contains an in-memory LRU cache for parsed JSON documents.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Union
+
+
+class DocumentCache:
+    """
+    Bounded LRU cache of parsed JSON files keyed by absolute path.
+
+    Every lookup stats the file and compares mtime and size with the values
+    recorded when it was parsed, so edits made outside this process are
+    picked up. Cached documents are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple[int, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Union[str, os.PathLike]) -> Any:
+        """
+        Return the parsed contents of ``path``, reading the file only when needed.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file is invalid JSON
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[2]
+            self.misses += 1
+
+        with open(key, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+
+        self._remember(key, stat, document)
+        return document
+
+    def store(self, path: Union[str, os.PathLike], document: Any) -> None:
+        """Cache ``document`` as the contents of ``path`` right after writing it there."""
+        key = os.path.abspath(path)
+        self._remember(key, os.stat(key), document)
+
+    def _remember(self, key: str, stat: os.stat_result, document: Any) -> None:
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = (stat.st_mtime_ns, stat.st_size, document)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, path: Union[str, os.PathLike]) -> None:
+        """Drop ``path`` from the cache, e.g. right after writing it."""
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def clear(self) -> None:
+        """Drop every cached document and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of cached documents."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,106 @@
+"""
+File lock module.
+Serializes writers of the same file across threads and processes.
+
+Each path has an in-process lock (threads of the GUI, the save workers, the
+API server) and an advisory lock on a ``<name>.lock`` sidecar file (other
+processes such as a CLI ingest). Writers of different files never wait on
+each other. An in-process lock only exists while a thread holds or waits for
+it, so long-running processes don't keep one per file ever written.
+
+Usage:
+    from day_logger.utils.file_lock import locked
+
+    with locked(daily_file):
+        data = read(daily_file)
+        write(daily_file, merge(data, new_blocks))
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_table_lock = threading.Lock()
+# Per absolute path: the in-process lock and the number of threads holding or awaiting it
+_path_locks: Dict[str, tuple[threading.Lock, int]] = {}
+
+
+@contextmanager
+def path_lock(path: Union[str, os.PathLike]) -> Iterator[None]:
+    """
+    Hold the in-process lock of ``path`` (one per absolute path).
+
+    The lock is dropped from the table once nobody holds or awaits it.
+    """
+    key = os.path.abspath(path)
+    with _table_lock:
+        lock, users = _path_locks.get(key) or (threading.Lock(), 0)
+        _path_locks[key] = (lock, users + 1)
+    try:
+        with lock:
+            yield
+    finally:
+        with _table_lock:
+            lock, users = _path_locks[key]
+            if users == 1:
+                del _path_locks[key]
+            else:
+                _path_locks[key] = (lock, users - 1)
+
+
+def lock_file_path(path: Union[str, os.PathLike]) -> Path:
+    """Return the sidecar file used for the inter-process lock of ``path``."""
+    path = Path(path)
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def locked(path: Union[str, os.PathLike]) -> Iterator[None]:
+    """
+    Hold the exclusive lock of ``path`` for the duration of the block.
+
+    The in-process lock is taken first so threads queue up without touching
+    the file system; the advisory lock then keeps other processes out. The
+    lock is advisory: only writers that use it are serialized.
+    """
+    with path_lock(path):
+        lock_path = lock_file_path(path)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _acquire(fd)
+            try:
+                yield
+            finally:
+                _release(fd)
+        finally:
+            os.close(fd)
+
+
+def _acquire(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        # LK_LOCK retries for ~10 seconds before raising; keep waiting
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _release(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,201 @@
+"""
+Instrumentation module.
+Contains lightweight timers and counters for the journal save path, and
+exporters to a log line, a JSON stats file and Prometheus text format.
+
+Instrumentation is off by default; ``timer`` then hands back a shared no-op
+context manager and ``count`` returns immediately. Enable it with
+``instrumentation.enable()`` or by setting DAY_LOGGER_INSTRUMENTATION=1.
+
+Usage:
+    from day_logger.utils import instrumentation
+
+    with instrumentation.timer("build_timeblocks"):
+        ...
+    instrumentation.count("bytes_written", len(payload))
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# logging and json are only imported by the exporters that need them
+
+_enabled = os.environ.get("DAY_LOGGER_INSTRUMENTATION") == "1"
+_lock = threading.Lock()
+_timers: Dict[str, list] = {}
+_counters: Dict[str, float] = {}
+
+
+class _NullTimer:
+    """Context manager used while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Records the wall time of a ``with`` block under a name."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            stats = _timers.get(self.name)
+            if stats is None:
+                _timers[self.name] = [1, elapsed, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed < stats[2]:
+                    stats[2] = elapsed
+                if elapsed > stats[3]:
+                    stats[3] = elapsed
+
+
+def enable() -> None:
+    """Start recording timers and counters."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording; already collected stats are kept until reset()."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True when timers and counters are being recorded."""
+    return _enabled
+
+
+def reset() -> None:
+    """Forget every recorded timer and counter."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def timer(name: str):
+    """Return a context manager that times its block under ``name``."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add ``value`` to the counter ``name``."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Return a copy of the recorded stats.
+
+    Returns:
+        Dict[str, Any]: {"timers": {name: {count, total_seconds, min_seconds,
+        max_seconds, avg_seconds}}, "counters": {name: value}}
+    """
+    with _lock:
+        timers = {
+            name: {
+                "count": calls,
+                "total_seconds": total,
+                "min_seconds": low,
+                "max_seconds": high,
+                "avg_seconds": total / calls
+            }
+            for name, (calls, total, low, high) in sorted(_timers.items())
+        }
+        counters = dict(sorted(_counters.items()))
+    return {"timers": timers, "counters": counters}
+
+
+def format_log_line(stats: Optional[Dict[str, Any]] = None) -> str:
+    """Render the stats as a single human readable line."""
+    stats = stats or snapshot()
+    parts = [
+        f"{name}={timer_stats['count']}x/{timer_stats['total_seconds'] * 1000:.2f}ms"
+        for name, timer_stats in stats["timers"].items()
+    ]
+    parts += [f"{name}={value:g}" for name, value in stats["counters"].items()]
+    return "instrumentation: " + (" ".join(parts) if parts else "no data")
+
+
+def log_stats(level: Optional[int] = None) -> None:
+    """Write the current stats to the module logger as one line (INFO by default)."""
+    import logging
+
+    logging.getLogger(__name__).log(logging.INFO if level is None else level, format_log_line())
+
+
+def write_json(path: str) -> None:
+    """Dump the current stats to a JSON file."""
+    import json
+
+    stats = snapshot()
+    stats["exported_at"] = time.time()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2)
+
+
+def to_prometheus(prefix: str = "day_logger") -> str:
+    """
+    Render the current stats in the Prometheus text exposition format.
+
+    Timers become ``<prefix>_duration_seconds`` summaries (count/sum plus
+    min/max gauges) labelled by operation; counters become
+    ``<prefix>_<name>_total`` counters.
+    """
+    stats = snapshot()
+    lines = []
+    if stats["timers"]:
+        metric = f"{prefix}_duration_seconds"
+        lines.append(f"# HELP {metric} Time spent in instrumented operations.")
+        lines.append(f"# TYPE {metric} summary")
+        for name, timer_stats in stats["timers"].items():
+            label = f'{{operation="{name}"}}'
+            lines.append(f"{metric}_count{label} {timer_stats['count']}")
+            lines.append(f"{metric}_sum{label} {timer_stats['total_seconds']:.9f}")
+        for field in ("min", "max"):
+            gauge = f"{prefix}_duration_{field}_seconds"
+            lines.append(f"# TYPE {gauge} gauge")
+            for name, timer_stats in stats["timers"].items():
+                lines.append(f'{gauge}{{operation="{name}"}} {timer_stats[field + "_seconds"]:.9f}')
+    for name, value in stats["counters"].items():
+        metric = f"{prefix}_{_metric_name(name)}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value:g}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def write_prometheus(path: str, prefix: str = "day_logger") -> None:
+    """Write the Prometheus text dump to a file (e.g. for node_exporter's textfile collector)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(to_prometheus(prefix))
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
@@ -0,0 +1,169 @@
+"""
+Write-behind module.
+Queues journal saves and writes them in batches on a background thread, for
+bulk ingest where a synchronous write per entry dominates the run time.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from day_logger.journal_data_manager import JournalDataManager
+
+if TYPE_CHECKING:
+    from day_logger.models.timeblock import TimeBlock
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindWriter:
+    """
+    Batching front end for JournalDataManager writes.
+
+    Saves return as soon as they are queued. A writer thread flushes the queue
+    when ``batch_size`` items are pending, when ``flush_interval`` seconds have
+    passed, or on ``flush()``. Entries are grouped by day folder and time
+    blocks by daily file, so a batch creates each folder once and rewrites
+    each daily file once. When ``max_pending`` items are waiting, saves block
+    until the writer catches up.
+
+    Usage:
+        with WriteBehindWriter(manager) as writer:
+            for entry in entries:
+                writer.save_entry_data(entry)
+        # everything is on disk here; failures are listed in writer.errors
+    """
+
+    def __init__(self, manager: JournalDataManager, batch_size: int = 256,
+                 flush_interval: float = 1.0, max_pending: int = 4096):
+        """
+        Args:
+            manager: Data manager doing the actual writes.
+            batch_size: Pending items that trigger a flush.
+            flush_interval: Longest time (seconds) an item waits in the queue.
+            max_pending: Queue size above which saves block (back-pressure).
+        """
+        self.manager = manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max(max_pending, 1)
+        self.errors: list[str] = []
+        self.written_count = 0
+        self.batch_count = 0
+        self.blocked_count = 0
+        self._entries: list[Dict[str, Any]] = []
+        self._blocks: Dict[Path, list["TimeBlock"]] = {}
+        self._pending = 0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="journal-write-behind", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "WriteBehindWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def save_entry_data(self, entry_data: Dict[str, Any]) -> None:
+        """Queue a collected journal entry (stamped now if it has no timestamp)."""
+        if "timestamp" not in entry_data:
+            entry_data = {"timestamp": datetime.now().isoformat(), **entry_data}
+        with self._cond:
+            self._wait_for_room()
+            self._entries.append(entry_data)
+            self._added(1)
+
+    def save_daily_timeblocks(self, blocks: list["TimeBlock"]) -> None:
+        """Queue time blocks; blocks of the same day are merged into one save."""
+        if not blocks:
+            return
+        with self._cond:
+            self._wait_for_room()
+            for block in blocks:
+                self._blocks.setdefault(self.manager.get_daily_file_path(block.date), []).append(block)
+            self._added(len(blocks))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued and wait until the queue is empty.
+
+        Returns:
+            bool: False if ``timeout`` expired first.
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush the queue and stop the writer thread; later saves raise RuntimeError."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued items not yet handed to the writer."""
+        with self._cond:
+            return self._pending
+
+    def _wait_for_room(self) -> None:
+        if self._pending >= self.max_pending and not self._closed:
+            self.blocked_count += 1
+            self._cond.wait_for(lambda: self._pending < self.max_pending or self._closed)
+        if self._closed:
+            raise RuntimeError("WriteBehindWriter is closed")
+
+    def _added(self, count: int) -> None:
+        self._pending += count
+        if self._pending >= self.batch_size:
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._flush_requested or self._pending >= self.batch_size,
+                    self.flush_interval)
+                if not self._pending:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    continue
+                entries, self._entries = self._entries, []
+                blocks, self._blocks = self._blocks, {}
+                self._in_flight, self._pending = self._pending, 0
+                # Producers held back by max_pending may continue
+                self._cond.notify_all()
+
+            errors = self._write(entries, blocks)
+
+            with self._cond:
+                self.errors.extend(errors)
+                self.written_count += self._in_flight - len(errors)
+                self.batch_count += 1
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _write(self, entries: list[Dict[str, Any]], blocks: Dict[Path, list["TimeBlock"]]) -> list[str]:
+        """Write one batch; returns the error messages of the items that failed."""
+        errors = []
+        try:
+            if entries:
+                errors += [message for success, message in self.manager.save_entries(entries) if not success]
+            for day_blocks in blocks.values():
+                success, message = self.manager.save_daily_timeblocks(day_blocks)
+                if not success:
+                    errors += [message] * len(day_blocks)
+        except Exception as e:
+            errors.append(f"Error writing batch: {str(e)}")
+        for message in errors:
+            logger.error(message)
+        return errors
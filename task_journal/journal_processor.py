@@ -1,15 +1,20 @@
-import json
-import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-from day_logger.journal_data_manager import JournalDataManager
-from day_logger.models.timeblock import TimeBlock
+from typing import TYPE_CHECKING, Dict, Any
+from day_logger.utils import instrumentation
+
+if TYPE_CHECKING:
+    from day_logger.models.timeblock import TimeBlock
+
+# The data manager and the TimeBlock model are imported where they are first
+# used, so scripts that only need the time helpers import this module cheaply.
 class JournalProcessor:
     def __init__(self, base_path: str = "work-logs"):
         """Initialize the processor with paths and data manager."""
+        from day_logger.journal_data_manager import JournalDataManager
+
         self.base_path = Path(base_path)
-        self.data_manager = JournalDataManager(base_path)
+        self.data_manager = JournalDataManager(base_path, daily_root=base_path)
         self.current_year = datetime.now().year
         self._ensure_folder_structure()
 
@@ -22,14 +27,16 @@ class JournalProcessor:
             (year_folder / folder).mkdir(parents=True, exist_ok=True)
 
     def _calculate_duration(self, start_time: str, end_time: str) -> float:
-        """Calculate duration between two time strings in hours."""
-        try:
-            start = datetime.strptime(start_time, "%H:%M")
-            end = datetime.strptime(end_time, "%H:%M")
-            duration = end - start
-            return round(duration.total_seconds() / 3600, 2)  # Convert to hours
-        except ValueError:
-            return 0.0
+        """
+        Calculate duration between two time strings in hours.
+
+        Kept for callers holding raw strings; TimeBlock and saved blocks carry
+        their duration in minutes already (see ``block_duration_minutes``).
+        """
+        from day_logger.models.timeblock import block_duration_minutes
+
+        minutes = block_duration_minutes({"start_time": start_time, "end_time": end_time})
+        return round(minutes / 60, 2)  # Convert to hours
 
     def _extract_keywords(self, content: str) -> list[str]:
         """Extract relevant keywords from content."""
@@ -43,7 +50,7 @@ class JournalProcessor:
         """Count number of tasks in content (assumes tasks are separated by newlines)."""
         return len([line for line in content.split('\n') if line.strip()])
 
-    def _generate_summary(self, time_blocks: Dict[str, TimeBlock]) -> str:
+    def _generate_summary(self, time_blocks: Dict[str, "TimeBlock"]) -> str:
         """Generate a brief summary of the journal entry."""
         total_tasks = sum(block.tasks_count for block in time_blocks.values())
         total_duration = sum(block.duration for block in time_blocks.values())
@@ -52,29 +59,36 @@ class JournalProcessor:
                 f"spanning {total_duration:.1f} hours across "
                 f"{len(time_blocks)} time blocks.")
 
-    def build_timeblocks(self, raw_entry: Dict[str, Any]) -> list[TimeBlock]:
+    def build_timeblocks(self, raw_entry: Dict[str, Any]) -> list["TimeBlock"]:
         """
         Convert raw journal entry data into a list of TimeBlock objects,
         using start/end times from spinboxes and content from text areas.
         Also applies business rules like extracting keywords or counting tasks if desired.
         """
-        blocks = []
-        for block_name, block_data in raw_entry["time_blocks"].items():
-            # We can parse or convert times if needed (already done by _calculate_duration in older code).
-            start_time = block_data["start_time"]
-            end_time = block_data["end_time"]
-            content = block_data["content"]
+        from day_logger.models.timeblock import TimeBlock
+
+        with instrumentation.timer("build_timeblocks"):
+            # Blocks belong to the day the entry was recorded
+            timestamp = raw_entry.get("timestamp")
+            entry_date = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+            blocks = []
+            for block_name, block_data in raw_entry["time_blocks"].items():
+                # We can parse or convert times if needed (already done by _calculate_duration in older code).
+                start_time = block_data["start_time"]
+                end_time = block_data["end_time"]
+                content = block_data["content"]
             
-            # Construct a TimeBlock. We won't track 'keywords' or 'tasks_count' separately here,
-            # but you can adopt that logic if desired.
-            new_block = TimeBlock(
-                block_name=block_name.title() + " Tasks",
-                start_time=start_time,
-                end_time=end_time,
-                content=content,
-                date=datetime.now()  # or parse from raw_entry if you want a specific date
-            )
-            blocks.append(new_block)
+                # Construct a TimeBlock. We won't track 'keywords' or 'tasks_count' separately here,
+                # but you can adopt that logic if desired.
+                new_block = TimeBlock(
+                    block_name=block_name.title() + " Tasks",
+                    start_time=start_time,
+                    end_time=end_time,
+                    content=content,
+                    date=entry_date
+                )
+                blocks.append(new_block)
+        instrumentation.count("blocks_built", len(blocks))
         return blocks
 
 
@@ -83,15 +97,25 @@ class JournalProcessor:
         Main method to build TimeBlock objects from raw entry data,
         then save them in daily text files via JournalDataManager.
         """
-        try:
-            # 1) Collect raw data from the GUI
-            raw_entry = self.data_manager.collect_entry_data(task_journal_instance)
-            
-            # 2) Build TimeBlock objects
-            time_blocks = self.build_timeblocks(raw_entry)
-            
-            # 3) Use the data manager to save daily time blocks
-            success, message = self.data_manager.save_daily_timeblocks(time_blocks)
-            return success, message
-        except Exception as e:
-            return False, f"Error processing journal: {str(e)}"
+        with instrumentation.timer("process_and_save_journal"):
+            try:
+                # 1) Collect raw data from the GUI
+                raw_entry = self.data_manager.collect_entry_data(task_journal_instance)
+            except Exception as e:
+                return False, f"Error processing journal: {str(e)}"
+
+            # 2) + 3) Build TimeBlock objects and save them
+            return self.process_and_save_entry(raw_entry)
+
+    def process_and_save_entry(self, raw_entry: Dict[str, Any]) -> tuple[bool, str]:
+        """
+        Build TimeBlock objects from an already collected raw entry and save them.
+        Does not touch any widget, so it is safe to call from a worker thread.
+        """
+        with instrumentation.timer("process_and_save_entry"):
+            try:
+                time_blocks = self.build_timeblocks(raw_entry)
+                success, message = self.data_manager.save_daily_timeblocks(time_blocks)
+                return success, message
+            except Exception as e:
+                return False, f"Error processing journal: {str(e)}"
@@ -1,7 +1,12 @@
+import time
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 from journal_processor import JournalProcessor
+from day_logger.save_worker import BackgroundSaveWorker
+
+# Seconds the window waits on close for queued saves before giving up
+CLOSE_TIMEOUT = 30
 
 class TaskJournal:
     def __init__(self, root):
@@ -101,6 +106,14 @@ class TaskJournal:
         # Add empty label for spacing on right
         ttk.Label(btn_frame, text="").grid(row=0, column=3)
 
+        # Autosave toggle - drafts are written per block while typing
+        self.autosave_var = tk.BooleanVar(value=True)
+        self.style.configure('TCheckbutton', background='#1a1a2e', foreground='#e6e6e6')
+        autosave_chk = ttk.Checkbutton(btn_frame, text="Autosave drafts", variable=self.autosave_var)
+        autosave_chk.grid(row=1, column=1, columnspan=2, pady=(5, 0))
+        self.autosave_jobs = {}
+        self.closing = False
+
         # Time blocks - Updated row numbers to start from 2
         self.time_blocks = [
             ("🌅 Morning Tasks", 2, '#16213e'),    # Dark navy blue
@@ -177,6 +190,8 @@ class TaskJournal:
             }
             text_area.bind('<FocusIn>', lambda e, t=text_area, p=placeholder: self.on_focus_in(e, t, p))
             text_area.bind('<FocusOut>', lambda e, t=text_area, p=placeholder: self.on_focus_out(e, t, p))
+            text_area.bind('<<Modified>>', lambda e, k=block.split(" ")[1].lower(): self.on_text_modified(k))
+            text_area.edit_modified(False)
 
         # Status bar - Update row number
         self.status_var = tk.StringVar()
@@ -188,8 +203,25 @@ class TaskJournal:
         status_bar.grid(row=6, column=0, pady=(0, 10))
         self.status_var.set("Ready to record your day! ✨")
 
+        # Month overview, read from the per-month summary kept on save
+        self.month_var = tk.StringVar()
+        ttk.Label(container,
+                  textvariable=self.month_var,
+                  font=('Helvetica', 9),
+                  background='#1a1a2e',
+                  foreground='#b8b8b8').grid(row=7, column=0, pady=(0, 10))
+
         # Initialize the processor
         self.processor = JournalProcessor()
+        self.update_month_summary()
+
+        # Saves run on a background thread; results are picked up via root.after
+        self.save_worker = BackgroundSaveWorker(self.processor.process_and_save_entry)
+        self.draft_worker = BackgroundSaveWorker(self.write_draft)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.poll_save_worker()
+
+        self.recover_drafts()
 
     def on_focus_in(self, event, text_widget, placeholder):
         if text_widget.get('1.0', 'end-1c') == placeholder:
@@ -200,13 +232,119 @@ class TaskJournal:
             text_widget.insert('1.0', placeholder)
 
     def save_journal(self):
-        """Save and process journal entries, then clear inputs if successful."""
-        success, message = self.processor.process_and_save_journal(self)
+        """Snapshot the entries and hand them to the background save worker."""
+        if self.closing:
+            return
+        try:
+            snapshot = self.processor.data_manager.collect_entry_data(self)
+        except Exception as e:
+            self.status_var.set(f"Error processing journal: {str(e)} ❌")
+            return
+        self.save_worker.submit(snapshot, self.on_save_done)
+        self.status_var.set("Saving journal... ⏳")
+
+    def recover_drafts(self):
+        """Restore today's autosave drafts left behind by an unsaved session."""
+        drafts = self.processor.data_manager.load_drafts()
+        for key, draft in drafts.items():
+            widgets = self.entry_widgets.get(key)
+            if widgets is None or not draft.get("content"):
+                continue
+            for field in ("start", "end"):
+                widgets[field].delete(0, tk.END)
+                widgets[field].insert(0, draft.get(f"{field}_time", "00:00"))
+            widgets["text"].delete('1.0', tk.END)
+            widgets["text"].insert('1.0', draft["content"])
+            widgets["text"].edit_modified(False)
+        if drafts:
+            self.status_var.set(f"Recovered {len(drafts)} unsaved draft(s) 📝")
+
+    def on_text_modified(self, key):
+        """Debounce edits of a block; the draft is written once typing pauses."""
+        widgets = self.entry_widgets[key]
+        if not widgets["text"].edit_modified():
+            return
+        # Reset the flag so the next edit fires <<Modified>> again
+        widgets["text"].edit_modified(False)
+        if not self.autosave_var.get() or self.closing:
+            return
+        job = self.autosave_jobs.pop(key, None)
+        if job is not None:
+            self.root.after_cancel(job)
+        self.autosave_jobs[key] = self.root.after(1500, lambda: self.autosave_block(key))
+
+    def autosave_block(self, key):
+        """Queue a draft of a single block for the draft worker."""
+        self.autosave_jobs.pop(key, None)
+        data = self.processor.data_manager.collect_block_data(self, key)
+        self.draft_worker.submit({"block": key, "data": data}, key=key)
+
+    def write_draft(self, draft):
+        """Runs on the draft worker: write a block's draft, or clear them all after a save."""
+        data_manager = self.processor.data_manager
+        if draft.get("clear"):
+            return data_manager.clear_drafts()
+        return data_manager.save_draft(draft["block"], draft["data"])
+
+    def poll_save_worker(self):
+        """Deliver finished saves to the UI thread."""
+        self.save_worker.process_completed()
+        self.draft_worker.process_completed()
+        self.root.after(100, self.poll_save_worker)
+
+    def on_save_done(self, success, message):
+        """Runs on the UI thread once the worker has written the entry."""
         if success:
+            # Drafts of the saved text must not fire later and be "recovered" on the next start
+            for key in list(self.autosave_jobs):
+                self.root.after_cancel(self.autosave_jobs.pop(key))
+            self.draft_worker.discard_pending()
+            # Cleared on the draft worker, after any draft it is writing right now
+            self.draft_worker.submit({"clear": True})
             self.clear_all()
             self.status_var.set(message + " ✅")
+            self.update_month_summary()
         else:
             self.status_var.set(message + " ❌")
+
+    def update_month_summary(self):
+        """Show the days and hours logged so far this month."""
+        today = datetime.now()
+        try:
+            summary = self.processor.data_manager.get_month_summary(today.year, today.month)
+        except Exception:
+            self.month_var.set("")
+            return
+        self.month_var.set(f"{today.strftime('%B')}: {summary['days_with_entries']} days, "
+                           f"{summary['hours']:.1f} h logged 📅")
+
+    def on_close(self):
+        """Let pending saves finish before the window goes away, without freezing it."""
+        for key in list(self.autosave_jobs):
+            self.root.after_cancel(self.autosave_jobs[key])
+            self.autosave_block(key)
+        self.closing = True
+        # The draft worker stays open until the entry saves are done, so a save
+        # finishing now can still queue the draft cleanup (see on_save_done)
+        self.save_worker.close()
+        self.status_var.set("Saving before closing... ⏳")
+        self.root.protocol("WM_DELETE_WINDOW", lambda: None)
+        self.close_when_saved(time.monotonic() + CLOSE_TIMEOUT)
+
+    def close_when_saved(self, deadline):
+        """Poll the workers from the event loop and close once they are done or time is up."""
+        self.save_worker.process_completed()
+        if not self.save_worker.is_running():
+            # Every save has reported by now; deliver the last results, then let
+            # the draft worker finish whatever they queued
+            self.save_worker.process_completed()
+            self.draft_worker.close()
+        self.draft_worker.process_completed()
+        running = self.save_worker.is_running() or self.draft_worker.is_running()
+        if running and time.monotonic() < deadline:
+            self.root.after(100, lambda: self.close_when_saved(deadline))
+            return
+        self.root.destroy()
         
     def clear_all(self):
         for child in self.root.winfo_children():
@@ -215,6 +353,9 @@ class TaskJournal:
         self.status_var.set("All entries cleared! 🗑️")
 
 if __name__ == "__main__":
+    from day_logger.main import configure_logging
+
+    configure_logging()
     root = tk.Tk()
     app = TaskJournal(root)
     root.mainloop()